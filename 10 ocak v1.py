@@ -1,22 +1,18 @@
 # Dosya Adı: test_mobil.py
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import sys
 
+from device_matrix import run_matrix, print_matrix_report
+from driver_factory import create_driver
+from network_idle import wait_for_network_idle
 
-def mobil_test():
-    mobile_emulation = {"deviceName": "iPhone 12 Pro"}
-
-    chrome_options = Options()
-    chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+def mobil_test():
+    # "mobile" ön ayarı iPhone 12 Pro emülasyonu; ekranı görmek için headless kapalı
+    driver = create_driver("mobile", headless=False)
 
     print("📱 iPhone 12 Pro modunda site açılıyor...")
     driver.get("https://www.seyyahlab.com")
-    time.sleep(3)  # Yüklenmeyi gör
+    wait_for_network_idle(driver, replaces=3)  # Yüklenmeyi gör
 
     print(f"Başlık: {driver.title}")
     driver.save_screenshot("iphone_gorunumu.png")
@@ -25,5 +21,16 @@ def mobil_test():
     driver.quit()
 
 
+def mobil_matris():
+    """Aynı testi birden çok cihazda, 2 tarayıcılık havuzla aynı anda koşar"""
+    cihazlar = ["iPhone SE", "iPhone 12 Pro", "Pixel 7", "Galaxy S20 Ultra", "iPad Air", "1366x768"]
+    rapor = run_matrix("https://www.seyyahlab.com", cihazlar, workers=2, expected_title="Seyyah")
+    print_matrix_report(rapor)
+
+
 if __name__ == "__main__":
-    mobil_test()
\ No newline at end of file
+    # python "10 ocak v1.py" --matris  -> cihaz matrisi
+    if "--matris" in sys.argv:
+        mobil_matris()
+    else:
+        mobil_test()
\ No newline at end of file
@@ -1,12 +1,10 @@
 # Dosya Adı: test_hiz.py
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 import time
 
 
 def performans_testi():
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver("visual")
     url = "https://www.seyyahlab.com"
 
     print(f"⏱ Hız testi başlıyor: {url}")
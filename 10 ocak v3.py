@@ -1,23 +1,21 @@
 # Dosya Adı: test_linkler.py
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
+from link_harvest import harvest_links
 
 
 def link_kontrol():
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver("visual")
     driver.get("https://www.seyyahlab.com")
 
-    # Sayfadaki tüm 'a' etiketlerini bul (Linkler)
-    linkler = driver.find_elements(By.TAG_NAME, "a")
+    # Sayfadaki tüm 'a' etiketlerini tek istekte al (Linkler)
+    linkler = harvest_links(driver)
 
     print(f"🔎 Sayfada toplam {len(linkler)} adet link bulundu.\n")
 
     sayac = 1
     for link in linkler:
-        url = link.get_attribute("href")
-        metin = link.text
+        url = link["url"]
+        metin = link["text"]
         # Boş linkleri atla, dolu olanları yaz
         if url:
             print(f"{sayac}. Link Metni: '{metin}' -> Adres: {url}")
@@ -1,14 +1,12 @@
 # Dosya Adı: test_klavye.py
 import time
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys  # Klavye tuşları için
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 
 
 def klavye_aksiyon_testi():
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    driver = create_driver("visual")
     driver.maximize_window()
     driver.get("https://www.seyyahlab.com")
     time.sleep(2)
@@ -4,14 +4,11 @@ Müşteri Senaryosu: "Hepsiburada'da laptop fiyatlarını takip et, Excel'e dök
 Freelance Değeri: $150-300/proje
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver, USER_AGENT
 from datetime import datetime
 import pandas as pd
 import json
@@ -41,29 +38,11 @@ class ECommerceProductTracker:
         print("🚀 E-TİCARET ÜRÜN TAKİP BOTU BAŞLATILIYOR...")
         print("=" * 70)
 
-        options = Options()
-
-        # Profesyonel ayarlar
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-
-        # User-Agent (Bot tespitini zorlaştır)
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
+        # Bot tespiti bayrakları ve user-agent driver_factory ön ayarında
         # Headless mod (Müşteri "arka planda çalışsın" derse)
         if self.headless:
-            options.add_argument("--headless=new")
             print("🔇 Sessiz mod aktif (Tarayıcı görünmeyecek)")
-
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        self.driver = create_driver("fast-headless" if self.headless else "visual", user_agent=USER_AGENT)
         self.wait = WebDriverWait(self.driver, 15)
 
         print("✅ Tarayıcı hazır!")
@@ -5,14 +5,11 @@ Senaryo: "SeyyahLab'daki tüm seyahat rehberlerini topla, kategorilere ayır,
 Freelance Değeri: $200-400/proje (İçerik analizi + SEO raporu)
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver, USER_AGENT
 from datetime import datetime
 from collections import Counter
 import pandas as pd
@@ -49,32 +46,10 @@ class SeyyahLabAnalyzer:
         print("🗺️  SEYYAHLAB İÇERİK ANALİZ BOTU BAŞLATILIYOR...")
         print("=" * 80)
 
-        options = Options()
-
-        # Profesyonel bot ayarları
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        # Bot tespitini zorlaştır
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        # Performans optimizasyonu
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-dev-shm-usage")
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Bot tespiti, performans bayrakları ve sayfa yükleme timeout'u driver_factory ön ayarında
+        self.driver = create_driver("visual", user_agent=USER_AGENT)
         self.wait = WebDriverWait(self.driver, 15)
 
-        # Sayfa yükleme timeout'u
-        self.driver.set_page_load_timeout(30)
-
         print("✅ Tarayıcı hazır!")
 
     def analyze_homepage(self):
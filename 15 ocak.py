@@ -3,14 +3,11 @@ import time
 import os
 from datetime import datetime
 from functools import wraps
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 
 
 # --- 1. AYARLAR (CONFIG) ---
@@ -18,6 +15,7 @@ class Config:
     BASE_URL = "https://www.seyyahlab.com"
     TIMEOUT = 20  # Saniye
     HEADLESS = False  # Tarayıcıyı gizli çalıştırmak için True yap
+    PRESET = "fast-headless" if HEADLESS else "visual"  # driver_factory ön ayarı
     SCREENSHOT_DIR = "raporlar/ekran_goruntuleri"
 
 
@@ -154,13 +152,7 @@ class TestSeyyahLab:
 
     def setup_method(self):
         """Her testten önce çalışır."""
-        chrome_options = Options()
-        if Config.HEADLESS:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        self.driver = create_driver(Config.PRESET)
         logger.info("Test Ortamı Başlatıldı.")
 
     def teardown_method(self):
@@ -4,18 +4,115 @@ Müşteri Senaryosu: "Hepsiburada'da laptop fiyatlarını takip et, Excel'e dök
 Freelance Değeri: $150-300/proje
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
+from driver_factory import create_driver, preset_settings
+from http_archive import print_archive_report
+from page_ready import load_page, element_present, print_page_load_report
+from driver_profiler import DriverProfiler
+from extraction_schema import compile_schema, parse_price
+from selector_cache import get_selector_cache, domain_of
+from resource_blocking import PageWeightMeter
+from tab_pool import TabExecutor, print_tab_report
 from datetime import datetime
 import pandas as pd
 import json
 import os
+import sys
+import threading
+import time
+
+
+# Ürün ızgarasını tanıyan selector'lar (ilk 3+ eşleşen kazanır)
+PRODUCT_SELECTORS = [
+    "[class*='product-card']",
+    "[class*='productListContent']",
+    "li[class*='product']",
+    "div[data-test*='product']",
+    ".product-item",
+    "[class*='Product']"
+]
+
+PRICE_SELECTORS = ["[class*='price']", "[data-test*='price']", "span[class*='Price']", ".price"]
+
+# Ürün kartı çıkarım şeması (bkz. extraction_schema.py); yeni site = yeni/ek selector
+PRODUCT_SCHEMA = {
+    "name": "urun_karti",
+    "container": PRODUCT_SELECTORS,
+    "container_mode": "first",
+    "min_items": 3,  # En az 3 ürün bulunduysa geçerli
+    "fields": {
+        "Ürün Adı": {"selectors": ["h3", "h2", "[class*='title']", "[class*='name']", "a"],
+                     "min_length": 5, "max_length": 100, "default": "Bulunamadı"},
+        "Fiyat": {"selectors": PRICE_SELECTORS, "match": "\\d", "default": "Fiyat Yok"},
+        "Fiyat Değeri": {"selectors": PRICE_SELECTORS, "match": "\\d", "post": "price"},
+        "Rating": {"selectors": ["[class*='rating'], [class*='star']"], "default": "N/A"},
+        "Link": {"selectors": ["a", "&"], "attr": "href", "default": "Link Yok"},
+    },
+}
+
+# Ürün detay sayfası şeması: sayfanın tamamı tek "kart" (bkz. fetch_product_details)
+PRODUCT_DETAIL_SCHEMA = {
+    "name": "urun_detay",
+    "container": ["html"],
+    "limit": 1,
+    "fields": {
+        "Satıcı": {"selectors": ["[class*='merchant'] a", "[class*='seller'] a", "[class*='merchant']",
+                                 "[class*='seller']"], "min_length": 1, "max_length": 60, "default": "Bilinmiyor"},
+        "Değerlendirme Sayısı": {"selectors": ["[class*='review-count']", "[class*='ratingCount']",
+                                               "[class*='comment-count']", "[class*='review']"],
+                                 "match": "\\d", "post": "int"},
+        "Stok": {"selectors": ["[class*='stock']", "[class*='Stock']"], "max_length": 60},
+        "Açıklama": {"selectors": ["meta[name='description']", "meta[property='og:description']"],
+                     "attr": "content", "max_length": 200},
+    },
+}
+
+SEARCH_BOX = (By.CSS_SELECTOR, "input[type='text'], input[placeholder*='Ara']")
+
+# "Daha fazla yükle" butonlarında geçen metinler (küçük harfle karşılaştırılır)
+LOAD_MORE_TEXTS = ["daha fazla", "devamını gör", "load more", "show more", "more results"]
+
+# Her selector'ın eşleşme sayısını tarayıcıda tek seferde hesaplar
+PRODUCT_COUNT_JS = """
+var selectors = arguments[0], best = {selector: null, count: 0};
+for (var i = 0; i < selectors.length; i++) {
+    var count;
+    try { count = document.querySelectorAll(selectors[i]).length; } catch (e) { continue; }
+    if (count >= 3) return {selector: selectors[i], count: count};
+    if (count > best.count) best = {selector: selectors[i], count: count};
+}
+return best;
+"""
+
+# Görünür bir "daha fazla" butonu bulup tıklar; tıkladığı metni döner.
+# Sayfadan ayrılan linkler ("Daha fazla bilgi", sayfalama, kampanya) aday değildir:
+# sadece href'i olmayan / '#' / 'javascript:' olan <a>'lar buton sayılır (role=button olsa da).
+# Görünürlük getClientRects ile ölçülür (offsetParent, position:fixed butonlarda null'dır).
+LOAD_MORE_JS = """
+var texts = arguments[0];
+var candidates = document.querySelectorAll('button, [role=button], a');
+for (var i = 0; i < candidates.length; i++) {
+    var el = candidates[i];
+    if (el.tagName === 'A') {  // role=button olsa da href'li <a> sayfadan ayrılır
+        var href = (el.getAttribute('href') || '').trim().toLowerCase();
+        if (href && href !== '#' && href.indexOf('javascript:') !== 0) continue;
+    }
+    var label = (el.innerText || '').trim().toLowerCase();
+    if (!label || el.disabled || !el.getClientRects().length) continue;
+    for (var j = 0; j < texts.length; j++) {
+        if (label.indexOf(texts[j]) !== -1) {
+            el.scrollIntoView({block: 'center'});
+            el.click();
+            return label;
+        }
+    }
+}
+return null;
+"""
 
 
 class ECommerceProductTracker:
@@ -28,12 +125,25 @@ class ECommerceProductTracker:
     - HTML rapor
     """
 
-    def __init__(self, headless=False):
-        """Tarayıcıyı başlat"""
+    def __init__(self, headless=False, profile=None, load_profile=None, page_load_strategy="eager", preset=None):
+        """
+        Tarayıcıyı başlat
+
+        profile=True: Tüm WebDriver komutları profillenir (None ise WEBDRIVER_PROFILE ortam değişkenine bakılır)
+        load_profile="extraction": Görsel, video, font ve reklam/takip istekleri engellenir (sadece DOM okunur)
+        page_load_strategy: "eager" (varsayılan) arama kutusu gelince devam eder, "normal" eski davranış
+        preset: driver_factory ön ayarı (verilmezse headless'a göre "fast-headless" / "visual")
+        """
         self.driver = None
+        self.preset = preset or ("fast-headless" if headless else "visual")
+        self.load_profile = load_profile
+        self.page_load_strategy = page_load_strategy
         self.products = []
         self.headless = headless
+        self.product_selector = None  # Ürün ızgarasını eşleyen selector (kaydırma sırasında bulunur)
         self._setup_driver()
+        self.profiler = DriverProfiler(self.driver, enabled=profile)
+        self.selector_cache = get_selector_cache()  # Site bazında hangi selector tuttu
 
     def _setup_driver(self):
         """Chrome'u profesyonel ayarlarla yapılandır"""
@@ -41,31 +151,20 @@ class ECommerceProductTracker:
         print("🚀 E-TİCARET ÜRÜN TAKİP BOTU BAŞLATILIYOR...")
         print("=" * 70)
 
-        options = Options()
-
-        # Profesyonel ayarlar
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
+        # Headless mod (Müşteri "arka planda çalışsın" derse) -> fast-headless ön ayarı
+        if self.preset != "visual":
+            print(f"🔇 Sessiz mod aktif (Tarayıcı görünmeyecek, ön ayar: {self.preset})")
 
-        # User-Agent (Bot tespitini zorlaştır)
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        # Headless mod (Müşteri "arka planda çalışsın" derse)
-        if self.headless:
-            options.add_argument("--headless=new")
-            print("🔇 Sessiz mod aktif (Tarayıcı görünmeyecek)")
-
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        self.driver = create_driver(self.preset, load_profile=self.load_profile,
+                                    page_load_strategy=self.page_load_strategy)
+        self.load_profile = preset_settings(self.preset, load_profile=self.load_profile)["load_profile"]
         self.wait = WebDriverWait(self.driver, 15)
 
+        # Sayfa ağırlığı ölçümü (extraction profilinde görsel/video/font/reklam engellenir)
+        if self.load_profile == "extraction":
+            print("🚫 'extraction' profili: görsel, video, font ve reklam/takip istekleri engelleniyor")
+        self.page_meter = PageWeightMeter(self.driver, self.load_profile)
+
         print("✅ Tarayıcı hazır!")
 
     def search_products(self, site_url, search_keyword, max_products=10):
@@ -75,19 +174,27 @@ class ECommerceProductTracker:
             site_url: Hedef site (örn: https://www.hepsiburada.com)
             search_keyword: Arama terimi (örn: "gaming laptop")
             max_products: Kaç ürün toplanacak
+
+        Returns:
+            Bu aramada toplanan ürünler (self.products'a da eklenir)
         """
+        self.profiler.start("search_products")
+        self.product_selector = None
+        first_new = len(self.products)
+
         try:
+            self.profiler.set_phase("sayfa_yukleme")
             print(f"\n🌐 Siteye gidiliyor: {site_url}")
-            self.driver.get(site_url)
+            self.page_meter.start()
+            load_page(self.driver, site_url, ready=element_present(SEARCH_BOX), timeout=15, label=site_url)
 
             # Çerezleri kabul et (varsa)
             self._handle_cookie_popup()
 
             # Arama kutusunu bul ve aramayı yap
+            self.profiler.set_phase("arama")
             print(f"🔍 '{search_keyword}' aranıyor...")
-            search_box = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='text'], input[placeholder*='Ara']"))
-            )
+            search_box = self.wait.until(EC.presence_of_element_located(SEARCH_BOX))
 
             search_box.clear()
             search_box.send_keys(search_keyword)
@@ -100,10 +207,13 @@ class ECommerceProductTracker:
                     (By.CSS_SELECTOR, "[class*='product'], [class*='Product'], li[class*='item']"))
             )
 
-            # Sayfayı scroll et (Lazy loading için)
-            self._scroll_to_load_products()
+            # İstenen ürün sayısına ulaşana kadar scroll et / "daha fazla" bas
+            self.profiler.set_phase("kaydirma")
+            self._scroll_to_load_products(max_products)
+            self.page_meter.measure(self.driver.current_url)
 
             # Ürünleri topla
+            self.profiler.set_phase("urun_toplama")
             print(f"📦 İlk {max_products} ürün toplanıyor...")
             self._extract_products(max_products)
 
@@ -112,126 +222,134 @@ class ECommerceProductTracker:
         except Exception as e:
             print(f"❌ Hata: {e}")
             self._take_error_screenshot()
+        finally:
+            self.profiler.finish()
+        return self.products[first_new:]
 
     def _handle_cookie_popup(self):
         """Çerez popup'ını kapat (varsa)"""
+        cookie_buttons = [
+            "//button[contains(text(), 'Kabul')]",
+            "//button[contains(text(), 'Accept')]",
+            "//button[@id='onetrust-accept-btn-handler']",
+            "[id*='accept'], [id*='cookie']"
+        ]
+
+        def click_button(selector):
+            by = By.XPATH if selector.startswith("//") else By.CSS_SELECTOR
+            self.driver.find_element(by, selector).click()
+            return True
+
+        # Bu sitede geçen sefer tutan buton önce denenir
         try:
-            cookie_buttons = [
-                "//button[contains(text(), 'Kabul')]",
-                "//button[contains(text(), 'Accept')]",
-                "//button[@id='onetrust-accept-btn-handler']",
-                "[id*='accept'], [id*='cookie']"
-            ]
-
-            for selector in cookie_buttons:
-                try:
-                    if selector.startswith("//"):
-                        btn = self.driver.find_element(By.XPATH, selector)
-                    else:
-                        btn = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    btn.click()
-                    print("🍪 Çerez popup'ı kapatıldı")
-                    return
-                except:
-                    continue
-        except:
+            _, clicked = self.selector_cache.first_match(
+                self.driver.current_url, "cerez", cookie_buttons, click_button)
+            if clicked:
+                print("🍪 Çerez popup'ı kapatıldı")
+        except Exception:
             pass  # Popup yoksa devam et
 
-    def _scroll_to_load_products(self):
-        """Sayfayı kademeli olarak kaydır (Lazy loading tetikleme)"""
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+    def _count_products(self):
+        """Ürün ızgarasındaki eleman sayısını tarayıcıda say (selector + adet)"""
+        # Tüm zincir tek JS çağrısında denenir; ıska beklemesi olmadığından önbelleğe alınmaz
+        selectors = [self.product_selector] if self.product_selector else PRODUCT_SELECTORS
+        result = self.driver.execute_script(PRODUCT_COUNT_JS, selectors)
+        return result['selector'], result['count']
 
-        for i in range(3):  # 3 kez scroll
-            # Yavaş yavaş aşağı in
-            self.driver.execute_script(f"window.scrollTo(0, {(i + 1) * 800});")
-
-            # Yeni içeriğin yüklenmesini bekle
-            self.driver.implicitly_wait(1)
+    def _wait_for_more_products(self, selector, current_count, timeout):
+        """Ürün sayısı artana kadar bekle; artarsa True"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda d: d.execute_script("return document.querySelectorAll(arguments[0]).length",
+                                           selector) > current_count
+            )
+            return True
+        except TimeoutException:
+            return False
 
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
+    def _scroll_to_load_products(self, max_products, time_budget=120):
+        """
+        Izgarada en az max_products ürün olana kadar kaydır (Lazy loading tetikleme).
+        Kaydırma yeni ürün getirmezse "Daha fazla" butonu aranır; o da yoksa durulur.
+        """
+        start = time.perf_counter()
+        selector, count = self._count_products()
+        scrolls = clicks = 0
+
+        while selector and count < max_products and time.perf_counter() - start < time_budget:
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            scrolls += 1
+            loaded = self._wait_for_more_products(selector, count, timeout=4)
+
+            if not loaded:
+                page_url = self.driver.current_url.split("#")[0]
+                clicked = self.driver.execute_script(LOAD_MORE_JS, LOAD_MORE_TEXTS)
+                if clicked:
+                    clicks += 1
+                    print(f"   ➕ '{clicked}' butonuna tıklandı")
+                    loaded = self._wait_for_more_products(selector, count, timeout=8)
+                    if self.driver.current_url.split("#")[0] != page_url:
+                        # Buton başka sayfaya götürdü (JS ile yönlendirme): sonuç sayfasına dön, dur
+                        print(f"   ⚠️ '{clicked}' sayfadan ayrıldı, sonuç sayfasına dönülüyor")
+                        self.driver.back()
+                        break
+
+            if not loaded:
+                break  # Sayfada yüklenecek başka ürün kalmadı
+
+            count = self.driver.execute_script("return document.querySelectorAll(arguments[0]).length", selector)
+
+        self.product_selector = selector
+        print(f"⬇️ Izgarada {count} ürün (hedef: {max_products}) | {scrolls} kaydırma, {clicks} buton, "
+              f"{time.perf_counter() - start:.1f} sn")
 
     def _extract_products(self, max_products):
-        """Ürün bilgilerini çıkar"""
-        # Farklı sitelerde farklı CSS selector'ları deneyeceğiz
-        product_selectors = [
-            "[class*='product-card']",
-            "[class*='productListContent']",
-            "li[class*='product']",
-            "div[data-test*='product']",
-            ".product-item",
-            "[class*='Product']"
-        ]
+        """Ürün bilgilerini çıkarım şemasıyla tek çağrıda çıkar"""
+        # Kaydırma sırasında bulunan selector önce, sonra diğerleri (zincir tek çağrıda denenir)
+        container = PRODUCT_SELECTORS
+        if self.product_selector:
+            container = [self.product_selector] + [s for s in container if s != self.product_selector]
 
-        product_elements = []
-        for selector in product_selectors:
-            try:
-                product_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if len(product_elements) >= 3:  # En az 3 ürün bulunduysa geçerli
-                    print(f"✅ Ürünler bulundu! Selector: {selector}")
-                    break
-            except:
-                continue
-
-        if not product_elements:
+        result = compile_schema(PRODUCT_SCHEMA).run(self.driver, limit=max_products, container=container)
+
+        if not result['items']:
             print("⚠️ Ürün bulunamadı, genel HTML yapısı kaydediliyor...")
             return
+        print(f"✅ Ürünler bulundu! Selector: {result['container']}")
 
-        for idx, element in enumerate(product_elements[:max_products], 1):
-            try:
-                # Ürün adı
-                name_selectors = ["h3", "h2", "[class*='title']", "[class*='name']", "a"]
-                product_name = "Bulunamadı"
-                for selector in name_selectors:
-                    try:
-                        product_name = element.find_element(By.CSS_SELECTOR, selector).text.strip()
-                        if product_name and len(product_name) > 5:
-                            break
-                    except:
-                        continue
+        for idx, item in enumerate(result['items'], 1):
+            product_data = {"Sıra": idx, **item, "Tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+            self.products.append(product_data)
+            print(f"   {idx}. {item['Ürün Adı'][:50]}... | {item['Fiyat']}")
 
-                # Fiyat
-                price_selectors = ["[class*='price']", "[data-test*='price']", "span[class*='Price']", ".price"]
-                price = "Fiyat Yok"
-                for selector in price_selectors:
-                    try:
-                        price_element = element.find_element(By.CSS_SELECTOR, selector)
-                        price_text = price_element.text.strip()
-                        if price_text and any(char.isdigit() for char in price_text):
-                            price = price_text
-                            break
-                    except:
-                        continue
-
-                # Ürün linki
-                try:
-                    link = element.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
-                except:
-                    link = "Link Yok"
-
-                # Rating (varsa)
-                try:
-                    rating = element.find_element(By.CSS_SELECTOR, "[class*='rating'], [class*='star']").text
-                except:
-                    rating = "N/A"
-
-                product_data = {
-                    "Sıra": idx,
-                    "Ürün Adı": product_name[:100],  # İlk 100 karakter
-                    "Fiyat": price,
-                    "Rating": rating,
-                    "Link": link,
-                    "Tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-
-                self.products.append(product_data)
-                print(f"   {idx}. {product_name[:50]}... | {price}")
-
-            except Exception as e:
-                print(f"   ⚠️ Ürün {idx} atlandı: {str(e)[:50]}")
-                continue
+        print(f"⚡ WebDriver round-trip: 1 (eski yöntemle ≈ {result['probes']})")
+
+    def fetch_product_details(self, products=None, tabs=4, timeout=20):
+        """
+        Ürün detay sayfalarını aynı tarayıcıda çok sekmeyle paralel açar (bkz. tab_pool.py)
+        ve satıcı / değerlendirme / stok / açıklama bilgisini ürün kaydına ekler.
+        Arama sonuç sayfası kendi sekmesinde kalır.
+        """
+        products = self.products if products is None else products
+        targets = [p for p in products if str(p.get("Link", "")).startswith("http")]
+        if not targets:
+            print("⚠️ Detayı açılacak ürün linki yok")
+            return products
+
+        schema = compile_schema(PRODUCT_DETAIL_SCHEMA)
+        print(f"\n🗂️ {len(targets)} ürün detayı {tabs} sekmede açılıyor...")
+        executor = TabExecutor(self.driver, tabs=tabs, timeout=timeout, load_profile=self.load_profile)
+        with executor:
+            for result in executor.imap([p["Link"] for p in targets],
+                                        lambda driver, url: schema.run(driver)["items"]):
+                product = targets[result["sira"]]
+                if result["hata"] or not result["sonuc"]:
+                    print(f"   ⚠️ {product['Ürün Adı'][:40]}... → {result['hata'] or 'detay bulunamadı'}")
+                    continue
+                product.update(result["sonuc"][0])
+                print(f"   ✓ {product['Ürün Adı'][:40]}... | {product['Satıcı']} ({result['yukleme_sn']} sn)")
+        print_tab_report(executor.report())
+        return products
 
     def _take_error_screenshot(self):
         """Hata durumunda ekran görüntüsü al"""
@@ -446,18 +564,208 @@ class ECommerceProductTracker:
 
     def _extract_price(self, price_str):
         """Fiyat string'inden sayıyı çıkar (karşılaştırma için)"""
-        import re
-        numbers = re.findall(r'\d+[\.,]?\d*', price_str.replace('.', '').replace(',', '.'))
-        return float(numbers[0]) if numbers else 99999999
+        price = parse_price(price_str)
+        return 99999999 if price is None else price
 
     def close(self):
         """Tarayıcıyı kapat"""
         if self.driver:
+            self.selector_cache.print_report()
+            self.selector_cache.save()
+            print_page_load_report(self.driver)
+            print_archive_report(self.driver)
             print("\n🔒 Tarayıcı kapatılıyor...")
             self.driver.quit()
             print("✅ İşlem tamamlandı!")
 
 
+# ============================================================================
+# TOPLU ARAMA - anahtar kelime × site matrisi, sınırlı tarayıcı havuzu
+# ============================================================================
+
+class SiteLimiter:
+    """Site (alan adı) başına aynı anda yapılan arama sayısını sınırlar (rate limit'e takılmamak için)."""
+
+    def __init__(self, limits=None, default=2):
+        self.limits = dict(limits or {})
+        self.default = default
+        self.active = {}
+        self.peak = {}
+        self._cond = threading.Condition()
+
+    def limit(self, domain):
+        return self.limits.get(domain, self.default)
+
+    def take(self, jobs):
+        """
+        Sınırı dolmamış bir siteye ait ilk işi kuyruktan çıkarır. Kalan tüm işlerin
+        siteleri doluysa bir yer açılana kadar bekler; iş kalmadıysa None döner.
+        """
+        with self._cond:
+            while jobs:
+                for job in jobs:
+                    domain = job["domain"]
+                    if self.active.get(domain, 0) < self.limit(domain):
+                        jobs.remove(job)
+                        self.active[domain] = self.active.get(domain, 0) + 1
+                        self.peak[domain] = max(self.peak.get(domain, 0), self.active[domain])
+                        return job
+                self._cond.wait()
+            return None
+
+    def done(self, domain):
+        with self._cond:
+            self.active[domain] -= 1
+            self._cond.notify_all()
+
+
+def _batch_worker(worker_id, jobs, limiter, results, max_products, tracker_kwargs):
+    """Kendi tarayıcısını bir kere açar, matristen iş çektikçe aynı tarayıcıyla arar."""
+    try:
+        bot = ECommerceProductTracker(**tracker_kwargs)
+    except Exception as e:
+        print(f"❌ İşçi {worker_id}: tarayıcı açılamadı ({e})")
+        return
+
+    try:
+        while True:
+            job = limiter.take(jobs)
+            if job is None:
+                break
+            start = time.perf_counter()
+            try:
+                products = bot.search_products(job["site"], job["keyword"], max_products=max_products)
+            finally:
+                limiter.done(job["domain"])
+            duration = time.perf_counter() - start
+
+            for product in products:
+                product["Site"] = job["domain"]
+                product["Arama"] = job["keyword"]
+            results[(job["domain"], job["keyword"])] = {
+                "site": job["domain"], "arama": job["keyword"], "isci": worker_id,
+                "sure_sn": round(duration, 2), "urunler": products,
+            }
+            print(f"📦 [işçi {worker_id}] {job['domain']} / '{job['keyword']}' → {len(products)} ürün "
+                  f"({duration:.1f} sn)")
+    finally:
+        bot.close()
+
+
+def build_comparison(results):
+    """(site, arama) başına ürün sayısı ve fiyat özeti; her aramada en ucuz site işaretlenir."""
+    rows = []
+    for (domain, keyword), result in results.items():
+        priced = [p for p in result["urunler"] if p.get("Fiyat Değeri") is not None]
+        cheapest = min(priced, key=lambda p: p["Fiyat Değeri"]) if priced else None
+        rows.append({
+            "Arama": keyword,
+            "Site": domain,
+            "Ürün Sayısı": len(result["urunler"]),
+            "En Düşük Fiyat": cheapest["Fiyat Değeri"] if cheapest else None,
+            "Ortalama Fiyat": round(sum(p["Fiyat Değeri"] for p in priced) / len(priced), 2) if priced else None,
+            "En Ucuz Ürün": cheapest["Ürün Adı"] if cheapest else "-",
+            "Link": cheapest["Link"] if cheapest else "-",
+            "En Ucuz Site": False,
+        })
+
+    for keyword in {row["Arama"] for row in rows}:
+        priced_rows = [r for r in rows if r["Arama"] == keyword and r["En Düşük Fiyat"] is not None]
+        if priced_rows:
+            min(priced_rows, key=lambda r: r["En Düşük Fiyat"])["En Ucuz Site"] = True
+
+    return sorted(rows, key=lambda r: (r["Arama"], r["Site"]))
+
+
+def batch_search(sites, keywords, workers=4, max_products=10, site_limits=None, default_site_limit=2,
+                 **tracker_kwargs):
+    """
+    Anahtar kelime × site matrisini sınırlı bir tarayıcı havuzunda arar.
+
+    Args:
+        sites: Site adresleri (örn: ["https://www.hepsiburada.com", "https://www.trendyol.com"])
+        keywords: Arama terimleri
+        workers: Aynı anda açık tarayıcı sayısı
+        site_limits: {"hepsiburada.com": 1} gibi site başına eşzamanlı arama sınırı
+        default_site_limit: site_limits'te olmayan siteler için sınır
+        tracker_kwargs: ECommerceProductTracker ayarları (varsayılan ön ayar: "extraction")
+
+    Returns:
+        {"sonuclar": {(site, arama): {...}}, "karsilastirma": [...], "urunler": [...], "verim": {...}}
+    """
+    tracker_kwargs.setdefault("preset", "extraction")
+    # Kelime sırasıyla dizilir: ardışık işler farklı sitelere düşer, sınırlar daha az bekletir
+    jobs = [{"site": site, "domain": domain_of(site), "keyword": keyword}
+            for keyword in keywords for site in sites]
+    workers = max(1, min(workers, len(jobs)))
+    limiter = SiteLimiter(site_limits, default_site_limit)
+    results = {}
+
+    print(f"🛒 {len(keywords)} kelime × {len(sites)} site = {len(jobs)} arama, {workers} tarayıcı "
+          f"(site başına en fazla {default_site_limit})")
+    start = time.perf_counter()
+    threads = [threading.Thread(target=_batch_worker, name=f"arama-{i}", daemon=True,
+                                args=(i, jobs, limiter, results, max_products, tracker_kwargs))
+               for i in range(1, workers + 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    products = [p for result in results.values() for p in result["urunler"]]
+    return {
+        "sonuclar": results,
+        "karsilastirma": build_comparison(results),
+        "urunler": products,
+        "verim": {
+            "arama": len(results),
+            "planlanan": len(results) + len(jobs),  # İşçiler düştüyse kuyrukta kalanlar
+            "isci": workers,
+            "toplam_sure_sn": round(wall, 2),
+            "arama_dakika": round(len(results) / wall * 60, 2) if wall else 0,
+            "sirali_tahmini_sn": round(sum(r["sure_sn"] for r in results.values()), 2),
+            "site_tepe_eszamanlilik": dict(limiter.peak),
+        },
+    }
+
+
+def save_batch_results(report, prefix="toplu_karsilastirma"):
+    """Karşılaştırmayı ve tüm ürünleri tek Excel'e (2 sheet) ve JSON'a yaz"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    excel_file, json_file = f"{prefix}_{timestamp}.xlsx", f"{prefix}_{timestamp}.json"
+
+    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+        pd.DataFrame(report["karsilastirma"]).to_excel(writer, index=False, sheet_name='Karşılaştırma')
+        pd.DataFrame(report["urunler"]).to_excel(writer, index=False, sheet_name='Ürünler')
+
+    with open(json_file, 'w', encoding='utf-8') as f:
+        json.dump({"tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                   "karsilastirma": report["karsilastirma"], "urunler": report["urunler"],
+                   "verim": report["verim"]}, f, ensure_ascii=False, indent=2)
+
+    print(f"📁 Excel: {excel_file}")
+    print(f"📁 JSON: {json_file}")
+    return excel_file, json_file
+
+
+def print_batch_report(report):
+    verim = report["verim"]
+    print("\n" + "=" * 70)
+    print("🛒 TOPLU ARAMA KARŞILAŞTIRMASI")
+    print("=" * 70)
+    for row in report["karsilastirma"]:
+        mark = "🏆" if row["En Ucuz Site"] else "  "
+        price = f"{row['En Düşük Fiyat']:,.2f} TL" if row["En Düşük Fiyat"] is not None else "-"
+        print(f" {mark} {row['Arama'][:20]:<20} | {row['Site'][:22]:<22} | {row['Ürün Sayısı']:>3} ürün | {price}")
+    print("-" * 70)
+    print(f"   ⏱ {verim['arama']}/{verim['planlanan']} arama, {verim['toplam_sure_sn']} sn "
+          f"(sıralı tahmini {verim['sirali_tahmini_sn']} sn) → {verim['arama_dakika']} arama/dk")
+    for domain, peak in verim["site_tepe_eszamanlilik"].items():
+        print(f"   🚦 {domain}: en fazla {peak} eşzamanlı arama")
+    print("=" * 70)
+
+
 # ============================================================================
 # ANA PROGRAM - BURADAN ÇALIŞTIR!
 # ============================================================================
@@ -483,6 +791,9 @@ def main():
 
         # Raporları oluştur
         if bot.products:
+            # Detay sayfaları aynı tarayıcıda 4 sekmede paralel açılır
+            bot.fetch_product_details(tabs=4)
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
             bot.save_to_excel(f"urun_karsilastirma_{timestamp}.xlsx")
@@ -507,5 +818,20 @@ def main():
         bot.close()
 
 
+def batch_main():
+    """Toplu mod: birden çok kelimeyi birden çok sitede paralel ara"""
+    SITES = ["https://www.hepsiburada.com", "https://www.trendyol.com", "https://www.n11.com"]
+    KEYWORDS = ["gaming laptop", "kablosuz kulaklık", "oyuncu mouse"]
+
+    report = batch_search(SITES, KEYWORDS, workers=4, max_products=10, default_site_limit=2)
+    print_batch_report(report)
+    if report["urunler"]:
+        save_batch_results(report)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # python 1z.py --toplu  -> kelime × site matrisi
+    if "--toplu" in sys.argv:
+        batch_main()
+    else:
+        main()
\ No newline at end of file
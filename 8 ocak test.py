@@ -1,12 +1,9 @@
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 from datetime import datetime
 
 
@@ -16,13 +13,8 @@ from datetime import datetime
 def tarayiciyi_baslat():
     """Tarayıcıyı en uygun ayarlarla başlatır."""
     print("🚀 Test Ortamı Hazırlanıyor...")
-    chrome_options = Options()
-    # chrome_options.add_argument("--headless") # İstersen tarayıcıyı hiç görmeden arkada çalıştırmak için bu yorumu kaldır.
-    chrome_options.add_argument("--start-maximized")  # Tam ekran
-    chrome_options.add_argument("--disable-notifications")  # "Bildirimlere izin ver" kutucuklarını engelle
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    return driver
+    # Bildirim kutucukları ön ayarda kapalı; arkada çalıştırmak için "fast-headless" yap
+    return create_driver("visual")
 
 
 def rapor_yazdir(mesaj, durum="BİLGİ"):
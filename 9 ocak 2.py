@@ -4,14 +4,11 @@ import os
 import pandas as pd  # <-- YENİ: Excel işlemleri için
 from datetime import datetime
 from functools import wraps
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 
 
 # --- 1. AYARLAR ---
@@ -19,6 +16,7 @@ class Config:
     BASE_URL = "https://www.seyyahlab.com"
     TIMEOUT = 20
     HEADLESS = False
+    PRESET = "fast-headless" if HEADLESS else "visual"  # driver_factory ön ayarı
     SCREENSHOT_DIR = "raporlar/ekran_goruntuleri"
     EXCEL_DIR = "raporlar/excel_dosyalari"  # <-- YENİ: Excel kayıt yeri
 
@@ -155,11 +153,7 @@ class SearchResultsPage(BasePage):
 class TestSeyyahLab:
     def run_test(self):
         # Ayarlar
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        driver = create_driver(Config.PRESET)
 
         try:
             # Sayfa Nesnelerini Oluştur
@@ -1,20 +1,13 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_factory import create_driver
+from network_idle import wait_for_network_idle
 
 # Sadece yapıyı görmek için hızlı kurulum
-options = webdriver.ChromeOptions()
-options.add_argument("--headless")  # Arka planda çalışsın
-options.add_argument(
-    "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = create_driver("fast-headless")  # Arka planda çalışsın (user-agent ön ayarda)
 
 print("🕵️  SeyyahLab HTML Analizi Başlıyor...")
 driver.get("https://seyyahlab.com")
-time.sleep(3)  # Yüklenmesini bekle
+wait_for_network_idle(driver, replaces=3)  # Yüklenmesini bekle
 
 try:
     # Rehber kartlarından birini bulalım (h3 etiketi içeren bir div muhtemelen)
@@ -5,20 +5,28 @@ Senaryo: "SeyyahLab'daki tüm seyahat rehberlerini topla, kategorilere ayır,
 Freelance Değeri: $200-400/proje (İçerik analizi + SEO raporu)
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver, preset_settings
+from http_archive import get_replay, print_archive_report
+from page_ready import load_page, min_items, any_ready, print_page_load_report
+from link_harvest import harvest_links, classify_links
+from link_checker import LinkChecker, check_links, print_link_summary
+from content_rules import (
+    CARD_SCHEMA, CARD_SELECTORS, NAV_SELECTOR, NAV_IGNORED, find_destination, calculate_statistics
+)
+from extraction_schema import compile_schema
+from resource_blocking import PageWeightMeter
+from lazy_scroll import scroll_until_settled
+from driver_profiler import DriverProfiler
+from dom_snapshot import capture_snapshot, save_snapshot, analyze_snapshot, parse_snapshot
+from sitemap_crawler import analyze_article
+from tab_pool import TabExecutor, print_tab_report
 from datetime import datetime
-from collections import Counter
 import pandas as pd
 import json
 import os
-import re
 
 
 class SeyyahLabAnalyzer:
@@ -34,14 +42,33 @@ class SeyyahLabAnalyzer:
     - Çoklu format export (Excel, JSON, HTML)
     """
 
-    def __init__(self):
-        """Bot'u başlat"""
+    BASE_URL = "https://www.seyyahlab.com"
+
+    def __init__(self, profile=None, load_profile=None, page_load_strategy="eager", preset="visual",
+                 check_links=True):
+        """
+        Bot'u başlat
+
+        profile=True: Tüm WebDriver komutları profillenir (None ise WEBDRIVER_PROFILE ortam değişkenine bakılır)
+        load_profile="extraction": Görsel, video, font ve reklam/takip istekleri engellenir (sadece DOM okunur)
+        page_load_strategy: "eager" (varsayılan) ilk içerik kartı gelince devam eder, "normal" eski davranış
+        preset: driver_factory ön ayarı ("visual", "fast-headless", "extraction", "mobile")
+        check_links=False: Toplanan linklerin HTTP durum kontrolü (kırık link taraması) atlanır;
+                     LinkChecker verilirse o kullanılır (birden çok analizci host başına limiti paylaşır)
+        """
         self.driver = None
+        self.preset = preset
+        self.load_profile = load_profile
+        self.page_load_strategy = page_load_strategy
+        self.base_url = self.BASE_URL
         self.articles = []
         self.categories = []
         self.destinations = []
+        self.broken_links = []
         self.stats = {}
+        self.check_links = check_links
         self._setup_driver()
+        self.profiler = DriverProfiler(self.driver, enabled=profile)
 
     def _setup_driver(self):
         """Chrome'u profesyonel ayarlarla yapılandır"""
@@ -49,42 +76,43 @@ class SeyyahLabAnalyzer:
         print("🗺️  SEYYAHLAB İÇERİK ANALİZ BOTU BAŞLATILIYOR...")
         print("=" * 80)
 
-        options = Options()
-
-        # Profesyonel bot ayarları
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        # Bot tespitini zorlaştır
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-
-        # Performans optimizasyonu
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-dev-shm-usage")
-
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Bayraklar driver_factory ön ayarından gelir (varsayılan: görünür tarayıcı)
+        self.driver = create_driver(self.preset, load_profile=self.load_profile,
+                                    page_load_strategy=self.page_load_strategy)
+        self.load_profile = preset_settings(self.preset, load_profile=self.load_profile)["load_profile"]
         self.wait = WebDriverWait(self.driver, 15)
 
-        # Sayfa yükleme timeout'u
-        self.driver.set_page_load_timeout(30)
+        # Sayfa ağırlığı ölçümü (extraction profilinde görsel/video/font/reklam engellenir)
+        if self.load_profile == "extraction":
+            print("🚫 'extraction' profili: görsel, video, font ve reklam/takip istekleri engelleniyor")
+        self.page_meter = PageWeightMeter(self.driver, self.load_profile)
 
         print("✅ Tarayıcı hazır!")
 
-    def analyze_homepage(self):
-        """Ana sayfa analizini yap"""
-        try:
-            print(f"\n🌐 SeyyahLab ana sayfasına gidiliyor...")
-            self.driver.get("https://www.seyyahlab.com")
+    def analyze_homepage(self, url=None, snapshot=False):
+        """
+        Ana sayfa analizini yap (url verilmezse SeyyahLab ana sayfası)
+
+        snapshot=True: Kaydırmadan sonra DOM tek çağrıda yakalanır, diske yazılır
+        ve tüm analizler canlı DOM yerine bu kopya üzerinde çalışır.
+        """
+        self.base_url = url or self.BASE_URL
+        self.articles = []
+        self.categories = []
+        self.destinations = []
+        self.broken_links = []
+        self.stats = {}
+        self.profiler.start("analyze_homepage")
 
-            # Sayfa yüklenmesini bekle
-            self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        try:
+            self.profiler.set_phase("sayfa_yukleme")
+            print(f"\n🌐 {self.base_url} adresine gidiliyor...")
+            self.page_meter.start()
+            # İlk içerik kartı (ya da kart yoksa tam yükleme) gelince hazır
+            load_page(self.driver, self.base_url, timeout=15, label="ana_sayfa", ready=any_ready(
+                min_items(", ".join(CARD_SELECTORS), 1),
+                lambda d: d.execute_script("return document.readyState") == "complete",
+            ))
 
             # Sayfa başlığı
             page_title = self.driver.title
@@ -100,27 +128,40 @@ class SeyyahLabAnalyzer:
                 print("⚠️ Meta description bulunamadı (SEO eksiği!)")
 
             # Sayfa yavaşça aşağı kaydır (tüm içeriği yükle)
+            self.profiler.set_phase("kaydirma")
             print("\n⬇️ Sayfa kaydırılıyor (Lazy loading tetikleniyor)...")
             self._smooth_scroll()
+            page_weight = self.page_meter.measure(self.base_url)
+
+            if snapshot:
+                self.profiler.set_phase("snapshot")
+                self._analyze_from_snapshot()
+                self.stats['sayfa_agirligi'] = page_weight
+                return True
 
             # İçerik kartlarını topla
+            self.profiler.set_phase("icerik_kartlari")
             print("\n📦 İçerik kartları toplanıyor...")
             self._extract_content_cards()
 
             # Navigasyon menüsünü analiz et
+            self.profiler.set_phase("navigasyon")
             print("\n🧭 Navigasyon menüsü analiz ediliyor...")
             self._analyze_navigation()
 
             # Link analizi
+            self.profiler.set_phase("linkler")
             print("\n🔗 Link analizi yapılıyor...")
             self._analyze_links()
 
             # Görsel analizi
+            self.profiler.set_phase("gorseller")
             print("\n🖼️ Görsel analizi yapılıyor...")
             self._analyze_images()
 
             # İstatistikleri hesapla
             self._calculate_statistics()
+            self.stats['sayfa_agirligi'] = page_weight
 
             return True
 
@@ -132,156 +173,107 @@ class SeyyahLabAnalyzer:
             print(f"❌ Hata oluştu: {e}")
             self._take_screenshot("general_error")
             return False
+        finally:
+            self.profiler.finish()
 
     def _smooth_scroll(self):
-        """Sayfayı yumuşak şekilde kaydır (kullanıcı simülasyonu)"""
-        total_height = self.driver.execute_script("return document.body.scrollHeight")
-        viewport_height = self.driver.execute_script("return window.innerHeight")
-
-        current_position = 0
-        scroll_step = viewport_height // 2  # Yarım ekran adımlarla
-
-        while current_position < total_height:
-            self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-            current_position += scroll_step
-
-            # Yeni içeriğin yüklenmesini bekle
-            self.driver.implicitly_wait(0.5)
-
-            # Dinamik içerik yüklendiyse yükseklik değişir
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height > total_height:
-                total_height = new_height
+        """Lazy-load içerik durulana kadar kaydır (sabit bekleme yok, olay tabanlı)"""
+        result = scroll_until_settled(self.driver, budget=20)
 
         # En alta git
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        print(f"✅ Sayfa kaydırıldı (Toplam yükseklik: {total_height}px)")
+        durum = "süre doldu" if result['timed_out'] else "duruldu"
+        print(f"✅ Sayfa kaydırıldı (Toplam yükseklik: {result['height']}px, {result['steps']} adım, "
+              f"{result['added_nodes']} yeni düğüm, {result['elapsed_ms']} ms, {durum})")
 
     def _extract_content_cards(self):
-        """İçerik kartlarını (blog yazıları, rehberler) topla"""
-        card_selectors = [
-            "article",
-            "[class*='card']",
-            "[class*='post']",
-            "[class*='content']",
-            ".blog-item",
-            "[class*='article']"
-        ]
-
-        content_cards = []
-        for selector in card_selectors:
-            try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if len(elements) > 0:
-                    content_cards.extend(elements)
-                    print(f"   ✓ '{selector}' ile {len(elements)} öğe bulundu")
-            except:
-                continue
-
-        # Benzersiz elementleri al
-        unique_cards = list(set(content_cards))
-        print(f"✅ Toplam {len(unique_cards)} içerik kartı tespit edildi")
-
-        # Her karttan bilgi çıkar
-        for idx, card in enumerate(unique_cards[:20], 1):  # İlk 20 kart
-            try:
-                article_data = {}
-
-                # Başlık
-                title_selectors = ["h1", "h2", "h3", "[class*='title']", "a"]
-                for selector in title_selectors:
-                    try:
-                        title_element = card.find_element(By.CSS_SELECTOR, selector)
-                        title_text = title_element.text.strip()
-                        if title_text and len(title_text) > 5:
-                            article_data['baslik'] = title_text[:150]
-                            break
-                    except:
-                        continue
-
-                if 'baslik' not in article_data:
-                    continue  # Başlık yoksa atla
-
-                # Link
-                try:
-                    link_element = card.find_element(By.CSS_SELECTOR, "a")
-                    article_data['link'] = link_element.get_attribute("href")
-                except:
-                    article_data['link'] = "Link bulunamadı"
-
-                # Özet metin
-                try:
-                    text_selectors = ["p", "[class*='excerpt']", "[class*='description']", "[class*='summary']"]
-                    for selector in text_selectors:
-                        try:
-                            text = card.find_element(By.CSS_SELECTOR, selector).text.strip()
-                            if text and len(text) > 20:
-                                article_data['ozet'] = text[:200]
-                                break
-                        except:
-                            continue
-                except:
-                    article_data['ozet'] = "Özet bulunamadı"
-
-                # Görsel
-                try:
-                    img = card.find_element(By.CSS_SELECTOR, "img")
-                    article_data['gorsel'] = img.get_attribute("src") or img.get_attribute("data-src")
-                except:
-                    article_data['gorsel'] = "Görsel yok"
-
-                # Kategori/Etiket (varsa)
-                try:
-                    tag_selectors = ["[class*='category']", "[class*='tag']", "[class*='label']", "span"]
-                    for selector in tag_selectors:
-                        try:
-                            tags = card.find_elements(By.CSS_SELECTOR, selector)
-                            tag_texts = [t.text.strip() for t in tags if t.text.strip()]
-                            if tag_texts:
-                                article_data['kategori'] = ", ".join(tag_texts[:3])
-                                break
-                        except:
-                            continue
-                except:
-                    article_data['kategori'] = "Kategori yok"
-
-                # Destinasyon çıkarımı (başlıktan)
-                self._extract_destination(article_data['baslik'])
-
-                article_data['sira'] = idx
-                article_data['tarih'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """İçerik kartlarını (blog yazıları, rehberler) çıkarım şemasıyla tek çağrıda topla"""
+        result = compile_schema(CARD_SCHEMA).run(self.driver)
+
+        for selector, count in result['counts'].items():
+            print(f"   ✓ '{selector}' ile {count} öğe bulundu")
+        print(f"✅ Toplam {result['total']} içerik kartı tespit edildi")
+
+        for idx, article_data in enumerate(result['items'], 1):
+            # Destinasyon çıkarımı (başlıktan)
+            self._extract_destination(article_data['baslik'])
+
+            article_data['sira'] = idx
+            article_data['tarih'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            self.articles.append(article_data)
+            print(f"   {idx}. {article_data['baslik'][:60]}...")
+
+        # Eski yöntemde her selector denemesi ayrı bir WebDriver isteğiydi
+        print(f"⚡ WebDriver round-trip: 1 (eski yöntemle ≈ {result['probes']})")
+
+    def _analyze_from_snapshot(self):
+        """DOM'u bir kere yakala, kaydet ve analizleri çevrimdışı kopyada çalıştır"""
+        print("\n📸 DOM snapshot alınıyor...")
+        snap = capture_snapshot(self.driver)
+        path = save_snapshot(snap)
+        print(f"✅ Snapshot kaydedildi: {path} ({snap['element_count']} element, {snap['yakalama_ms']} ms)")
+
+        result = analyze_snapshot(snap)
+        self.articles = result['makaleler']
+        self.categories = result['kategoriler']
+        self.destinations = result['destinasyonlar']
+        self.stats = result['istatistikler']
+        self.stats['snapshot_dosyasi'] = path
+
+        print(f"✅ Snapshot analizi: {len(self.articles)} makale, {len(self.categories)} kategori, "
+              f"{self.stats.get('toplam_link', 0)} link ({result['snapshot']['analiz_ms']} ms)")
+
+    def analyze_articles(self, tabs=4, limit=None, timeout=20):
+        """
+        Toplanan makalelerin sayfalarını aynı tarayıcıda çok sekmeyle paralel açar
+        (bkz. tab_pool.py) ve kelime sayısı, alt başlık, meta description bilgisini
+        makale kaydına ekler. Ana sayfa kendi sekmesinde kalır.
+        """
+        targets = [a for a in self.articles if str(a.get('link', '')).startswith("http")][:limit]
+        if not targets:
+            print("⚠️ Açılacak makale linki yok")
+            return
 
-                self.articles.append(article_data)
-                print(f"   {idx}. {article_data['baslik'][:60]}...")
+        def process(driver, url):
+            return analyze_article(parse_snapshot(capture_snapshot(driver)), url)
 
-            except Exception as e:
-                continue
+        print(f"\n🗂️ {len(targets)} makale {tabs} sekmede açılıyor...")
+        executor = TabExecutor(self.driver, tabs=tabs, timeout=timeout, load_profile=self.load_profile)
+        with executor:
+            for result in executor.imap([a['link'] for a in targets], process):
+                article = targets[result['sira']]
+                if result['hata']:
+                    print(f"   ⚠️ {article['baslik'][:50]}... → {result['hata']}")
+                    continue
+                detail = result['sonuc']
+                article['kelime_sayisi'] = detail['kelime_sayisi']
+                article['h2_sayisi'] = len(detail['basliklar']['h2'])
+                article['meta_description'] = detail['meta_description'] or "Bulunamadı"
+                print(f"   ✓ {article['baslik'][:50]}... | {detail['kelime_sayisi']} kelime "
+                      f"({result['yukleme_sn']} sn)")
+
+        counted = [a['kelime_sayisi'] for a in targets if 'kelime_sayisi' in a]
+        if counted:
+            self.stats['ortalama_kelime'] = round(sum(counted) / len(counted))
+        print_tab_report(executor.report())
 
     def _extract_destination(self, text):
         """Metinden destinasyon çıkar (Örn: 'İstanbul', 'Kapadokya')"""
-        # Türkiye'nin popüler destinasyonları
-        destinations = [
-            "İstanbul", "Ankara", "İzmir", "Antalya", "Kapadokya", "Bodrum",
-            "Marmaris", "Fethiye", "Çeşme", "Alanya", "Trabzon", "Bursa",
-            "Konya", "Pamukkale", "Ephesus", "Efes", "Göreme", "Safranbolu",
-            "Mardin", "Şanlıurfa", "Gaziantep", "Kayseri", "Erzurum"
-        ]
-
-        for dest in destinations:
-            if dest.lower() in text.lower():
-                self.destinations.append(dest)
-                return dest
-        return None
+        dest = find_destination(text)
+        if dest:
+            self.destinations.append(dest)
+        return dest
 
     def _analyze_navigation(self):
         """Site navigasyon menüsünü analiz et"""
         try:
-            nav_items = self.driver.find_elements(By.CSS_SELECTOR, "nav a, header a, [class*='menu'] a")
+            nav_items = self.driver.find_elements(By.CSS_SELECTOR, NAV_SELECTOR)
 
             categories_found = []
             for item in nav_items:
                 text = item.text.strip()
-                if text and len(text) > 1 and text not in ['', 'Home', 'Ana Sayfa']:
+                if text and len(text) > 1 and text not in NAV_IGNORED:
                     categories_found.append(text)
 
             self.categories = list(set(categories_found))
@@ -293,32 +285,34 @@ class SeyyahLabAnalyzer:
     def _analyze_links(self):
         """Sayfa linklerini analiz et (SEO önemli!)"""
         try:
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-
-            internal_links = []
-            external_links = []
-            broken_links = []
+            all_links = harvest_links(self.driver)  # Tüm linkler tek istekte
+            groups = classify_links(all_links, self.base_url)
 
-            base_domain = "seyyahlab.com"
-
-            for link in all_links:
-                href = link.get_attribute("href")
-                if not href:
-                    continue
-
-                if base_domain in href or href.startswith("/"):
-                    internal_links.append(href)
-                elif href.startswith("http"):
-                    external_links.append(href)
+            internal_links = [link['url'] for link in groups['ic']]
+            external_links = [link['url'] for link in groups['dis']]
 
             self.stats['toplam_link'] = len(all_links)
             self.stats['ic_link'] = len(set(internal_links))
             self.stats['dis_link'] = len(set(external_links))
+            self.stats['nofollow_link'] = sum(1 for link in all_links if link['nofollow'])
 
             print(f"✅ Link Analizi:")
             print(f"   - Toplam Link: {self.stats['toplam_link']}")
             print(f"   - İç Linkler: {self.stats['ic_link']}")
             print(f"   - Dış Linkler: {self.stats['dis_link']}")
+            print(f"   - Nofollow: {self.stats['nofollow_link']}")
+
+            # Tüm iç/dış linklerin HTTP durumu (HEAD, gerekirse GET; eşzamanlı)
+            # Arşivden oynatmada (çevrimdışı) Python istekleri arşive girmediği için atlanır
+            replay = get_replay(self.driver)
+            if self.check_links and not (replay and replay.mode == "oynat"):
+                self.profiler.set_phase("link_kontrolu")
+                if isinstance(self.check_links, LinkChecker):
+                    results = self.check_links.check_all(internal_links + external_links)
+                else:
+                    results = check_links(internal_links + external_links)
+                self.stats.update(print_link_summary(results))
+                self.broken_links = [r for r in results if r['kirik']]
 
         except Exception as e:
             print(f"⚠️ Link analizi başarısız: {e}")
@@ -345,22 +339,7 @@ class SeyyahLabAnalyzer:
 
     def _calculate_statistics(self):
         """Genel istatistikleri hesapla"""
-        self.stats['toplam_makale'] = len(self.articles)
-        self.stats['toplam_kategori'] = len(self.categories)
-
-        # En popüler destinasyonlar
-        if self.destinations:
-            destination_counts = Counter(self.destinations)
-            self.stats['populer_destinasyonlar'] = dict(destination_counts.most_common(5))
-
-        # Kelime analizi (başlıklardan)
-        all_words = []
-        for article in self.articles:
-            words = re.findall(r'\w+', article['baslik'].lower())
-            all_words.extend([w for w in words if len(w) > 3])  # 3 harften uzun kelimeler
-
-        word_counts = Counter(all_words)
-        self.stats['populer_kelimeler'] = dict(word_counts.most_common(10))
+        calculate_statistics(self.articles, self.categories, self.destinations, self.stats)
 
     def _take_screenshot(self, name):
         """Ekran görüntüsü al"""
@@ -398,11 +377,20 @@ class SeyyahLabAnalyzer:
         # Kategoriler için ayrı sheet
         df_categories = pd.DataFrame({"Kategoriler": self.categories})
 
+        # Kırık linkler (yönlendirme zinciri okunabilir metin olarak)
+        df_broken = pd.DataFrame([
+            {"URL": r['url'], "Durum": r['durum'] or r['hata'], "Yöntem": r['yontem'], "Süre (ms)": r['ms'],
+             "Yönlendirme": " → ".join(f"{h['durum']} {h['url']}" for h in r['yonlendirmeler']),
+             "Son URL": r['son_url']}
+            for r in self.broken_links
+        ], columns=["URL", "Durum", "Yöntem", "Süre (ms)", "Yönlendirme", "Son URL"])
+
         # Excel'e yaz
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
             df_articles.to_excel(writer, sheet_name='Makaleler', index=False)
             df_stats.to_excel(writer, sheet_name='İstatistikler', index=False)
             df_categories.to_excel(writer, sheet_name='Kategoriler', index=False)
+            df_broken.to_excel(writer, sheet_name='Kırık Linkler', index=False)
 
             # Sütun genişliklerini ayarla
             for sheet_name in writer.sheets:
@@ -420,7 +408,7 @@ class SeyyahLabAnalyzer:
                     worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
 
         print(f"✅ Excel kaydedildi: {filename}")
-        print(f"   📊 3 Sheet: Makaleler, İstatistikler, Kategoriler")
+        print(f"   📊 4 Sheet: Makaleler, İstatistikler, Kategoriler, Kırık Linkler")
 
     def save_to_json(self, filename="seyyahlab_data.json"):
         """JSON formatında kaydet"""
@@ -431,6 +419,7 @@ class SeyyahLabAnalyzer:
             "site": "SeyyahLab.com",
             "makaleler": self.articles,
             "kategoriler": self.categories,
+            "kirik_linkler": self.broken_links,
             "istatistikler": self.stats
         }
 
@@ -452,6 +441,12 @@ class SeyyahLabAnalyzer:
             for dest, count in self.stats['populer_destinasyonlar'].items():
                 dest_html += f'<div class="dest-badge">{dest} ({count})</div>'
 
+        # Kırık linkler
+        broken_html = "".join(
+            f'<div class="dest-badge">❌ {r["durum"] or r["hata"]} — {r["url"]}</div>'
+            for r in self.broken_links[:30]
+        )
+
         # Makale kartları
         articles_html = ""
         for article in self.articles[:10]:  # İlk 10 makale
@@ -658,6 +653,17 @@ class SeyyahLabAnalyzer:
                         <h2>{self.stats.get('alt_tag_yok', 0)}</h2>
                         <p>⚠️ Alt Tag Eksik</p>
                     </div>
+                    <div class="stat-card">
+                        <h2>{self.stats.get('kirik_link', '-')}</h2>
+                        <p>❌ Kırık Link ({self.stats.get('kontrol_edilen_link', 0)} kontrol)</p>
+                    </div>
+                </div>
+
+                <div class="section">
+                    <h2>🩺 Kırık Linkler</h2>
+                    <div class="destinations">
+                        {broken_html if broken_html else '<p>Kırık link bulunamadı</p>'}
+                    </div>
                 </div>
 
                 <div class="section">
@@ -681,4 +687,54 @@ class SeyyahLabAnalyzer:
                         Rapor Tipi: SEO + İçerik Analizi | Format: HTML
                     </p>
                 </div>
-            </div>
\ No newline at end of file
+            </div>
+        </body>
+        </html>
+        """
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+
+        print(f"✅ HTML raporu oluşturuldu: {filename}")
+
+    def close(self):
+        """Tarayıcıyı kapat"""
+        if self.driver:
+            print_page_load_report(self.driver)
+            print_archive_report(self.driver)
+            print("\n🔒 Tarayıcı kapatılıyor...")
+            self.driver.quit()
+            print("✅ İşlem tamamlandı!")
+
+
+# ============================================================================
+# ANA PROGRAM - BURADAN ÇALIŞTIR!
+# ============================================================================
+
+def main():
+    """Ana çalıştırma fonksiyonu"""
+    bot = SeyyahLabAnalyzer()
+
+    try:
+        if bot.analyze_homepage():
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            bot.save_to_excel(f"seyyahlab_analiz_{timestamp}.xlsx")
+            bot.save_to_json(f"seyyahlab_data_{timestamp}.json")
+            bot.create_html_report(f"seyyahlab_rapor_{timestamp}.html")
+
+            print("\n" + "=" * 80)
+            print("🎉 ANALİZ TAMAMLANDI!")
+            print("=" * 80)
+        else:
+            print("\n⚠️ Analiz tamamlanamadı.")
+
+    except Exception as e:
+        print(f"\n❌ Kritik Hata: {e}")
+
+    finally:
+        bot.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,14 @@
 import unittest
 import logging
 import datetime
+import functools
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver, preset_settings
+from browser_pool import BrowserPool
 
 
 # =============================================================================
@@ -18,7 +17,12 @@ from webdriver_manager.chrome import ChromeDriverManager
 class Config:
     BASE_URL = "https://www.seyyahlab.com"
     BROWSER_HEADLESS = False  # Tarayıcıyı görmek istiyorsan False yap
+    BROWSER_PRESET = "fast-headless" if BROWSER_HEADLESS else "visual"  # driver_factory ön ayarı
     TIMEOUT = 10  # Saniye cinsinden maksimum bekleme süresi
+    POOL_SIZE = int(os.environ.get("POOL_SIZE", 1))  # Aynı anda sıcak tutulacak tarayıcı sayısı
+    POOL_MAX_USES = int(os.environ.get("POOL_MAX_USES", 10))  # 1 yaparsan eski davranış (her test yeni tarayıcı)
+    POOL_ISOLATION = os.environ.get("POOL_ISOLATION", "context")  # "reset": çerez/depolama temizliği
+    SCREENSHOT_DIR = os.environ.get("TEST_SCREENSHOT_DIR", ".")  # Paralel koşucu her parçaya ayrı klasör verir
 
 
 # Loglama ayarları (Print yerine profesyonel loglama)
@@ -72,9 +76,11 @@ class BasePage:
     def take_screenshot(self, test_name):
         """Hata durumunda ekran görüntüsü alır."""
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"screenshot_{test_name}_{timestamp}.png"
+        os.makedirs(Config.SCREENSHOT_DIR, exist_ok=True)
+        filename = os.path.join(Config.SCREENSHOT_DIR, f"screenshot_{test_name}_{timestamp}.png")
         self.driver.save_screenshot(filename)
         logger.error(f"Ekran görüntüsü kaydedildi: {filename}")
+        return filename
 
 
 # =============================================================================
@@ -109,30 +115,72 @@ class HomePage(BasePage):
 
 
 # =============================================================================
-# 4. TEST SUITE (Test Senaryoları)
+# 4. TARAYICI HAVUZU
+# Her test yeni Chrome açmak yerine havuzdan sıcak bir tarayıcı alır;
+# her test o tarayıcıda kendine ait izole bir bağlamda (çerez/depolama) koşar.
+# =============================================================================
+def tarayici_olustur():
+    return create_driver(Config.BROWSER_PRESET)
+
+
+POOL = BrowserPool(tarayici_olustur, size=Config.POOL_SIZE, max_uses=Config.POOL_MAX_USES,
+                   isolation=Config.POOL_ISOLATION,
+                   load_profile=preset_settings(Config.BROWSER_PRESET)["load_profile"])
+
+
+def tearDownModule():
+    POOL.close()
+    POOL.print_report()
+
+
+# =============================================================================
+# 5. TEST SUITE (Test Senaryoları)
 # unittest kütüphanesi kullanılarak yazılan asıl testler.
 # =============================================================================
 class TestSeyyahLab(unittest.TestCase):
 
+    def run(self, result=None):
+        # Test gövdesi hata verirse ekran görüntüsü, tarayıcı havuza dönmeden (tearDown'dan önce)
+        # alınır; paralel koşucu rapora bu teste bağlı yazar. unittest'in iç sonuç nesnesine bakılmaz.
+        name = self._testMethodName
+        own = name in self.__dict__  # pytest test metodunu örneğe kendisi yazıp sonra siler
+        method = getattr(self, name)
+
+        @functools.wraps(method)
+        def capture_failure():
+            try:
+                return method()
+            except unittest.SkipTest:
+                raise
+            except BaseException:
+                try:
+                    self.screenshot = self.home_page.take_screenshot(name)
+                except Exception as e:
+                    logger.warning(f"Ekran görüntüsü alınamadı: {e}")
+                raise
+
+        setattr(self, name, capture_failure)
+        try:
+            return super().run(result)
+        finally:
+            if own:
+                setattr(self, name, method)
+            else:
+                delattr(self, name)
+
     # Her testten ÖNCE çalışır (Setup)
     def setUp(self):
         logger.info("--- TEST BAŞLIYOR ---")
-        options = Options()
-        if Config.BROWSER_HEADLESS:
-            options.add_argument("--headless")
-        options.add_argument("--window-size=1920,1080")
-
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        self.driver = POOL.acquire()
+        # Temizlik adımı setUp'ın geri kalanı / test / tearDown hata verse de çalışır;
+        # tarayıcı havuza dönmezse sonraki acquire sonsuza kadar bekler
+        self.addCleanup(self._release_driver)
         self.home_page = HomePage(self.driver)
 
-    # Her testten SONRA çalışır (Teardown)
-    def tearDown(self):
-        if self._outcome.errors:
-            # Test başarısız olursa ekran görüntüsü al
-            self.home_page.take_screenshot(self._testMethodName)
-
-        self.driver.quit()
-        logger.info("--- TEST BİTTİ VE TARAYICI KAPATILDI ---\n")
+    # Her testten SONRA çalışır (addCleanup, tearDown'dan sonra)
+    def _release_driver(self):
+        POOL.release(self.driver)
+        logger.info("--- TEST BİTTİ, TARAYICI HAVUZA İADE EDİLDİ ---\n")
 
     # TEST 1: Ana Sayfa Yüklenme ve Başlık Kontrolü
     def test_homepage_load_and_title(self):
@@ -0,0 +1,241 @@
+"""
+🕸️ ÇOKLU SİTE TARAMA (SeyyahLabAnalyzer için Toplu Mod)
+Senaryo: "Analiz botu tek URL, tek tarayıcı. 30 sitelik listeyi sırayla taramak
+          yarım saat sürüyor. Listeyi N tarayıcılı bir işçi havuzuna dağıt,
+          her siteye ana sayfa analizini uygula, sonuçları tek raporda birleştir;
+          dakikada kaç sayfa işlendiğini ve her işçinin ne kadar dolu çalıştığını göster!"
+
+Her işçi kendi SeyyahLabAnalyzer'ını (= kendi tarayıcısını) bir kere açar ve
+ortak kuyruktan URL çektikçe aynı tarayıcıyla analiz eder; tarayıcı açılışı
+site başına değil işçi başına ödenir. Kırık link kontrolü tüm işçilerde tek bir
+LinkChecker'dan geçer; host başına eşzamanlılık limiti işçi sayısıyla katlanmaz.
+
+Kullanım:
+    python batch_crawl.py https://www.seyyahlab.com https://www.seyyahlab.com/blog
+    python batch_crawl.py --dosya siteler.txt --isci 4 --cikti toplu_analiz.json
+    python batch_crawl.py --dosya siteler.txt --on-ayar visual --snapshot
+
+    from batch_crawl import crawl_sites, print_batch_report
+    rapor = crawl_sites(["https://a.com", "https://b.com"], workers=3)
+    print_batch_report(rapor)
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+
+from asdasdas import SeyyahLabAnalyzer
+from content_rules import calculate_statistics
+from link_checker import LinkChecker
+
+# Siteler arasında toplanabilen sayısal istatistikler
+SUMMED_STATS = [
+    "toplam_link", "ic_link", "dis_link", "nofollow_link",
+    "toplam_gorsel", "alt_tag_var", "alt_tag_yok",
+]
+
+
+def read_urls(path):
+    """Her satırında bir URL olan dosyayı okur ('#' ile başlayan satırlar yorum)."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _worker(worker_id, jobs, results, worker_stats, analyzer_kwargs, snapshot):
+    """Kuyruk boşalana kadar URL çeker; tarayıcısını sadece bir kere açar."""
+    stats = worker_stats[worker_id]
+    start = time.perf_counter()
+    try:
+        analyzer = SeyyahLabAnalyzer(**analyzer_kwargs)
+    except Exception as e:
+        print(f"❌ İşçi {worker_id}: tarayıcı açılamadı ({e})")
+        stats["hata"] = str(e)
+        return
+    stats["acilis_sn"] = time.perf_counter() - start
+
+    try:
+        while True:
+            try:
+                index, url = jobs.get_nowait()
+            except queue.Empty:
+                break
+
+            page_start = time.perf_counter()
+            try:
+                ok = analyzer.analyze_homepage(url, snapshot=snapshot)
+                error = None if ok else "analiz tamamlanamadı"
+            except Exception as e:
+                ok, error = False, str(e)
+            duration = time.perf_counter() - page_start
+
+            stats["sayfa"] += 1
+            stats["mesgul_sn"] += duration
+            results[index] = {
+                "url": url,
+                "basarili": ok,
+                "hata": error,
+                "isci": worker_id,
+                "sure_sn": round(duration, 2),
+                "makaleler": list(analyzer.articles),
+                "kategoriler": list(analyzer.categories),
+                "destinasyonlar": list(analyzer.destinations),
+                "istatistikler": dict(analyzer.stats),
+            }
+            durum = "✅" if ok else "⚠️"
+            print(f"{durum} [işçi {worker_id}] {url} → {len(analyzer.articles)} makale ({duration:.1f} sn)")
+    finally:
+        analyzer.close()
+
+
+def merge_results(results):
+    """Site sonuçlarını tek makale / kategori / istatistik setinde birleştirir."""
+    articles, categories, destinations = [], [], []
+    stats = {key: 0 for key in SUMMED_STATS}
+    seen_categories = set()
+
+    for result in results:
+        if not result["basarili"]:
+            continue
+        for article in result["makaleler"]:
+            articles.append(dict(article, site=result["url"], sira=len(articles) + 1))
+        for category in result["kategoriler"]:
+            if category not in seen_categories:
+                seen_categories.add(category)
+                categories.append(category)
+        destinations.extend(result["destinasyonlar"])
+        for key in SUMMED_STATS:
+            stats[key] += result["istatistikler"].get(key, 0) or 0
+
+    calculate_statistics(articles, categories, destinations, stats)
+    return articles, categories, stats
+
+
+def crawl_sites(urls, workers=3, preset="extraction", snapshot=False, **analyzer_kwargs):
+    """
+    URL listesini işçi havuzunda analiz eder ve birleşik raporu döner.
+
+    Args:
+        urls: Analiz edilecek adresler (sıra raporda korunur)
+        workers: Aynı anda açık tarayıcı sayısı (URL sayısından fazla açılmaz)
+        preset: driver_factory ön ayarı (varsayılan: görünmez + ağır kaynaklar engelli)
+        snapshot: True ise her sitede analizler DOM kopyası üzerinde çalışır
+        analyzer_kwargs: SeyyahLabAnalyzer'a geçen diğer ayarlar (profile, load_profile, check_links=False...)
+    """
+    urls = list(urls)
+    workers = max(1, min(workers, len(urls)))
+    jobs = queue.Queue()
+    for index, url in enumerate(urls):
+        jobs.put((index, url))
+
+    results = [None] * len(urls)
+    worker_stats = {i: {"sayfa": 0, "mesgul_sn": 0.0, "acilis_sn": 0.0} for i in range(1, workers + 1)}
+    analyzer_kwargs["preset"] = preset
+    link_checker = None
+    if analyzer_kwargs.get("check_links", True) is True:
+        link_checker = analyzer_kwargs["check_links"] = LinkChecker()
+
+    print(f"🕸️ {len(urls)} site, {workers} işçi ile taranıyor (ön ayar: {preset})...")
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=_worker, name=f"crawl-{i}", daemon=True,
+                         args=(i, jobs, results, worker_stats, analyzer_kwargs, snapshot))
+        for i in worker_stats
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+    if link_checker is not None:
+        link_checker.close()
+
+    # Tüm işçiler düştüyse kuyrukta kalanlar başarısız sayılır
+    for index, url in enumerate(urls):
+        if results[index] is None:
+            results[index] = {"url": url, "basarili": False, "hata": "işlenmedi", "isci": None, "sure_sn": 0,
+                              "makaleler": [], "kategoriler": [], "destinasyonlar": [], "istatistikler": {}}
+
+    articles, categories, stats = merge_results(results)
+    done = sum(1 for r in results if r["basarili"])
+    return {
+        "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "siteler": [dict({key: r[key] for key in ("url", "basarili", "hata", "isci", "sure_sn")},
+                         makale=len(r["makaleler"])) for r in results],
+        "makaleler": articles,
+        "kategoriler": categories,
+        "istatistikler": stats,
+        "verim": {
+            "isci": workers,
+            "site": len(urls),
+            "basarili": done,
+            "toplam_sure_sn": round(wall, 2),
+            "sayfa_dakika": round(len(urls) / wall * 60, 2) if wall else 0,
+            "sirali_tahmini_sn": round(sum(r["sure_sn"] for r in results), 2),
+            "isciler": {
+                worker_id: {
+                    "sayfa": s["sayfa"],
+                    "acilis_sn": round(s["acilis_sn"], 2),
+                    "mesgul_sn": round(s["mesgul_sn"], 2),
+                    "doluluk": round(s["mesgul_sn"] / wall * 100, 1) if wall else 0,
+                    **({"hata": s["hata"]} if "hata" in s else {}),
+                }
+                for worker_id, s in worker_stats.items()
+            },
+        },
+    }
+
+
+def save_batch_report(report, filename="toplu_analiz.json"):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📁 JSON: {filename}")
+
+
+def print_batch_report(report):
+    verim = report["verim"]
+    stats = report["istatistikler"]
+    print("\n" + "=" * 70)
+    print("🕸️ TOPLU TARAMA RAPORU")
+    print("=" * 70)
+    for site in report["siteler"]:
+        durum = "✅" if site["basarili"] else "❌"
+        print(f"   {durum} {site['url'][:50]:<50} | işçi {site['isci'] or '-'} | "
+              f"{site['makale']} makale | {site['sure_sn']} sn")
+    print("-" * 70)
+    print(f"   Makale: {stats['toplam_makale']} | Kategori: {stats['toplam_kategori']} | "
+          f"Link: {stats['toplam_link']} | Görsel: {stats['toplam_gorsel']}")
+    print(f"   ⏱ {verim['basarili']}/{verim['site']} site, {verim['toplam_sure_sn']} sn "
+          f"(sıralı tahmini {verim['sirali_tahmini_sn']} sn) → {verim['sayfa_dakika']} sayfa/dk")
+    for worker_id, s in verim["isciler"].items():
+        ek = f" ❌ {s['hata']}" if "hata" in s else ""
+        print(f"   👷 İşçi {worker_id}: {s['sayfa']} sayfa, açılış {s['acilis_sn']} sn, "
+              f"meşgul {s['mesgul_sn']} sn (%{s['doluluk']}){ek}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SeyyahLabAnalyzer ile çoklu site taraması")
+    parser.add_argument("urls", nargs="*", help="Analiz edilecek adresler")
+    parser.add_argument("--dosya", help="Her satırında bir URL olan dosya")
+    parser.add_argument("--isci", type=int, default=3, help="Paralel tarayıcı sayısı")
+    parser.add_argument("--on-ayar", default="extraction", help="driver_factory ön ayarı")
+    parser.add_argument("--snapshot", action="store_true", help="Analizleri DOM kopyası üzerinde çalıştır")
+    parser.add_argument("--cikti", default="toplu_analiz.json", help="JSON çıktı dosyası")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.dosya:
+        urls.extend(read_urls(args.dosya))
+    if not urls:
+        urls = [SeyyahLabAnalyzer.BASE_URL]
+
+    report = crawl_sites(urls, workers=args.isci, preset=args.on_ayar, snapshot=args.snapshot)
+    print_batch_report(report)
+    save_batch_report(report, args.cikti)
+
+
+if __name__ == "__main__":
+    main()
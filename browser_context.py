@@ -0,0 +1,164 @@
+"""
+🧪 İZOLE TARAYICI BAĞLAMLARI (Target.createBrowserContext)
+Senaryo: "Temiz oturum için her işe / teste yeni Chrome süreci açıyoruz (saniyeler).
+          Aynı tarayıcı sürecinde DevTools ile ayrı bir bağlam aç: kendi çerezi,
+          localStorage'ı, önbelleği olsun; milisaniyede açılsın, iş bitince
+          içindeki sekmelerle birlikte silinsin!"
+
+Bağlam, gizli (incognito) pencere gibi davranır: çerez / depolama / önbellek
+diğer bağlamlarla ve tarayıcının varsayılan profiliyle paylaşılmaz. Bağlamın ilk
+sekmesi Target.createTarget ile açılır; chromedriver'da pencere kimliği (handle)
+hedefin targetId'sidir, yani sürücü bu sekmeye normal switch_to.window ile geçer.
+
+Kullanım:
+    from browser_context import BrowserContexts
+
+    contexts = BrowserContexts(driver)
+    with contexts.isolated() as ctx:      # sürücü bağlamın sekmesine geçer
+        driver.get("https://www.seyyahlab.com")
+    # çıkışta bağlam silinir, sürücü önceki sekmesine döner
+    contexts.print_report()
+
+    BrowserPool(create_driver, isolation="context")   # havuzda testler arası sıfırlama yerine
+
+Açılış süresi karşılaştırması:
+    python browser_context.py 10
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+from resource_blocking import apply_load_profile
+
+
+class BrowserContexts:
+    """Tek bir sürücü üzerinde izole bağlam açma / silme ve süre ölçümü."""
+
+    def __init__(self, driver, window_size=None, load_profile="full"):
+        """
+        Args:
+            driver: Chrome / Chromium WebDriver (CDP destekli)
+            window_size: (genişlik, yükseklik) - görünmez modda bağlam sekmesinin boyutu
+            load_profile: "extraction" ise engelleme listesi bağlam sekmesine de verilir
+                          (DevTools ayarları sekme başınadır, yeni sekmeye taşınmaz)
+        """
+        self.driver = driver
+        self.window_size = window_size
+        self.load_profile = load_profile
+        self.active = {}  # context_id -> bağlam bilgisi
+        self.stats = {"acilan": 0, "silinen": 0, "acilis_ms": 0.0, "silme_ms": 0.0}
+
+    def _handle_of(self, target_id):
+        """targetId'ye karşılık gelen pencere kimliği (eski sürücülerde 'CDwindow-' önekli)."""
+        for handle in self.driver.window_handles:
+            if handle == target_id or handle.endswith(target_id):
+                return handle
+        raise RuntimeError(f"Bağlam sekmesi sürücüde görünmüyor: {target_id}")
+
+    def create(self, url="about:blank"):
+        """
+        Yeni izole bağlam ve içinde bir sekme açar (sürücü sekmeye geçmez).
+
+        Returns:
+            {"context_id", "target_id", "handle", "onceki_handle", "acilis_ms"}
+        """
+        start = time.perf_counter()
+        context_id = self.driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+        params = {"url": url, "browserContextId": context_id}
+        if self.window_size:
+            params["width"], params["height"] = self.window_size
+        try:
+            target_id = self.driver.execute_cdp_cmd("Target.createTarget", params)["targetId"]
+            handle = self._handle_of(target_id)
+        except Exception:
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            raise
+        duration = (time.perf_counter() - start) * 1000
+
+        context = {"context_id": context_id, "target_id": target_id, "handle": handle,
+                   "onceki_handle": None, "acilis_ms": round(duration, 1)}
+        self.active[context_id] = context
+        self.stats["acilan"] += 1
+        self.stats["acilis_ms"] += duration
+        return context
+
+    def enter(self, context):
+        """Sürücüyü bağlamın sekmesine geçirir (çıkışta dönülecek sekme saklanır)."""
+        try:
+            context["onceki_handle"] = self.driver.current_window_handle
+        except Exception:
+            context["onceki_handle"] = None
+        self.driver.switch_to.window(context["handle"])
+        apply_load_profile(self.driver, self.load_profile)
+        return context
+
+    def dispose(self, context):
+        """Bağlamı içindeki tüm sekmeler, çerezler ve depolamayla birlikte siler."""
+        if self.active.pop(context["context_id"], None) is None:
+            return
+        start = time.perf_counter()
+        # Silinecek sekmede kalınırsa sonraki CDP / WebDriver komutları hedefsiz kalır
+        remaining = [h for h in self.driver.window_handles if h != context["handle"]]
+        back = context["onceki_handle"] if context["onceki_handle"] in remaining else (remaining or [None])[0]
+        if back:
+            self.driver.switch_to.window(back)
+        self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context["context_id"]})
+        self.stats["silinen"] += 1
+        self.stats["silme_ms"] += (time.perf_counter() - start) * 1000
+
+    def dispose_all(self):
+        for context in list(self.active.values()):
+            self.dispose(context)
+
+    @contextmanager
+    def isolated(self, url="about:blank"):
+        """with bloğu boyunca sürücü yeni bir izole bağlamda çalışır; çıkışta bağlam silinir."""
+        context = self.enter(self.create(url))
+        try:
+            yield context
+        finally:
+            self.dispose(context)
+
+    def report(self):
+        opened, disposed = self.stats["acilan"], self.stats["silinen"]
+        return {
+            "acilan_baglam": opened,
+            "silinen_baglam": disposed,
+            "ortalama_acilis_ms": round(self.stats["acilis_ms"] / opened, 1) if opened else 0.0,
+            "ortalama_silme_ms": round(self.stats["silme_ms"] / disposed, 1) if disposed else 0.0,
+        }
+
+    def print_report(self):
+        r = self.report()
+        print(f"🧪 İzole bağlam: {r['acilan_baglam']} açıldı, {r['silinen_baglam']} silindi | "
+              f"ortalama açılış {r['ortalama_acilis_ms']} ms, silme {r['ortalama_silme_ms']} ms")
+
+
+def main():
+    """Tarayıcı süreci açılışı ile izole bağlam açılışını karşılaştırır."""
+    from driver_factory import create_driver
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    start = time.perf_counter()
+    driver = create_driver("fast-headless")
+    launch = time.perf_counter() - start
+    print(f"🚀 Tarayıcı süreci açılışı: {launch:.2f} sn")
+
+    try:
+        contexts = BrowserContexts(driver)
+        for n in range(1, count + 1):
+            with contexts.isolated() as ctx:
+                pass
+            print(f"   {n}. bağlam: {ctx['acilis_ms']} ms")
+        contexts.print_report()
+        avg = contexts.report()["ortalama_acilis_ms"]
+        if avg:
+            print(f"⚡ Bağlam açılışı süreç açılışından ~{launch * 1000 / avg:.0f}x hızlı")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+♻️ SICAK TARAYICI HAVUZU (Warm Browser Pool)
+Senaryo: "Her test için Chrome'u aç-kapat yapma! N tane tarayıcıyı sıcak tut,
+          teste ver, test bitince temizle ve havuza geri koy."
+
+Kullanım (unittest):
+    POOL = BrowserPool(create_driver, size=2, max_uses=10)
+
+    def setUp(self):
+        self.driver = POOL.acquire()
+
+    def tearDown(self):
+        POOL.release(self.driver)
+
+    def tearDownModule():
+        POOL.close()
+        POOL.print_report()
+
+Tarayıcı geri verilirken kapatılmaz; tüm çerezler (DevTools ile tarayıcı genelinde)
+ve test sırasında dokunulan origin'lerin depolaması silinir, pencere boyutu
+sıfırlanır ve about:blank açılır. `max_uses`
+kullanımdan sonra tarayıcı kapatılıp yerine yenisi açılır (bellek şişmesin).
+
+isolation="context": Her teslimde aynı tarayıcı sürecinde yeni bir izole bağlam
+(bkz. browser_context.py) açılır, iadede bağlam tümüyle silinir. Origin toplayıp
+depolama temizlemeye gerek kalmaz; hiç çerez bırakmamış origin'lerin depolaması,
+HTTP önbelleği ve service worker'lar da bağlamla birlikte gider.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from browser_context import BrowserContexts
+
+logger = logging.getLogger(__name__)
+
+# sessionStorage sekme başınadır ve DevTools'un origin temizliğinde yer almaz
+RESET_SESSION_STORAGE_JS = "try { window.sessionStorage.clear(); } catch (e) {}"
+
+
+def touched_origins(driver):
+    """Sıfırlanacak origin'ler: açık sayfa ve iframe'leri + çerezi olan tüm alan adları."""
+    origins = set()
+    frames = [driver.execute_cdp_cmd("Page.getFrameTree", {})["frameTree"]]
+    while frames:
+        node = frames.pop()
+        origin = node["frame"].get("securityOrigin", "")
+        if origin.startswith("http"):
+            origins.add(origin)
+        frames.extend(node.get("childFrames", []))
+    for cookie in driver.execute_cdp_cmd("Storage.getCookies", {})["cookies"]:
+        host = cookie["domain"].lstrip(".")
+        origins.update((f"https://{host}", f"http://{host}"))
+    return origins
+
+
+class BrowserPool:
+    """Sabit boyutlu, yeniden kullanılabilir WebDriver havuzu."""
+
+    def __init__(self, driver_factory, size=1, max_uses=20, window_size=(1920, 1080), isolation="reset",
+                 load_profile="full"):
+        """
+        Args:
+            driver_factory: Parametresiz çağrılınca yeni bir WebDriver döndüren fonksiyon
+            size: Havuzda aynı anda tutulacak tarayıcı sayısı
+            max_uses: Bir tarayıcı kaç testten sonra yenilensin
+            window_size: Sıfırlamada uygulanacak pencere boyutu (None ise dokunulmaz)
+            isolation: "reset" (çerez/depolama temizliği) | "context" (teslim başına izole bağlam)
+            load_profile: "context" modunda bağlam sekmelerine uygulanacak yükleme profili
+        """
+        if isolation not in ("reset", "context"):
+            raise ValueError(f"Bilinmeyen izolasyon modu: {isolation} (seçenekler: reset, context)")
+        self.driver_factory = driver_factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.window_size = window_size
+        self.isolation = isolation
+        self.load_profile = load_profile
+        self._contexts = {}  # id(driver) -> BrowserContexts
+        self._leases = {}  # id(driver) -> teslimdeki açık bağlam
+
+        self._idle = queue.Queue()
+        self._uses = {}  # id(driver) -> kullanım sayısı
+        self._created = 0
+        self._lock = threading.Lock()
+
+        # Rapor için ölçümler
+        self.stats = {
+            "acilan_tarayici": 0,
+            "acilis_suresi": 0.0,
+            "teslim": 0,
+            "sifirlama_suresi": 0.0,
+            "yenilenen": 0,
+            "baglam_suresi": 0.0,
+        }
+        self._started_at = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    # Tarayıcı yaşam döngüsü
+    # ------------------------------------------------------------------
+    def _launch(self):
+        start = time.perf_counter()
+        driver = self.driver_factory()
+        duration = time.perf_counter() - start
+
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.stats["acilan_tarayici"] += 1
+            self.stats["acilis_suresi"] += duration
+        logger.info(f"Havuza yeni tarayıcı eklendi ({duration:.2f} sn)")
+        return driver
+
+    def _retire(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._contexts.pop(id(driver), None)
+            self._leases.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _reset(self, driver):
+        """Bir sonraki test temiz bir oturum görsün diye tarayıcıyı sıfırlar."""
+        start = time.perf_counter()
+        try:
+            # Test yeni sekme açtıysa fazlalıkları kapat
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # delete_all_cookies / localStorage.clear sadece açık sayfanın alan adına etki eder;
+            # yönlendirme, alt alan adı ve üçüncü taraf origin'lerde kalanlar da silinsin
+            driver.execute_script(RESET_SESSION_STORAGE_JS)
+            for origin in touched_origins(driver):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+            if self.window_size:
+                driver.set_window_size(*self.window_size)
+            ok = True
+        except Exception as e:
+            logger.warning(f"Tarayıcı sıfırlanamadı, havuzdan çıkarılıyor: {e}")
+            ok = False
+
+        with self._lock:
+            self.stats["sifirlama_suresi"] += time.perf_counter() - start
+        return ok
+
+    def _open_context(self, driver):
+        """Teslim edilen tarayıcıda yeni bir izole bağlam açar ve sürücüyü ona geçirir."""
+        contexts = self._contexts.get(id(driver))
+        if contexts is None:
+            contexts = self._contexts[id(driver)] = BrowserContexts(
+                driver, window_size=self.window_size, load_profile=self.load_profile)
+        start = time.perf_counter()
+        self._leases[id(driver)] = contexts.enter(contexts.create())
+        with self._lock:
+            self.stats["baglam_suresi"] += time.perf_counter() - start
+
+    def _close_context(self, driver):
+        """Teslimdeki bağlamı (test açtıysa diğer sekmeleriyle birlikte) siler."""
+        context = self._leases.pop(id(driver), None)
+        if context is None:
+            return True
+        start = time.perf_counter()
+        try:
+            self._contexts[id(driver)].dispose(context)
+            ok = True
+        except Exception as e:
+            logger.warning(f"Bağlam silinemedi, tarayıcı havuzdan çıkarılıyor: {e}")
+            ok = False
+        with self._lock:
+            self.stats["baglam_suresi"] += time.perf_counter() - start
+        return ok
+
+    # ------------------------------------------------------------------
+    # Dış API
+    # ------------------------------------------------------------------
+    def acquire(self, timeout=None):
+        """Havuzdan boşta bir tarayıcı alır; yoksa ve limit dolmadıysa yenisini açar."""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = None
+            with self._lock:
+                can_launch = self._created < self.size
+                if can_launch:
+                    self._created += 1
+            if can_launch:
+                try:
+                    driver = self._launch()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                driver = self._idle.get(timeout=timeout)
+
+        if self.isolation == "context":
+            try:
+                self._open_context(driver)
+            except Exception:
+                self._retire(driver)
+                raise
+
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            self.stats["teslim"] += 1
+        return driver
+
+    def release(self, driver):
+        """Tarayıcıyı kapatmadan havuza geri koyar (gerekirse yeniler)."""
+        if driver is None:
+            return
+
+        worn_out = self._uses.get(id(driver), 0) >= self.max_uses
+        if self.isolation == "context":
+            clean = self._close_context(driver)
+        else:
+            clean = self._reset(driver)
+        if worn_out or not clean:
+            self._retire(driver)
+            with self._lock:
+                self.stats["yenilenen"] += 1
+            return
+
+        self._idle.put(driver)
+
+    def close(self):
+        """Havuzdaki tüm tarayıcıları kapatır."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(driver)
+
+    # ------------------------------------------------------------------
+    # Raporlama
+    # ------------------------------------------------------------------
+    def report(self):
+        """
+        Havuzun kazandırdığı süreyi hesaplar.
+
+        'havuzsuz_tahmini_sn': Her test kendi tarayıcısını açsaydı geçecek süre
+        (toplam süite ortalama açılış süresi x (teslim - açılan) eklenir).
+        """
+        wall = time.perf_counter() - self._started_at
+        launched = self.stats["acilan_tarayici"]
+        avg_launch = self.stats["acilis_suresi"] / launched if launched else 0.0
+        avoided = max(0, self.stats["teslim"] - launched)
+
+        return {
+            "havuz_boyutu": self.size,
+            "teslim_edilen": self.stats["teslim"],
+            "acilan_tarayici": launched,
+            "yenilenen": self.stats["yenilenen"],
+            "ortalama_acilis_sn": round(avg_launch, 3),
+            "izolasyon": self.isolation,
+            "toplam_sifirlama_sn": round(self.stats["sifirlama_suresi"], 3),
+            "toplam_baglam_sn": round(self.stats["baglam_suresi"], 3),
+            "havuzlu_sure_sn": round(wall, 3),
+            "havuzsuz_tahmini_sn": round(wall + avoided * avg_launch - self.stats["sifirlama_suresi"]
+                                         - self.stats["baglam_suresi"], 3),
+        }
+
+    def print_report(self):
+        r = self.report()
+        print("=" * 60)
+        print("♻️  TARAYICI HAVUZU RAPORU")
+        print("=" * 60)
+        print(f"   Havuz boyutu         : {r['havuz_boyutu']}")
+        print(f"   Teslim edilen oturum : {r['teslim_edilen']}")
+        print(f"   Açılan tarayıcı      : {r['acilan_tarayici']} (yenilenen: {r['yenilenen']})")
+        print(f"   Ortalama açılış      : {r['ortalama_acilis_sn']} sn")
+        if r["izolasyon"] == "context" and r["teslim_edilen"]:
+            print(f"   İzole bağlam (aç+sil): ortalama {r['toplam_baglam_sn'] / r['teslim_edilen'] * 1000:.0f} ms")
+        print(f"   Süit süresi (havuzlu): {r['havuzlu_sure_sn']} sn")
+        print(f"   Süit süresi (havuzsuz, tahmini): {r['havuzsuz_tahmini_sn']} sn")
+        print("=" * 60)
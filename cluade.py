@@ -1,10 +1,8 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
+from link_harvest import harvest_links
 from datetime import datetime
 import os
 
@@ -22,18 +20,10 @@ def run_professional_automation():
         print("🚀 OTOMASYON BAŞLIYOR...")
         print("=" * 60)
 
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")  # Tam ekran başlat
-        chrome_options.add_argument("--incognito")  # Gizli mod (temiz oturum)
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")  # Bot tespitini zorlaştır
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Bot tespiti bayrakları ön ayarda; her açılış zaten boş (geçici) bir profille başlar
+        driver = create_driver("visual")
 
-        # WebDriver Manager ile otomatik driver yönetimi
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-
-        print("✅ Tarayıcı başarıyla başlatıldı (Gizli Mod, Tam Ekran)")
+        print("✅ Tarayıcı başarıyla başlatıldı (visual ön ayarı)")
 
         # ADIM 2: Hedef Siteye Git ve Yüklenmeyi Bekle
         target_url = "https://www.seyyahlab.com"
@@ -54,11 +44,12 @@ def run_professional_automation():
         # Tüm linklerin yüklenmesini bekle
         wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "a")))
 
-        all_links = driver.find_elements(By.TAG_NAME, "a")
+        # Tüm linkleri tek JavaScript çağrısıyla al (link başına istek atmadan)
+        all_links = harvest_links(driver)
         total_links = len(all_links)
 
         # Detaylı analiz
-        valid_links = [link for link in all_links if link.get_attribute("href")]
+        valid_links = [link for link in all_links if link["href"]]
         empty_links = total_links - len(valid_links)
 
         print(f"✅ Toplam Link Sayısı: {total_links}")
@@ -69,8 +60,8 @@ def run_professional_automation():
         if len(valid_links) > 0:
             print("\n📌 İlk 5 Geçerli Link Örneği:")
             for i, link in enumerate(valid_links[:5], 1):
-                href = link.get_attribute("href")
-                text = link.text.strip() or "[Metin Yok]"
+                href = link["url"] or link["href"]
+                text = link["text"] or "[Metin Yok]"
                 print(f"   {i}. {text[:50]} -> {href[:60]}...")
 
         # ADIM 4: Kullanıcı Gibi Davran - Sayfayı Scroll Et
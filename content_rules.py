@@ -0,0 +1,78 @@
+"""
+📐 SEYYAHLAB İÇERİK KURALLARI
+Canlı tarayıcı analizi (asdasdas.py) ile statik HTML analizi (static_analyzer.py)
+aynı selector zincirlerini ve aynı istatistik hesaplarını kullansın diye
+tek yerde toplanmıştır. Buradaki bir değişiklik iki motoru birlikte etkiler.
+"""
+
+import re
+from collections import Counter
+
+# İçerik kartı selector zincirleri (sıra önemli: ilk eşleşen kazanır)
+CARD_SELECTORS = [
+    "article",
+    "[class*='card']",
+    "[class*='post']",
+    "[class*='content']",
+    ".blog-item",
+    "[class*='article']"
+]
+CARD_TITLE_SELECTORS = ["h1", "h2", "h3", "[class*='title']", "a"]
+CARD_TEXT_SELECTORS = ["p", "[class*='excerpt']", "[class*='description']", "[class*='summary']"]
+CARD_TAG_SELECTORS = ["[class*='category']", "[class*='tag']", "[class*='label']", "span"]
+CARD_LIMIT = 20  # İlk 20 kart
+
+# İçerik kartı çıkarım şeması (bkz. extraction_schema.py)
+CARD_SCHEMA = {
+    "name": "seyyahlab_kart",
+    "container": CARD_SELECTORS,
+    "container_mode": "union",
+    "limit": CARD_LIMIT,
+    "fields": {
+        "baslik": {"selectors": CARD_TITLE_SELECTORS, "min_length": 5, "max_length": 150, "required": True},
+        "link": {"selectors": ["a"], "attr": "href", "default": "Link bulunamadı"},
+        "ozet": {"selectors": CARD_TEXT_SELECTORS, "min_length": 20, "max_length": 200},
+        "gorsel": {"selectors": ["img"], "attr": ["src", "data-src"], "default": "Görsel yok"},
+        "kategori": {"selectors": CARD_TAG_SELECTORS, "all": 3},
+    },
+}
+
+NAV_SELECTOR = "nav a, header a, [class*='menu'] a"
+NAV_IGNORED = ['', 'Home', 'Ana Sayfa']
+
+# Türkiye'nin popüler destinasyonları
+DESTINATIONS = [
+    "İstanbul", "Ankara", "İzmir", "Antalya", "Kapadokya", "Bodrum",
+    "Marmaris", "Fethiye", "Çeşme", "Alanya", "Trabzon", "Bursa",
+    "Konya", "Pamukkale", "Ephesus", "Efes", "Göreme", "Safranbolu",
+    "Mardin", "Şanlıurfa", "Gaziantep", "Kayseri", "Erzurum"
+]
+
+
+def find_destination(text):
+    """Metinden destinasyon çıkar (Örn: 'İstanbul', 'Kapadokya')"""
+    for dest in DESTINATIONS:
+        if dest.lower() in text.lower():
+            return dest
+    return None
+
+
+def calculate_statistics(articles, categories, destinations, stats):
+    """Makale/kategori/destinasyon listelerinden genel istatistikleri 'stats' içine yazar."""
+    stats['toplam_makale'] = len(articles)
+    stats['toplam_kategori'] = len(categories)
+
+    # En popüler destinasyonlar
+    if destinations:
+        destination_counts = Counter(destinations)
+        stats['populer_destinasyonlar'] = dict(destination_counts.most_common(5))
+
+    # Kelime analizi (başlıklardan)
+    all_words = []
+    for article in articles:
+        words = re.findall(r'\w+', article['baslik'].lower())
+        all_words.extend([w for w in words if len(w) > 3])  # 3 harften uzun kelimeler
+
+    word_counts = Counter(all_words)
+    stats['populer_kelimeler'] = dict(word_counts.most_common(10))
+    return stats
@@ -0,0 +1,191 @@
+"""
+♻️ ARTIMLI TARAMA DURUMU (Koşullu İstek + Değişiklik Tespiti)
+Senaryo: "Analizi her çalıştırdığımızda hiçbir şey değişmemiş olsa bile 300 sayfayı
+          yeniden indirip yeniden ayrıştırıyoruz. Her URL için ETag, Last-Modified,
+          içerik özeti ve son analiz zamanını sakla; sonraki koşuda koşullu istek at,
+          değişmeyen sayfayı hiç işleme, sadece içeriği değişeni yeniden analiz et!"
+
+Her sayfa üç kapıdan geçer:
+    1. Koşullu istek (If-None-Match / If-Modified-Since) → 304 ise gövde bile inmez
+    2. 200 geldiyse içerik özeti (sha256) öncekiyle aynı mı → aynıysa ayrıştırılmaz
+    3. Özet farklı (veya sayfa yeni) → analiz edilir, sonuç ve özet saklanır
+Atlanan sayfaların sonucu önceki koşudan gelir; rapor tam kalır.
+
+İçerik özeti alınmadan önce HTML'deki yorumlar, nonce / csrf değerleri ve boşluklar
+normalize edilir (her istekte değişen bu parçalar "değişti" sayılmasın).
+
+Durum dosyası (site başına):
+    ~/.cache/selenium-otomasyon/tarama_durumu/<alan_adi>.json
+
+Kullanım:
+    from crawl_state import CrawlState, conditional_get
+
+    state = CrawlState.for_site("https://www.seyyahlab.com")
+    kind, response, cached = conditional_get(session, state, url)
+    if kind in ("yeni", "degisti"):
+        sonuc = analiz_et(response.text)
+        state.store(url, response, sonuc, sure_ms)
+    state.save()
+    state.print_report()
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from driver_cache import CACHE_DIR
+
+STATE_DIR = os.path.join(CACHE_DIR, "tarama_durumu")
+
+# Özetten önce atılan, her istekte değişen parçalar
+VOLATILE_PATTERNS = [
+    re.compile(rb"<!--.*?-->", re.S),
+    re.compile(rb'\s(?:nonce|data-nonce|integrity)="[^"]*"', re.I),
+    re.compile(rb'(name="(?:csrf[-_]?token|_token|__RequestVerificationToken)"\s+(?:content|value)=)"[^"]*"', re.I),
+]
+WHITESPACE = re.compile(rb"\s+")
+
+# Sayfa başına sonucun nasıl üretildiği
+KINDS = {
+    "yeni": "İlk kez analiz edildi",
+    "degisti": "İçerik değişti, yeniden analiz edildi",
+    "304": "Sunucu 304 döndü (indirilmedi)",
+    "ayni": "İndirildi ama içerik aynı (ayrıştırılmadı)",
+}
+
+
+def content_digest(body):
+    """Gürültüsü atılmış HTML gövdesinin sha256 özeti."""
+    for pattern in VOLATILE_PATTERNS:
+        body = pattern.sub(lambda m: m.group(1) + b'""' if m.lastindex else b"", body)
+    return hashlib.sha256(WHITESPACE.sub(b" ", body).strip()).hexdigest()
+
+
+class CrawlState:
+    """URL başına koşullu istek başlıkları, içerik özeti ve son analiz sonucu."""
+
+    def __init__(self, path, fresh=False):
+        """
+        Args:
+            path: Durum dosyası (JSON)
+            fresh: True ise eski durum okunmaz; her sayfa yeniden analiz edilip durum baştan yazılır
+        """
+        self.path = path
+        self.pages = {}
+        self.counts = {kind: 0 for kind in KINDS}
+        self.saved_ms = 0.0
+        self._lock = threading.Lock()
+        if fresh:
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.pages = json.load(f).get("sayfalar", {})
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_site(cls, site, fresh=False):
+        return cls(os.path.join(STATE_DIR, f"{urlparse(site).netloc or 'yerel'}.json"), fresh)
+
+    def conditional_headers(self, url):
+        """Önceki analiz sonucu olmayan sayfaya koşullu istek atılmaz (304 gelirse elde yerine koyacak bir şey yok)."""
+        page = self.pages.get(url) or {}
+        headers = {}
+        if page.get("sonuc") is None:
+            return headers
+        if page.get("etag"):
+            headers["If-None-Match"] = page["etag"]
+        if page.get("last_modified"):
+            headers["If-Modified-Since"] = page["last_modified"]
+        return headers
+
+    def cached(self, url):
+        page = self.pages.get(url)
+        return page.get("sonuc") if page else None
+
+    def _count(self, kind, url, elapsed_ms):
+        """Atlanan sayfada kazanılan süre = önceki tam işleme süresi - bu seferki süre."""
+        with self._lock:
+            self.counts[kind] += 1
+            page = self.pages.get(url)
+            if kind in ("304", "ayni") and page:
+                self.saved_ms += max(0.0, page.get("sure_ms", 0) - elapsed_ms)
+                page["kontrol_tarihi"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def classify(self, url, response, elapsed_ms=0.0):
+        """Cevabı 'yeni' / 'degisti' / '304' / 'ayni' olarak sınıflar (atlananların sayacı burada artar)."""
+        page = self.pages.get(url)
+        if response.status_code == 304 and page and page.get("sonuc") is not None:
+            kind = "304"
+        elif page and page.get("sonuc") is not None and page.get("ozet") == content_digest(response.content):
+            kind = "ayni"
+            self._remember_validators(url, response)
+        else:
+            return "degisti" if page else "yeni"
+        self._count(kind, url, elapsed_ms)
+        return kind
+
+    def _remember_validators(self, url, response):
+        with self._lock:
+            page = self.pages.setdefault(url, {})
+            page["etag"] = response.headers.get("ETag")
+            page["last_modified"] = response.headers.get("Last-Modified")
+
+    def store(self, url, response, result, elapsed_ms, kind=None):
+        """Yeni / değişen sayfanın doğrulayıcılarını, özetini ve analiz sonucunu saklar."""
+        kind = kind or ("degisti" if url in self.pages else "yeni")
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._remember_validators(url, response)
+        with self._lock:
+            page = self.pages[url]
+            page.update({"ozet": content_digest(response.content), "sonuc": result,
+                         "sure_ms": round(elapsed_ms, 1), "analiz_tarihi": now, "kontrol_tarihi": now})
+            self.counts[kind] += 1
+
+    def save(self):
+        """Durumu atomik olarak yazar (yarıda kalan yazma eski dosyayı bozmaz)."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp = self.path + ".tmp"
+        with self._lock:
+            with open(temp, "w", encoding="utf-8") as f:
+                json.dump({"guncelleme": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "sayfalar": self.pages},
+                          f, ensure_ascii=False)
+        os.replace(temp, self.path)
+
+    def report(self):
+        skipped = self.counts["304"] + self.counts["ayni"]
+        return {
+            "yeni": self.counts["yeni"],
+            "degisen": self.counts["degisti"],
+            "atlanan_304": self.counts["304"],
+            "atlanan_ayni_icerik": self.counts["ayni"],
+            "atlanan": skipped,
+            "yeniden_islenen": self.counts["yeni"] + self.counts["degisti"],
+            "kazanilan_sn": round(self.saved_ms / 1000, 2),
+            "durum_dosyasi": self.path,
+        }
+
+    def print_report(self):
+        r = self.report()
+        print(f"♻️ Artımlı tarama: {r['yeniden_islenen']} sayfa işlendi ({r['yeni']} yeni, {r['degisen']} değişen), "
+              f"{r['atlanan']} atlandı ({r['atlanan_304']} × 304, {r['atlanan_ayni_icerik']} × aynı içerik)")
+        print(f"   ⏱ Atlananlardan kazanılan süre: ~{r['kazanilan_sn']} sn | Durum: {r['durum_dosyasi']}")
+
+
+def conditional_get(session, state, url, timeout=15):
+    """
+    Koşullu GET atar ve sonucu sınıflar.
+
+    Returns:
+        (tür, response, önceki sonuç) - tür "304" / "ayni" ise önceki sonuç kullanılır,
+        "yeni" / "degisti" ise çağıran analiz edip state.store(...) çağırmalıdır
+    """
+    start = time.perf_counter()
+    response = session.get(url, headers=state.conditional_headers(url), timeout=timeout)
+    kind = state.classify(url, response, (time.perf_counter() - start) * 1000)
+    return kind, response, state.cached(url) if kind in ("304", "ayni") else None
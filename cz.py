@@ -1,10 +1,8 @@
 import time
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from urllib.parse import urljoin
+from link_checker import check_links
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 
 
 # --- RENKLİ ÇIKTI İÇİN (Konsolda şık görünsün) ---
@@ -27,9 +25,7 @@ TARGET_URL = "http://www.seyyahlab.com/"  # Buraya test edilecek adresi yaz
 # Eğer localhost'ta deneyeceksen: "http://localhost:3000" gibi değiştir.
 
 # Tarayıcıyı başlat
-chrome_options = Options()
-# chrome_options.add_argument("--headless") # Tarayıcıyı görmeden çalıştırmak istersen bu yorumu aç
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+driver = create_driver("visual")  # Tarayıcıyı görmeden çalıştırmak istersen "fast-headless" yap
 
 try:
     print(f"{Renk.SARI}--- SEYYAHLAB SEO TESTİ BAŞLIYOR: {TARGET_URL} ---{Renk.RESET}\n")
@@ -70,15 +66,14 @@ try:
     # ---------------------------------------------------------
     # TEST 4: SITEMAP & ROBOTS.TXT (Requests ile kontrol)
     # ---------------------------------------------------------
-    # Selenium yerine Requests kullanıyoruz çünkü HTTP durum kodunu (200 OK) görmek daha kesin sonuç verir.
-    robots_url = f"{TARGET_URL}/robots.txt"
-    sitemap_url = f"{TARGET_URL}/sitemap.xml"
-
-    resp_robots = requests.get(robots_url)
-    test_rapor("4. Robots.txt Erişimi", resp_robots.status_code == 200, f"- Durum Kodu: {resp_robots.status_code}")
-
-    resp_sitemap = requests.get(sitemap_url)
-    test_rapor("4. Sitemap.xml Erişimi", resp_sitemap.status_code == 200, f"- Durum Kodu: {resp_sitemap.status_code}")
+    # Selenium yerine HTTP isteği kullanıyoruz çünkü durum kodunu (200 OK) görmek daha kesin sonuç verir.
+    # İki dosya aynı anda kontrol edilir (HEAD, gerekirse GET; yönlendirmeler takip edilir).
+    robots, sitemap = check_links([urljoin(TARGET_URL, "/robots.txt"), urljoin(TARGET_URL, "/sitemap.xml")])
+
+    test_rapor("4. Robots.txt Erişimi", robots["durum"] == 200,
+               f"- Durum Kodu: {robots['durum'] or robots['hata']} ({robots['ms']} ms)")
+    test_rapor("4. Sitemap.xml Erişimi", sitemap["durum"] == 200,
+               f"- Durum Kodu: {sitemap['durum'] or sitemap['hata']} ({sitemap['ms']} ms)")
 
     # ---------------------------------------------------------
     # TEST 5: OPEN GRAPH (Sosyal Medya Kartları)
@@ -0,0 +1,266 @@
+"""
+📱 CİHAZ MATRİSİ (Çoklu Cihaz / Ekran Boyutu Karşılaştırması)
+Senaryo: "Mobil testi tek cihaz (iPhone 12 Pro), tek tarayıcı, tek ekran görüntüsü.
+          Aynı senaryoyu (aç, başlığı kontrol et, ekran görüntüsü al, metrikleri
+          oku) bir cihaz listesinde ve ekran boyutlarında aynı anda koş; her cihaz
+          için tarayıcı açma, küçük bir havuzdaki tarayıcılarda emülasyonu DevTools
+          ile değiştir ve cihazları yükleme süresi + yerleşim metrikleriyle karşılaştır!"
+
+Emülasyon sekme başına DevTools komutlarıyla verilir:
+    Emulation.setDeviceMetricsOverride   ekran boyutu, piksel yoğunluğu, mobil görünüm
+    Emulation.setUserAgentOverride       cihazın user-agent'ı
+    Emulation.setTouchEmulationEnabled   dokunmatik ekran
+
+Tarayıcılar BrowserPool'dan gelir (isolation="context"): her cihaz aynı tarayıcı
+sürecinde yeni bir izole bağlamda (boş önbellek / çerez) koşar, yani yükleme
+süreleri cihazlar arasında adil karşılaştırılır.
+
+Kullanım:
+    python device_matrix.py                                       # varsayılan cihazlar, seyyahlab.com
+    python device_matrix.py https://www.seyyahlab.com --cihaz "iPhone SE" "Pixel 7" --boyut 1280x800 --isci 3
+
+    from device_matrix import run_matrix, print_matrix_report
+    rapor = run_matrix("https://www.seyyahlab.com", ["iPhone 12 Pro", "iPad Air", "1366x768"], workers=2)
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from browser_pool import BrowserPool
+from driver_factory import USER_AGENT, create_driver, preset_settings
+from network_idle import wait_for_network_idle
+
+IPHONE_UA = ("Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X) AppleWebKit/605.1.15 "
+             "(KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1")
+ANDROID_UA = ("Mozilla/5.0 (Linux; Android 13; {model}) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36")
+IPAD_UA = ("Mozilla/5.0 (iPad; CPU OS 16_0 like Mac OS X) AppleWebKit/605.1.15 "
+           "(KHTML, like Gecko) Version/16.0 Mobile/15E148 Safari/604.1")
+
+# Cihaz profilleri (Chrome DevTools cihaz listesindeki değerler)
+DEVICES = {
+    "iPhone SE": {"width": 375, "height": 667, "scale": 2, "mobile": True, "user_agent": IPHONE_UA},
+    "iPhone 12 Pro": {"width": 390, "height": 844, "scale": 3, "mobile": True, "user_agent": IPHONE_UA},
+    "Pixel 7": {"width": 412, "height": 915, "scale": 2.625, "mobile": True,
+                "user_agent": ANDROID_UA.format(model="Pixel 7")},
+    "Galaxy S20 Ultra": {"width": 412, "height": 915, "scale": 3.5, "mobile": True,
+                         "user_agent": ANDROID_UA.format(model="SM-G988B")},
+    "iPad Air": {"width": 820, "height": 1180, "scale": 2, "mobile": True, "user_agent": IPAD_UA},
+    "Laptop": {"width": 1366, "height": 768, "scale": 1, "mobile": False, "user_agent": USER_AGENT},
+    "Masaüstü": {"width": 1920, "height": 1080, "scale": 1, "mobile": False, "user_agent": USER_AGENT},
+}
+
+DEFAULT_DEVICES = ["iPhone SE", "iPhone 12 Pro", "Pixel 7", "iPad Air", "Laptop"]
+
+# Yükleme süreleri (Navigation Timing / Paint Timing) + yerleşim metrikleri, tek çağrıda
+PAGE_METRICS_JS = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+var doc = document.documentElement;
+var small = 0, targets = document.querySelectorAll('a, button, input, select, textarea, [role=button]');
+for (var i = 0; i < targets.length; i++) {
+    var r = targets[i].getBoundingClientRect();
+    if (r.width > 0 && r.height > 0 && (r.width < 48 || r.height < 48)) small++;
+}
+var bodyFont = document.body ? parseFloat(getComputedStyle(document.body).fontSize) : 0;
+return {
+    baslik: document.title,
+    dom_ms: Math.round(nav.domContentLoadedEventEnd || 0),
+    yukleme_ms: Math.round(nav.loadEventEnd || 0),
+    fcp_ms: fcp ? Math.round(fcp.startTime) : null,
+    viewport_genislik: window.innerWidth,
+    viewport_yukseklik: window.innerHeight,
+    sayfa_genislik: doc.scrollWidth,
+    sayfa_yukseklik: doc.scrollHeight,
+    piksel_orani: window.devicePixelRatio,
+    viewport_meta: !!document.querySelector('meta[name=viewport]'),
+    yazi_boyutu_px: bodyFont,
+    dokunma_hedefi: targets.length,
+    kucuk_dokunma_hedefi: small,
+    gorsel: document.images.length
+};
+"""
+
+
+def resolve_device(spec):
+    """Cihaz adı veya 'GENİŞLİKxYÜKSEKLİK' (masaüstü görünümlü ekran boyutu) → (ad, profil)."""
+    if spec in DEVICES:
+        return spec, DEVICES[spec]
+    match = re.fullmatch(r"(\d+)x(\d+)", spec.strip().lower())
+    if not match:
+        raise ValueError(f"Bilinmeyen cihaz: {spec} (seçenekler: {', '.join(DEVICES)} veya 1280x800)")
+    width, height = int(match.group(1)), int(match.group(2))
+    return spec, {"width": width, "height": height, "scale": 1, "mobile": False, "user_agent": USER_AGENT}
+
+
+def apply_device(driver, device):
+    """Aktif sekmeye cihaz emülasyonunu uygular (tarayıcı yeniden açılmaz)."""
+    driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+        "width": device["width"], "height": device["height"],
+        "deviceScaleFactor": device["scale"], "mobile": device["mobile"],
+    })
+    driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": device["user_agent"]})
+    driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {
+        "enabled": device["mobile"], "maxTouchPoints": 5 if device["mobile"] else 1,
+    })
+
+
+def _slug(name):
+    return re.sub(r"\W+", "_", name.lower()).strip("_")
+
+
+def run_scenario(driver, name, device, url, expected_title=None, output_dir=None, timeout=15):
+    """
+    Tek cihaz senaryosu: emülasyon, sayfa yükleme, başlık kontrolü, ekran görüntüsü, metrikler.
+
+    Returns:
+        {"cihaz", "genislik", "yukseklik", "piksel_orani", "mobil", "basarili", "hata",
+         "baslik_ok", "sure_ms", "metrikler", "yatay_tasma", "ekran_goruntusu"}
+    """
+    result = {"cihaz": name, "genislik": device["width"], "yukseklik": device["height"],
+              "piksel_orani": device["scale"], "mobil": device["mobile"], "basarili": False,
+              "hata": None, "baslik_ok": None, "sure_ms": None, "metrikler": {},
+              "yatay_tasma": None, "ekran_goruntusu": None}
+    try:
+        apply_device(driver, device)
+        start = time.perf_counter()
+        driver.get(url)
+        wait_for_network_idle(driver, timeout=timeout)
+        result["sure_ms"] = round((time.perf_counter() - start) * 1000)
+
+        metrics = driver.execute_script(PAGE_METRICS_JS)
+        result["metrikler"] = metrics
+        result["yatay_tasma"] = metrics["sayfa_genislik"] > metrics["viewport_genislik"]
+        result["baslik_ok"] = expected_title.lower() in metrics["baslik"].lower() if expected_title else None
+
+        if output_dir:
+            path = os.path.join(output_dir, f"{_slug(name)}.png")
+            driver.save_screenshot(path)
+            result["ekran_goruntusu"] = path
+        result["basarili"] = result["baslik_ok"] is not False
+        if result["baslik_ok"] is False:
+            result["hata"] = f"Başlıkta '{expected_title}' yok: {metrics['baslik'][:60]}"
+    except Exception as e:
+        result["hata"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_matrix(url, devices=None, workers=2, expected_title=None, output_dir=None, preset="fast-headless",
+               timeout=15):
+    """
+    Senaryoyu cihaz listesinde eşzamanlı koşar.
+
+    Args:
+        url: Test edilecek sayfa
+        devices: Cihaz adları ve/veya '1280x800' gibi ekran boyutları
+        workers: Aynı anda açık tarayıcı (= eşzamanlı cihaz) sayısı
+        expected_title: Başlıkta geçmesi gereken metin (verilmezse kontrol edilmez)
+        output_dir: Ekran görüntüleri + sonuc.json klasörü (varsayılan: raporlar/cihaz_matrisi_<zaman>)
+        preset: Havuz tarayıcılarının driver_factory ön ayarı
+    """
+    resolved = [resolve_device(spec) for spec in (devices or DEFAULT_DEVICES)]
+    workers = max(1, min(workers, len(resolved)))
+    output_dir = output_dir or os.path.join("raporlar", f"cihaz_matrisi_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    settings = preset_settings(preset)
+    pool = BrowserPool(lambda: create_driver(preset), size=workers, max_uses=len(resolved),
+                       window_size=settings["window_size"], isolation="context",
+                       load_profile=settings["load_profile"])
+
+    def job(item):
+        name, device = item
+        driver = pool.acquire()
+        try:
+            result = run_scenario(driver, name, device, url, expected_title, output_dir, timeout)
+        finally:
+            pool.release(driver)
+        durum = "✅" if result["basarili"] else "❌"
+        print(f"   {durum} {name:<18} {device['width']}x{device['height']} → "
+              f"{result['sure_ms'] or '-'} ms{' | ' + result['hata'] if result['hata'] else ''}")
+        return result
+
+    print(f"📱 {len(resolved)} cihaz, {workers} tarayıcı ile test ediliyor: {url}")
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cihaz") as executor:
+            results = list(executor.map(job, resolved))
+    finally:
+        pool.close()
+    wall = time.perf_counter() - start
+
+    timed = [r["sure_ms"] for r in results if r["sure_ms"]]
+    fastest = min(timed) if timed else None
+    for r in results:
+        r["en_hizliya_gore"] = round(r["sure_ms"] / fastest, 2) if r["sure_ms"] and fastest else None
+
+    pool_report = pool.report()
+    report = {
+        "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "url": url,
+        "cihazlar": results,
+        "verim": {
+            "cihaz": len(resolved),
+            "tarayici": pool_report["acilan_tarayici"],
+            "toplam_sure_sn": round(wall, 2),
+            "sirali_tahmini_sn": round(sum(timed) / 1000 + len(resolved) * pool_report["ortalama_acilis_sn"], 2),
+        },
+    }
+    with open(os.path.join(output_dir, "sonuc.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    report["klasor"] = output_dir
+    return report
+
+
+def print_matrix_report(report):
+    print("\n" + "=" * 96)
+    print(f"📱 CİHAZ MATRİSİ: {report['url']}")
+    print("=" * 96)
+    print(f"   {'Cihaz':<18} {'Ekran':>10} {'Süre':>8} {'FCP':>7} {'x hız':>6} {'Sayfa yük.':>10} "
+          f"{'Taşma':>6} {'Küçük hedef':>12} {'Yazı':>5}")
+    print("-" * 96)
+    for r in report["cihazlar"]:
+        m = r["metrikler"]
+        if not m:
+            print(f"   {r['cihaz']:<18} {r['genislik']}x{r['yukseklik']:<5} ❌ {r['hata']}")
+            continue
+        print(f"   {r['cihaz']:<18} {str(r['genislik']) + 'x' + str(r['yukseklik']):>10} "
+              f"{r['sure_ms']:>6}ms {m['fcp_ms'] or '-':>5}ms {r['en_hizliya_gore'] or '-':>6} "
+              f"{m['sayfa_yukseklik']:>8}px {'⚠️' if r['yatay_tasma'] else '✓':>6} "
+              f"{m['kucuk_dokunma_hedefi']:>5}/{m['dokunma_hedefi']:<6} {m['yazi_boyutu_px']:>4.0f}px")
+    print("-" * 96)
+    verim = report["verim"]
+    print(f"   ⏱ {verim['cihaz']} cihaz, {verim['tarayici']} tarayıcı: {verim['toplam_sure_sn']} sn "
+          f"(cihaz başına tarayıcıyla sıralı tahmini {verim['sirali_tahmini_sn']} sn)")
+    for r in report["cihazlar"]:
+        if r["mobil"] and r["metrikler"] and not r["metrikler"]["viewport_meta"]:
+            print(f"   ⚠️ {r['cihaz']}: viewport meta etiketi yok (mobilde masaüstü düzeni açılır)")
+            break
+    print(f"📁 Ekran görüntüleri ve sonuç: {report['klasor']}")
+    print("=" * 96)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Senaryoyu cihaz profilleri / ekran boyutlarında eşzamanlı koşar")
+    parser.add_argument("url", nargs="?", default="https://www.seyyahlab.com", help="Test edilecek sayfa")
+    parser.add_argument("--cihaz", nargs="*", default=[], help=f"Cihaz adları ({', '.join(DEVICES)})")
+    parser.add_argument("--boyut", nargs="*", default=[], help="Ek ekran boyutları (örn: 1280x800 768x1024)")
+    parser.add_argument("--isci", type=int, default=2, help="Havuzdaki tarayıcı sayısı")
+    parser.add_argument("--baslik", help="Başlıkta geçmesi gereken metin")
+    parser.add_argument("--on-ayar", default="fast-headless", help="driver_factory ön ayarı")
+    parser.add_argument("--cikti", help="Rapor klasörü (varsayılan: raporlar/cihaz_matrisi_<zaman>)")
+    args = parser.parse_args()
+
+    devices = (args.cihaz + args.boyut) or None
+    report = run_matrix(args.url, devices, workers=args.isci, expected_title=args.baslik,
+                        output_dir=args.cikti, preset=args.on_ayar)
+    print_matrix_report(report)
+
+
+if __name__ == "__main__":
+    main()
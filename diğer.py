@@ -1,34 +1,26 @@
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
+from driver_factory import create_driver
+from link_harvest import harvest_links
+from network_idle import wait_for_network_idle
 
 # Ayarlar
-options = Options()
-options.add_argument("--window-size=1920,1080")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = create_driver("visual")
 
 print("--- LİNKLER TARANIYOR ---")
 driver.get("https://www.seyyahlab.com")
-time.sleep(5)  # Sayfa tam otursun diye uzun bekliyoruz
+wait_for_network_idle(driver, replaces=5)  # Sayfa tam otursun (ağ istekleri bitene kadar)
 
-# Sayfadaki TÜM <a> etiketlerini bul
-linkler = driver.find_elements(By.TAG_NAME, "a")
+# Sayfadaki TÜM <a> etiketlerini tek istekte al
+linkler = harvest_links(driver)
 
 print(f"Toplam {len(linkler)} adet link bulundu.\n")
 
 for i, link in enumerate(linkler):
-    try:
-        metin = link.text
-        adres = link.get_attribute("href")
+    metin = link["text"]
+    adres = link["url"]
 
-        # Sadece boş olmayan, işe yarar linkleri yazdır
-        if metin or adres:
-            print(f"[{i}] Metin: '{metin}'  |  Link: {adres}")
-    except:
-        print(f"[{i}] -- Okunamadı --")
+    # Sadece boş olmayan, işe yarar linkleri yazdır
+    if metin or adres:
+        print(f"[{i}] Metin: '{metin}'  |  Link: {adres}")
 
 print("\n--- TARAMA BİTTİ ---")
 driver.quit()
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+📸 DOM ANLIK GÖRÜNTÜSÜ (Snapshot) - Bir kere yakala, çevrimdışı analiz et
+Senaryo: "Sayfayı kaydırdıktan sonra çizilmiş DOM'u (outerHTML + her elementin
+          görünürlüğü ve kutu koordinatları) tek çağrıda al, sıkıştırıp diske yaz.
+          Sonra tüm analizleri tarayıcı açmadan, siteye tekrar gitmeden çalıştır."
+
+Kullanım:
+    # Yakalama (SeyyahLabAnalyzer içinden)
+    bot.analyze_homepage(snapshot=True)      # snapshots/ altına .json.gz yazar
+
+    # Çevrimdışı yeniden analiz
+    python dom_snapshot.py snapshots/seyyahlab_20260118_120000.json.gz
+
+    from dom_snapshot import load_snapshot, analyze_snapshot
+    sonuc = analyze_snapshot(load_snapshot("snapshots/...json.gz"))
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from html_dom import parse_html
+from static_analyzer import analyze_document
+
+SNAPSHOT_DIR = "snapshots"
+BOX_ATTR = "data-snap-box"
+
+# Her elemente geçici olarak "x,y,genislik,yukseklik,gorunur" yazar, outerHTML'i alır,
+# sonra işaretleri temizler. Böylece kutular HTML ile birlikte, sıra kaymadan taşınır.
+SNAPSHOT_JS = """
+var attr = arguments[0];
+var elements = document.body ? document.body.getElementsByTagName('*') : [];
+var all = [document.body].concat(Array.prototype.slice.call(elements));
+var sx = window.scrollX, sy = window.scrollY;
+
+for (var i = 0; i < all.length; i++) {
+    var el = all[i];
+    if (!el) continue;
+    var r = el.getBoundingClientRect();
+    var style = window.getComputedStyle(el);
+    var visible = r.width > 0 && r.height > 0 && style.visibility !== 'hidden'
+        && style.display !== 'none' && parseFloat(style.opacity) > 0;
+    el.setAttribute(attr, [Math.round(r.left + sx), Math.round(r.top + sy),
+        Math.round(r.width), Math.round(r.height), visible ? 1 : 0].join(','));
+}
+
+var html = document.documentElement.outerHTML;
+
+for (var j = 0; j < all.length; j++) {
+    if (all[j]) all[j].removeAttribute(attr);
+}
+
+return {
+    html: html,
+    url: location.href,
+    title: document.title,
+    viewport: {width: window.innerWidth, height: window.innerHeight},
+    scroll_height: document.documentElement.scrollHeight,
+    element_count: all.length
+};
+"""
+
+
+def capture_snapshot(driver):
+    """Çizilmiş DOM'u tek bir execute_script çağrısıyla yakalar."""
+    start = time.perf_counter()
+    snapshot = driver.execute_script(SNAPSHOT_JS, BOX_ATTR)
+    snapshot["yakalama_zamani"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    snapshot["yakalama_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return snapshot
+
+
+def save_snapshot(snapshot, path=None):
+    """Snapshot'ı gzip'li JSON olarak kaydeder, dosya yolunu döner."""
+    if path is None:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(SNAPSHOT_DIR, f"seyyahlab_{timestamp}.json.gz")
+
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    return path
+
+
+def load_snapshot(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def element_box(node):
+    """Snapshot'tan gelen bir elementin (x, y, genislik, yukseklik, gorunur) kutusu."""
+    raw = node.get(BOX_ATTR)
+    if not raw:
+        return None
+    x, y, w, h, visible = (int(v) for v in raw.split(","))
+    return x, y, w, h, bool(visible)
+
+
+def _blank_hidden_text(node, hidden=False):
+    """
+    Görünmeyen elementlerin metnini siler. Canlı tarayıcıda .text (innerText)
+    gizli elementler için boş döndüğünden analiz sonuçları aynı kalır.
+    """
+    box = element_box(node)
+    if box is not None:
+        hidden = not box[4]
+    if hidden:
+        node.children = [c for c in node.children if not isinstance(c, str)]
+    for child in node.children:
+        if not isinstance(child, str):
+            _blank_hidden_text(child, hidden)
+
+
+def parse_snapshot(snapshot):
+    """Snapshot HTML'ini html_dom ağacına çevirir (gizli metinler ayıklanmış)."""
+    doc = parse_html(snapshot["html"])
+    body = doc.select_one("body")
+    if body is not None:
+        _blank_hidden_text(body)
+    return doc
+
+
+def analyze_snapshot(snapshot):
+    """SeyyahLabAnalyzer'ın tüm analizlerini snapshot üzerinde çalıştırır."""
+    start = time.perf_counter()
+    doc = parse_snapshot(snapshot)
+    result = analyze_document(doc, snapshot["url"])
+    result["snapshot"] = {
+        "yakalama_zamani": snapshot.get("yakalama_zamani"),
+        "element_sayisi": snapshot.get("element_count"),
+        "analiz_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    return result
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Kullanım: python dom_snapshot.py <snapshot.json.gz> [cikti.json]")
+        sys.exit(1)
+
+    snap = load_snapshot(sys.argv[1])
+    sonuc = analyze_snapshot(snap)
+    cikti = sys.argv[2] if len(sys.argv) > 2 else sys.argv[1].replace(".json.gz", "_analiz.json")
+
+    with open(cikti, "w", encoding="utf-8") as f:
+        json.dump(sonuc, f, ensure_ascii=False, indent=2)
+
+    stats = sonuc["istatistikler"]
+    print(f"📸 Snapshot: {sys.argv[1]} ({snap.get('yakalama_zamani')})")
+    print(f"   - Makale: {stats.get('toplam_makale', 0)} | Kategori: {stats.get('toplam_kategori', 0)}"
+          f" | Link: {stats.get('toplam_link', 0)} | Görsel: {stats.get('toplam_gorsel', 0)}")
+    print(f"   - Analiz süresi: {sonuc['snapshot']['analiz_ms']} ms (tarayıcısız)")
+    print(f"✅ Sonuç: {cikti}")
@@ -0,0 +1,191 @@
+"""
+🧰 CHROMEDRIVER ÖNBELLEĞİ (Tek Noktadan Sürücü Yönetimi)
+Senaryo: "Her tarayıcı açılışında ChromeDriverManager().install() çağırma,
+          sürücüyü bir kere bul, diske sabitle, sonra anında döndür!"
+
+Kullanım:
+    from driver_cache import get_chromedriver_path
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+
+Önbellek dosyası Chrome'un ana sürümüne (major version) göre anahtarlanır:
+    ~/.cache/selenium-otomasyon/chromedriver.json
+    {"120": {"path": "/.../chromedriver", "kayit_zamani": "..."}}
+Sürümü okunamayan Chrome kurulumlarında (Windows sistem geneli, snap, özel yol)
+kayıt "bilinmiyor" anahtarına yazılır ve sonraki açılışlarda oradan okunur;
+Chrome güncellenip sürücü uyumsuz kalırsa get_chromedriver_path(force_refresh=True).
+
+Süre raporu için:
+    python driver_cache.py
+"""
+
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+CACHE_DIR = os.environ.get(
+    "CHROMEDRIVER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "selenium-otomasyon")
+)
+CACHE_FILE = os.path.join(CACHE_DIR, "chromedriver.json")
+UNKNOWN_VERSION = "bilinmiyor"  # Chrome sürümü okunamadığında önbellek anahtarı
+
+# Chrome'un sürümünü sormak için denenecek komutlar (işletim sistemine göre)
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+logger = logging.getLogger(__name__)
+
+# Aynı süreç içindeki tekrar çağrılar için bellek önbelleği (mikrosaniye seviyesi)
+_resolved_path = None
+
+# Her çözümlemenin süresi burada tutulur (rapor için)
+_timings = []
+
+
+def _detect_chrome_major_version():
+    """Yüklü Chrome'un ana sürüm numarasını döner (örn: '120'). Bulunamazsa None."""
+    for command in CHROME_VERSION_COMMANDS:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = CACHE_FILE + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, CACHE_FILE)  # Yarım yazılmış dosya kalmasın
+
+
+def _newest_cached_path(cache):
+    """Çevrimdışı durumda kullanılacak, hâlâ diskte duran en yeni sürücü."""
+    for major in sorted(cache, key=lambda v: int(v) if v.isdigit() else -1, reverse=True):
+        path = cache[major].get("path")
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def _install_chromedriver():
+    """Ağ üzerinden sürücüyü indirir (sadece önbellek boşsa çalışır)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def get_chromedriver_path(force_refresh=False):
+    """
+    Chromedriver'ın yolunu döner.
+
+    Sıra:
+    1. Aynı süreçte daha önce çözüldüyse bellekten döner.
+    2. Diskteki önbellekte Chrome'un ana sürümüne ait kayıt varsa onu döner
+       (sürüm okunamazsa "bilinmiyor" kaydı, o da yoksa diskteki en yeni sürücü).
+    3. Yoksa ChromeDriverManager ile indirir ve önbelleğe yazar.
+    4. İndirme başarısızsa (çevrimdışı) önbellekteki en yeni sürücüye düşer.
+    """
+    global _resolved_path
+
+    start = time.perf_counter()
+
+    if _resolved_path and not force_refresh:
+        _timings.append(("bellek", time.perf_counter() - start))
+        return _resolved_path
+
+    cache = _load_cache()
+    major = _detect_chrome_major_version()
+
+    entry = cache.get(major or UNKNOWN_VERSION) or {}
+    path = entry.get("path") if os.path.isfile(entry.get("path", "")) else None
+    if not path and not major:
+        # Sürüm bilinmeden hangi kaydın uyduğu seçilemez; her açılışta indirmektense en yenisi
+        path = _newest_cached_path(cache)
+    if path and not force_refresh:
+        _resolved_path = path
+        _timings.append(("disk", time.perf_counter() - start))
+        return _resolved_path
+
+    try:
+        path = _install_chromedriver()
+    except Exception as e:
+        path = _newest_cached_path(cache)
+        if not path:
+            raise
+        logger.warning(f"Sürücü indirilemedi ({e}), önbellekteki sürücü kullanılıyor: {path}")
+        _resolved_path = path
+        _timings.append(("cevrimdisi", time.perf_counter() - start))
+        return _resolved_path
+
+    cache[major or UNKNOWN_VERSION] = {
+        "path": path,
+        "kayit_zamani": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    _save_cache(cache)
+
+    _resolved_path = path
+    _timings.append(("indirme", time.perf_counter() - start))
+    return _resolved_path
+
+
+def startup_report():
+    """Bu süreçte yapılan tüm çözümlemelerin süre özetini döner."""
+    report = {}
+    for source, duration in _timings:
+        item = report.setdefault(source, {"adet": 0, "toplam_ms": 0.0})
+        item["adet"] += 1
+        item["toplam_ms"] += duration * 1000
+
+    for item in report.values():
+        item["ortalama_ms"] = round(item["toplam_ms"] / item["adet"], 3)
+        item["toplam_ms"] = round(item["toplam_ms"], 3)
+    return report
+
+
+def print_startup_report():
+    print("=" * 60)
+    print("⏱  CHROMEDRIVER ÇÖZÜMLEME RAPORU")
+    print("=" * 60)
+    for source, item in startup_report().items():
+        print(f"   {source:<12} | {item['adet']:>3} çağrı | ort. {item['ortalama_ms']:>10.3f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    # Önbelleğin etkisini ölçmek için: 1 soğuk + N sıcak çözümleme
+    tekrar = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    t0 = time.perf_counter()
+    _install_chromedriver()
+    eski_yontem = time.perf_counter() - t0
+
+    get_chromedriver_path()
+    for _ in range(tekrar):
+        get_chromedriver_path()
+
+    print_startup_report()
+    print(f"📦 ChromeDriverManager().install() (eski yöntem): {eski_yontem * 1000:.1f} ms / açılış")
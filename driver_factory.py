@@ -0,0 +1,197 @@
+"""
+🏭 SÜRÜCÜ FABRİKASI (Performans Ön Ayarları / Presets)
+Senaryo: "Chrome ayar bloğu 15 dosyaya kopyalanmış, bayraklar birbirinden kaymış
+          (iki kere --disable-dev-shm-usage, headless'ta --start-maximized...).
+          Sürücüyü tek noktadan, isimli bir ön ayarla iste; bayraklar tek
+          yerde ayarlansın ve ölçülebilsin!"
+
+Ön ayarlar:
+    fast-headless  Görünmez, sabit pencere, GPU yok, arka plan kısıtlaması kapalı, 'eager' yükleme
+    extraction     fast-headless + görsel/video/font/reklam engelleme (bkz. resource_blocking.py)
+    visual         Görünür tarayıcı, sabit pencere, tam ('normal') yükleme - ekran görüntüsü / izleme için
+    mobile         fast-headless + iPhone 12 Pro emülasyonu
+
+Kullanım:
+    from driver_factory import create_driver
+    driver = create_driver("fast-headless")
+    driver = create_driver("visual", options=options, page_load_strategy="eager")  # ek seçenek + üzerine yazma
+
+    SELENIUM_PRESET=visual python test_giris.py    # tüm script'lerde ön ayarı ezmek için
+    HTTP_ARSIV=arsiv/x HTTP_ARSIV_MODU=oynat python ax.py   # kayıtlı cevaplarla çevrimdışı (http_archive.py)
+
+Ön ayarların açılış ve sayfa yükleme süreleri için:
+    python driver_factory.py https://www.seyyahlab.com
+"""
+
+import os
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from driver_cache import get_chromedriver_path
+from http_archive import attach_archive_from_env
+from resource_blocking import configure_options, apply_load_profile
+
+# normal: load olayına kadar bekler | eager: DOMContentLoaded'a kadar | none: hiç beklemez
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Her ön ayarda geçerli bayraklar
+COMMON_ARGUMENTS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-notifications",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# Görünmez çalışmada sekme/zamanlayıcı kısıtlamalarını kapatır (throughput için)
+THROUGHPUT_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+]
+
+PRESETS = {
+    "fast-headless": {
+        "headless": True,
+        "window_size": (1920, 1080),
+        "page_load_strategy": "eager",
+        "load_profile": "full",
+        "mobile_emulation": None,
+        "user_agent": USER_AGENT,
+        "page_load_timeout": 30,
+    },
+    "extraction": {
+        "headless": True,
+        "window_size": (1920, 1080),
+        "page_load_strategy": "eager",
+        "load_profile": "extraction",
+        "mobile_emulation": None,
+        "user_agent": USER_AGENT,
+        "page_load_timeout": 30,
+    },
+    "visual": {
+        "headless": False,
+        "window_size": (1920, 1080),
+        "page_load_strategy": "normal",
+        "load_profile": "full",
+        "mobile_emulation": None,
+        "user_agent": None,
+        "page_load_timeout": 30,
+    },
+    "mobile": {
+        "headless": True,
+        "window_size": None,  # Emülasyon ekranı belirler
+        "page_load_strategy": "eager",
+        "load_profile": "full",
+        "mobile_emulation": {"deviceName": "iPhone 12 Pro"},
+        "user_agent": None,  # Cihazın kendi user-agent'ı kullanılır
+        "page_load_timeout": 30,
+    },
+}
+
+# Her açılışın süresi (rapor için)
+_launches = []
+
+
+def preset_settings(preset=None, **overrides):
+    """Ön ayarın ayarlarını (üzerine yazılanlarla birlikte) döner."""
+    preset = os.environ.get("SELENIUM_PRESET") or preset or "fast-headless"
+    if preset not in PRESETS:
+        raise ValueError(f"Bilinmeyen ön ayar: {preset} (seçenekler: {', '.join(PRESETS)})")
+
+    settings = dict(PRESETS[preset], preset=preset)
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    if settings["page_load_strategy"] not in PAGE_LOAD_STRATEGIES:
+        raise ValueError(f"Bilinmeyen yükleme stratejisi: {settings['page_load_strategy']} "
+                         f"(seçenekler: {', '.join(PAGE_LOAD_STRATEGIES)})")
+    return settings
+
+
+def build_options(settings, options=None):
+    """Ayarları Chrome seçeneklerine çevirir (verilen options nesnesine ekler)."""
+    options = options or Options()
+    existing = set(options.arguments)
+
+    def add(argument):
+        if argument not in existing:
+            options.add_argument(argument)
+            existing.add(argument)
+
+    for argument in COMMON_ARGUMENTS:
+        add(argument)
+    if settings["headless"]:
+        add("--headless=new")
+        for argument in THROUGHPUT_ARGUMENTS:
+            add(argument)
+    if settings["window_size"]:
+        add("--window-size={},{}".format(*settings["window_size"]))
+    if settings["user_agent"]:
+        add(f"user-agent={settings['user_agent']}")
+    if settings["mobile_emulation"]:
+        options.add_experimental_option("mobileEmulation", settings["mobile_emulation"])
+
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    options.page_load_strategy = settings["page_load_strategy"]
+    configure_options(options, settings["load_profile"])
+    return options
+
+
+def create_driver(preset=None, options=None, **overrides):
+    """
+    İsimli ön ayarla Chrome'u açar.
+
+    Args:
+        preset: "fast-headless" | "extraction" | "visual" | "mobile" (SELENIUM_PRESET ortam değişkeni ezer)
+        options: Script'e özel ek seçenekler (ön ayar bayrakları bunun üzerine eklenir)
+        overrides: headless, window_size, page_load_strategy, load_profile, mobile_emulation,
+                   user_agent, page_load_timeout
+    """
+    settings = preset_settings(preset, **overrides)
+    options = build_options(settings, options)
+
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+    driver.set_page_load_timeout(settings["page_load_timeout"])
+    apply_load_profile(driver, settings["load_profile"])
+    attach_archive_from_env(driver)  # HTTP_ARSIV verilmişse istekler arşivden / arşive
+    _launches.append({"preset": settings["preset"], "acilis_ms": round((time.perf_counter() - start) * 1000)})
+    return driver
+
+
+if __name__ == "__main__":
+    from page_ready import load_page
+    from resource_blocking import PageWeightMeter
+
+    url = sys.argv[1] if len(sys.argv) > 1 else "https://www.seyyahlab.com"
+    print(f"🏭 Ön ayar karşılaştırması: {url}\n")
+
+    rows = []
+    for name in PRESETS:
+        driver = create_driver(name)
+        try:
+            meter = PageWeightMeter(driver, PRESETS[name]["load_profile"])
+            meter.start()
+            ready_ms = load_page(driver, url, label=name)
+            weight = meter.measure(url)
+            size_kb = f"{weight['bayt'] / 1024:.0f}" if weight["bayt"] is not None else "?"
+            rows.append((name, _launches[-1]["acilis_ms"], ready_ms, size_kb, weight["istek"], weight["engellenen"]))
+        finally:
+            driver.quit()
+
+    print(f"\n{'Ön ayar':<15} {'Açılış ms':>10} {'Hazır ms':>10} {'KB':>8} {'İstek':>7} {'Engellenen':>11}")
+    print("-" * 66)
+    for row in rows:
+        print("{:<15} {:>10} {:>10} {:>8} {:>7} {:>11}".format(*row))
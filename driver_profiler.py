@@ -0,0 +1,210 @@
+"""
+⏱ WEBDRIVER PROFİLLEYİCİ
+Senaryo: "analyze_homepage ya da search_products kaç WebDriver komutu gönderiyor,
+          süre nereye gidiyor? Her komutu (adı, hedef locator, gecikme, çağıran satır)
+          kaydet, çalışma sonunda tablo + JSON özet çıkar, round-trip avına çık!"
+
+Tüm komutlar (WebElement metotları dahil) sürücünün 'execute' metodundan geçtiği için
+profilleyici yalnızca o metodu sarar; script'lerde başka değişiklik gerekmez.
+Varsayılan kapalıdır, ortam değişkeniyle açılır:
+
+    WEBDRIVER_PROFILE=1 python asdasdas.py
+
+    profiler = DriverProfiler(driver)        # enabled=None -> ortam değişkenine bakar
+    profiler.start("analyze_homepage")
+    profiler.set_phase("kaydirma")
+    ...
+    profiler.finish()                        # konsol tablosu + profiles/*.json
+"""
+
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import selenium
+
+PROFILE_ENV = "WEBDRIVER_PROFILE"
+PROFILE_DIR = "profiles"
+
+# Locator'ı parametrelerinde taşıyan komutlar
+FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+SCRIPT_COMMANDS = {"executeScript", "executeAsyncScript", "w3cExecuteScript", "w3cExecuteScriptAsync"}
+
+# Çağıran satır aranırken atlanan dosyalar (Selenium paketi ve bu modül)
+_SKIPPED_PATHS = (os.path.dirname(selenium.__file__), os.path.abspath(__file__))
+
+
+def profiling_enabled():
+    return os.environ.get(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "evet")
+
+
+def _call_site():
+    """Selenium ve bu modül dışındaki ilk çağıran satır: 'dosya.py:satir fonksiyon'"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not os.path.abspath(filename).startswith(_SKIPPED_PATHS):
+            return f"{os.path.basename(filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def _script_label(script):
+    """Script'in ilk anlamlı satırı (tabloda okunabilir kısa etiket)"""
+    for line in (script or "").splitlines():
+        line = line.strip()
+        if line:
+            return "js: " + (line[:50] + "…" if len(line) > 50 else line)
+    return "js: <boş>"
+
+
+class DriverProfiler:
+    """Sürücünün tüm WebDriver komutlarını süreleriyle kaydeder."""
+
+    def __init__(self, driver, enabled=None):
+        self.driver = driver
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.run_name = "run"
+        self.records = []
+        self._phase = "-"
+        self._locators = {}  # element id -> onu bulan locator
+        self._original_execute = None
+        if self.enabled:
+            self._original_execute = driver.execute
+            driver.execute = self._execute
+
+    def _execute(self, driver_command, params=None):
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self._original_execute(driver_command, params)
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.records.append({
+                "komut": driver_command,
+                "hedef": self._target(driver_command, params or {}),
+                "ms": round(elapsed_ms, 2),
+                "faz": self._phase,
+                "cagiran": _call_site(),
+                "hata": response is None,
+            })
+            if driver_command in FIND_COMMANDS and response:
+                self._remember_elements(params or {}, response.get("value"))
+
+    def _target(self, command, params):
+        if command in FIND_COMMANDS:
+            return f"{params.get('using')}={params.get('value')}"
+        if command in SCRIPT_COMMANDS:
+            return _script_label(params.get("script"))
+        if "id" in params:
+            return "eleman: " + self._locators.get(params["id"], "?")
+        if command == "get":
+            return params.get("url", "")
+        return ""
+
+    def _remember_elements(self, params, value):
+        locator = f"{params.get('using')}={params.get('value')}"
+        elements = value if isinstance(value, list) else [value]
+        for element in elements:
+            element_id = getattr(element, "id", None)
+            if element_id:
+                self._locators[element_id] = locator
+
+    # ------------------------------------------------------------------
+    # Çalışma / faz yönetimi
+    # ------------------------------------------------------------------
+
+    def start(self, run_name):
+        """Yeni bir çalışma başlatır (önceki kayıtlar silinir)."""
+        self.run_name = run_name
+        self.records = []
+        self._phase = "-"
+
+    def set_phase(self, name):
+        """Bundan sonraki komutlar bu faza yazılır."""
+        self._phase = name
+
+    def detach(self):
+        """Sürücünün orijinal execute metodunu geri koyar."""
+        if self._original_execute is not None:
+            self.driver.execute = self._original_execute
+            self._original_execute = None
+
+    # ------------------------------------------------------------------
+    # Özet
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _group(records, key, top=None):
+        groups = defaultdict(lambda: {"adet": 0, "toplam_ms": 0.0})
+        for record in records:
+            group = groups[record[key]]
+            group["adet"] += 1
+            group["toplam_ms"] += record["ms"]
+
+        rows = [
+            {key: name, "adet": g["adet"], "toplam_ms": round(g["toplam_ms"], 1),
+             "ort_ms": round(g["toplam_ms"] / g["adet"], 2)}
+            for name, g in groups.items()
+        ]
+        rows.sort(key=lambda r: r["toplam_ms"], reverse=True)
+        return rows[:top] if top else rows
+
+    def summary(self):
+        total_ms = sum(r["ms"] for r in self.records)
+        return {
+            "calisma": self.run_name,
+            "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "toplam_komut": len(self.records),
+            "toplam_ms": round(total_ms, 1),
+            "komutlar": self._group(self.records, "komut"),
+            "fazlar": self._group(self.records, "faz"),
+            "hedefler": self._group(self.records, "hedef", top=15),
+            "cagiranlar": self._group(self.records, "cagiran", top=15),
+            "kayitlar": self.records,
+        }
+
+    def print_summary(self, summary=None):
+        summary = summary or self.summary()
+        print("\n" + "=" * 80)
+        print(f"⏱ WEBDRIVER PROFİLİ: {summary['calisma']} | "
+              f"{summary['toplam_komut']} komut, {summary['toplam_ms']:.0f} ms")
+        print("=" * 80)
+
+        tables = (("Komut", "komut", "komutlar"), ("Faz", "faz", "fazlar"),
+                  ("Hedef", "hedef", "hedefler"), ("Çağıran", "cagiran", "cagiranlar"))
+        for title, key, section in tables:
+            rows = summary[section][:10]
+            if not rows:
+                continue
+            print(f"\n{title:<56} {'Adet':>6} {'Toplam ms':>10} {'Ort ms':>8}")
+            print("-" * 83)
+            for row in rows:
+                name = str(row[key]) or "-"
+                name = name[:53] + "…" if len(name) > 56 else name
+                print(f"{name:<56} {row['adet']:>6} {row['toplam_ms']:>10.1f} {row['ort_ms']:>8.2f}")
+
+    def save(self, summary=None, path=None):
+        summary = summary or self.summary()
+        if path is None:
+            os.makedirs(PROFILE_DIR, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(PROFILE_DIR, f"webdriver_{summary['calisma']}_{timestamp}.json")
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        return path
+
+    def finish(self):
+        """Çalışmayı bitirir: tabloyu basar, JSON'a yazar. Profil kapalıysa bir şey yapmaz."""
+        if not self.enabled:
+            return None
+        summary = self.summary()
+        self.print_summary(summary)
+        path = self.save(summary)
+        print(f"\n💾 Profil kaydedildi: {path}")
+        return summary
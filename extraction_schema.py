@@ -0,0 +1,276 @@
+"""
+🧩 BİLDİRİMSEL ÇIKARIM ŞEMASI
+Senaryo: "Her yeni site için iç içe try/except selector döngüsü yazmak yerine
+          bir şema yaz: kapsayıcı selector'lar + her alan için sıralı yedek
+          selector'lar. Şema bir kere JavaScript'e derlenir, sayfa başına TEK
+          WebDriver çağrısıyla tüm kartlar çıkarılır!"
+
+Şema formatı:
+    SCHEMA = {
+        "name": "urun_karti",
+        "container": ["[class*='product-card']", "li[class*='product']"],
+        "container_mode": "first",   # "first": min_items'a ulaşan ilk selector | "union": hepsinin birleşimi
+        "min_items": 3,
+        "limit": 20,
+        "fields": {
+            "baslik": {"selectors": ["h3", "h2", "a"], "min_length": 5, "max_length": 100, "required": True},
+            "link":   {"selectors": ["a"], "attr": "href", "default": "Link Yok"},
+            "fiyat":  {"selectors": ["[class*='price']"], "match": "\\\\d", "post": "price"},
+            "etiket": {"selectors": ["[class*='tag']", "span"], "all": 3},
+        },
+    }
+
+Alan seçenekleri:
+    selectors   Sırayla denenir, ilk geçerli değer kazanır ("&" kapsayıcının kendisidir)
+    attr        Metin yerine okunacak attribute (liste verilirse sırayla: ["src", "data-src"])
+    min_length  Değer bundan UZUN olmalı (varsayılan 0: boş olmasın)
+    max_length  Değer bu uzunlukta kesilir
+    match       Değerin içermesi gereken düzenli ifade (JS/Python ortak alt küme)
+    all         Eşleşen ilk selector'daki tüm metinlerden en fazla N tanesi ", " ile birleştirilir
+    required    Değer bulunamazsa kart atlanır
+    default     Değer bulunamazsa yazılacak değer (verilmemişse alan sonuca hiç yazılmaz)
+    post        Python tarafında uygulanan işlemci adı/fonksiyonu (veya listesi), bkz. POST_PROCESSORS
+
+Kullanım:
+    from extraction_schema import compile_schema
+    sonuc = compile_schema(SCHEMA).run(driver)           # canlı tarayıcı (1 round-trip)
+    sonuc = compile_schema(SCHEMA).run_on_dom(doc, url)  # html_dom ağacı (statik/snapshot)
+"""
+
+import json
+import re
+from urllib.parse import urljoin
+
+SELF_SELECTOR = "&"
+URL_ATTRS = ["href", "src", "data-src", "data-href", "data-original"]  # Mutlak URL'ye çevrilir
+
+
+def parse_price(text):
+    """'12.499,90 TL' -> 12499.9 (Türkçe binlik/ondalık ayracı)"""
+    numbers = re.findall(r'\d+[\.,]?\d*', str(text).replace('.', '').replace(',', '.'))
+    return float(numbers[0]) if numbers else None
+
+
+POST_PROCESSORS = {
+    "price": parse_price,
+    "int": lambda v: int(re.sub(r'\D', '', v) or 0),
+    "lower": str.lower,
+    "strip": str.strip,
+}
+
+# Derlenen şemanın gövdesi; __SPEC__ yerine şemanın JSON'u yazılır
+_EXTRACTOR_TEMPLATE = """
+var spec = __SPEC__;
+var limit = arguments[0] || spec.limit, containerSelectors = arguments[1] || spec.container;
+var probes = 0;
+
+function textOf(el) { return (el.innerText || el.textContent || '').trim(); }
+
+function valueOf(el, field) {
+    if (!field.attr) return textOf(el);
+    for (var i = 0; i < field.attr.length; i++) {
+        var name = field.attr[i];
+        var value = (typeof el[name] === 'string' && el[name]) ? el[name] : el.getAttribute(name);
+        if (!value) continue;
+        value = value.trim();
+        if (spec.url_attrs.indexOf(name) !== -1) {
+            try { value = new URL(value, document.baseURI).href; } catch (e) {}
+        }
+        return value;
+    }
+    return null;
+}
+
+function accept(value, field) {
+    if (!value || value.length <= field.min_length) return false;
+    return !field.match || new RegExp(field.match).test(value);
+}
+
+function matches(card, selector) {
+    probes++;
+    if (selector === '&') return [card];
+    try { return card.querySelectorAll(selector); } catch (e) { return []; }
+}
+
+function extractField(card, field) {
+    for (var i = 0; i < field.selectors.length; i++) {
+        var found = matches(card, field.selectors[i]);
+        if (field.all) {
+            var texts = [];
+            for (var j = 0; j < found.length && texts.length < field.all; j++) {
+                var t = valueOf(found[j], field);
+                if (accept(t, field)) texts.push(t);
+            }
+            if (texts.length) return texts.join(', ');
+        } else if (found.length) {
+            var value = valueOf(found[0], field);
+            if (accept(value, field)) return field.max_length ? value.substring(0, field.max_length) : value;
+        }
+    }
+    return null;
+}
+
+var cards = [], seen = new Set(), counts = {}, usedSelector = null;
+for (var i = 0; i < containerSelectors.length; i++) {
+    probes++;
+    var found;
+    try { found = document.querySelectorAll(containerSelectors[i]); } catch (e) { continue; }
+    if (found.length > 0) counts[containerSelectors[i]] = found.length;
+    if (spec.container_mode === 'first') {
+        if (found.length >= spec.min_items) { cards = Array.prototype.slice.call(found); usedSelector = containerSelectors[i]; break; }
+        continue;
+    }
+    for (var j = 0; j < found.length; j++) {
+        if (!seen.has(found[j])) { seen.add(found[j]); cards.push(found[j]); }
+    }
+}
+
+var items = [];
+for (var c = 0; c < cards.length && c < limit; c++) {
+    var item = {}, skip = false;
+    for (var f = 0; f < spec.fields.length; f++) {
+        var field = spec.fields[f];
+        var value = extractField(cards[c], field);
+        if (value === null && field.required) { skip = true; break; }
+        item[field.name] = value;
+    }
+    if (!skip) items.push(item);
+}
+
+return {items: items, container: usedSelector, counts: counts, total: cards.length, probes: probes};
+"""
+
+_compiled = {}
+
+
+class CompiledSchema:
+    """Bir kere derlenmiş şema: tarayıcıda tek çağrı, html_dom üzerinde aynı kurallar."""
+
+    def __init__(self, schema):
+        self.name = schema.get("name", "sema")
+        self.limit = schema.get("limit", 20)
+        self.container = list(schema["container"])
+        self.container_mode = schema.get("container_mode", "union")
+        self.min_items = schema.get("min_items", 1)
+        self.fields = []
+        self.post = {}
+
+        for name, field in schema["fields"].items():
+            attr = field.get("attr")
+            self.fields.append({
+                "name": name,
+                "selectors": list(field["selectors"]),
+                "attr": [attr] if isinstance(attr, str) else attr,
+                "min_length": field.get("min_length", 0),
+                "max_length": field.get("max_length"),
+                "match": field.get("match"),
+                "all": field.get("all"),
+                "required": field.get("required", False),
+                "default": field.get("default"),
+            })
+            post = field.get("post") or []
+            self.post[name] = [POST_PROCESSORS[p] if isinstance(p, str) else p
+                               for p in (post if isinstance(post, (list, tuple)) else [post])]
+
+        spec = {"limit": self.limit, "container": self.container, "container_mode": self.container_mode,
+                "min_items": self.min_items, "fields": self.fields, "url_attrs": URL_ATTRS}
+        self.js = _EXTRACTOR_TEMPLATE.replace("__SPEC__", json.dumps(spec, ensure_ascii=False))
+
+    def _finish(self, result):
+        """Varsayılan değerleri ve Python işlemcilerini uygular."""
+        for item in result["items"]:
+            for field in self.fields:
+                name = field["name"]
+                value = item.get(name)
+                if value is not None:
+                    for processor in self.post[name]:
+                        value = processor(value)
+                if value is not None:
+                    item[name] = value
+                elif field["default"] is not None:
+                    item[name] = field["default"]
+                else:
+                    item.pop(name, None)
+        return result
+
+    def run(self, driver, limit=None, container=None):
+        """
+        Şemayı canlı sayfada tek execute_script çağrısıyla çalıştırır.
+
+        Returns:
+            {"items", "container" (first modunda kazanan selector), "counts", "total", "probes"}
+        """
+        return self._finish(driver.execute_script(self.js, limit, container))
+
+    # ------------------------------------------------------------------
+    # html_dom karşılığı (statik analiz ve snapshot için)
+    # ------------------------------------------------------------------
+
+    def _dom_value(self, node, field, page_url):
+        if not field["attr"]:
+            return node.text
+        for name in field["attr"]:
+            value = (node.get(name) or "").strip()
+            if value:
+                return urljoin(page_url, value) if name in URL_ATTRS else value
+        return None
+
+    def _dom_accept(self, value, field):
+        if not value or len(value) <= field["min_length"]:
+            return False
+        return not field["match"] or re.search(field["match"], value) is not None
+
+    def _dom_field(self, card, field, page_url):
+        for selector in field["selectors"]:
+            found = [card] if selector == SELF_SELECTOR else card.select(selector)
+            if field["all"]:
+                texts = [v for v in (self._dom_value(n, field, page_url) for n in found)
+                         if self._dom_accept(v, field)][:field["all"]]
+                if texts:
+                    return ", ".join(texts)
+            elif found:
+                value = self._dom_value(found[0], field, page_url)
+                if self._dom_accept(value, field):
+                    return value[:field["max_length"]] if field["max_length"] else value
+        return None
+
+    def run_on_dom(self, doc, page_url, limit=None, container=None):
+        """run() ile aynı sonucu html_dom ağacı üzerinde üretir (tarayıcısız)."""
+        limit = limit or self.limit
+        cards, seen, counts, used = [], set(), {}, None
+        for selector in container or self.container:
+            found = doc.select(selector)
+            if found:
+                counts[selector] = len(found)
+            if self.container_mode == "first":
+                if len(found) >= self.min_items:
+                    cards, used = found, selector
+                    break
+                continue
+            for node in found:
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    cards.append(node)
+
+        items = []
+        for card in cards[:limit]:
+            item = {}
+            for field in self.fields:
+                value = self._dom_field(card, field, page_url)
+                if value is None and field["required"]:
+                    break
+                item[field["name"]] = value
+            else:
+                items.append(item)
+
+        return self._finish({"items": items, "container": used, "counts": counts,
+                             "total": len(cards), "probes": None})
+
+
+def compile_schema(schema):
+    """Şemayı derler; aynı şema ikinci kez derlenmez (önbellekten döner)."""
+    key = json.dumps(schema, sort_keys=True, default=repr, ensure_ascii=False)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = CompiledSchema(schema)
+    return compiled
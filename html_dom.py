@@ -0,0 +1,354 @@
+"""
+🌳 HAFİF HTML DOM + CSS SELECTOR MOTORU
+Senaryo: "Sunucudan gelen ham HTML'i Chrome açmadan ağaca çevir,
+          bot'ların kullandığı CSS selector'larıyla sorgula."
+
+Sadece standart kütüphane (html.parser) kullanır, ek paket gerektirmez.
+
+Desteklenen selector söz dizimi (bot'ların kullandığı kadarı):
+    tag, *, #id, .class, [attr], [attr=v], [attr*=v], [attr^=v], [attr$=v],
+    [attr~=v], [attr|=v], [attr=v i], ':not(basit)', virgül listesi,
+    alt öğe (boşluk), doğrudan çocuk (>), bitişik kardeş (+) ve genel kardeş (~)
+    birleştiricileri. Diğer sözde sınıflar (:hover, :first-child...) ValueError verir.
+
+Kullanım:
+    doc = parse_html(html)
+    for card in doc.select("article, [class*='card']"):
+        title = card.select_one("h2, h3")
+        print(title.text if title else "-")
+"""
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+}
+
+# Metni hesaplanırken atlanan etiketler (tarayıcıdaki innerText gibi)
+NON_TEXT_TAGS = {"script", "style", "template", "noscript", "head"}
+
+# Metinde kendinden önce/sonra boşluk bırakan etiketler (innerText'teki satır sonu gibi)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table",
+    "td", "th", "tr", "ul",
+}
+
+# Açılınca açık <p>'yi kapatan blok etiketler
+P_CLOSERS = {
+    "address", "article", "aside", "blockquote", "div", "dl", "fieldset", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav",
+    "ol", "p", "pre", "section", "table", "ul",
+}
+
+# Kendi türünden yeni bir kardeş açılınca kapanan etiketler (yeni <tr>, açık hücreyle
+# birlikte önceki satırı kapatır; hücre kapanıp satır açık kalırsa satırlar iç içe girer)
+IMPLICIT_SIBLING_CLOSE = {
+    "li": {"li"},
+    "dt": {"dt", "dd"},
+    "dd": {"dt", "dd"},
+    "option": {"option"},
+    "tr": {"tr"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+}
+
+
+class Node:
+    """Bir HTML elementi. Metin çocukları düz str olarak tutulur."""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+
+    def __repr__(self):
+        return f"<Node {self.tag} {self.attrs}>"
+
+    # ------------------------------------------------------------------
+    # Gezinme
+    # ------------------------------------------------------------------
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    def iter(self):
+        """Kendisi hariç tüm alt elementleri belge sırasıyla gezer."""
+        stack = [c for c in reversed(self.children) if isinstance(c, Node)]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(c for c in reversed(node.children) if isinstance(c, Node))
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    # ------------------------------------------------------------------
+    # Metin
+    # ------------------------------------------------------------------
+    def _text_parts(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            elif child.tag in BLOCK_TAGS:
+                parts.append(" ")
+                child._text_parts(parts)
+                parts.append(" ")
+            elif child.tag not in NON_TEXT_TAGS:
+                child._text_parts(parts)
+
+    @property
+    def text(self):
+        """Boşlukları sadeleştirilmiş görünür metin (script/style hariç)."""
+        parts = []
+        self._text_parts(parts)
+        return " ".join("".join(parts).split())
+
+    @property
+    def raw_text(self):
+        """Elementin içindeki ham metin (script içeriği dahil, örn. JSON-LD için)."""
+        return "".join(c for c in self.children if isinstance(c, str))
+
+    # ------------------------------------------------------------------
+    # Sorgulama
+    # ------------------------------------------------------------------
+    def select(self, selector):
+        """CSS selector'a uyan tüm alt elementleri belge sırasıyla döner."""
+        groups = compile_selector(selector)
+        return [node for node in self.iter() if any(_match_complex(node, g) for g in groups)]
+
+    def select_one(self, selector):
+        groups = compile_selector(selector)
+        for node in self.iter():
+            if any(_match_complex(node, g) for g in groups):
+                return node
+        return None
+
+    def find_all(self, tag):
+        """Etiket adına göre hızlı arama (selector ayrıştırmadan)."""
+        return [node for node in self.iter() if node.tag == tag]
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self.stack = [self.root]
+
+    def _close_until(self, tags, stop_at=("ul", "ol", "table", "tbody", "dl", "select")):
+        """Yığının tepesinden itibaren 'tags' içindeki ilk açık elementi kapatır."""
+        for i in range(len(self.stack) - 1, 0, -1):
+            tag = self.stack[i].tag
+            if tag in tags:
+                del self.stack[i:]
+                return
+            if tag in stop_at:
+                return
+
+    def handle_starttag(self, tag, attrs):
+        if tag in P_CLOSERS:
+            self._close_until({"p"}, stop_at=("div", "section", "article", "td", "li", "button"))
+        if tag in IMPLICIT_SIBLING_CLOSE:
+            self._close_until(IMPLICIT_SIBLING_CLOSE[tag])
+
+        parent = self.stack[-1]
+        node = Node(tag, {k: (v if v is not None else "") for k, v in attrs}, parent)
+        parent.children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        # Tarayıcılar boş olmayan etiketteki '/'ı yok sayar: <div/> açık bir <div>'dir
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i:]
+                return
+        # Eşi olmayan kapanış etiketi: tarayıcı gibi yok say
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html):
+    """HTML metnini Node ağacına çevirir; kök '#document' düğümüdür."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# ============================================================================
+# CSS SELECTOR DERLEYİCİ
+# ============================================================================
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s*(?P<comb>[>+~])\s*|\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*
+        (?:(?P<op>[*^$~|]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*(?P<flag>[iI])?\s*)?
+    \]
+  | :not\((?P<not>[^)]*)\)
+""", re.VERBOSE)
+
+
+def _split_top_level(selector):
+    """Virgüllere böler (köşeli parantez / tırnak / :not içindekiler hariç)."""
+    parts, depth, quote, current = [], 0, None, []
+    for ch in selector:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    parts.append("".join(current).strip())
+    return [p for p in parts if p]
+
+
+def _compile_complex(selector):
+    """
+    Tek bir karmaşık selector'ı [(birleştirici, basit_kosullar), ...] listesine
+    çevirir. Liste sağdan sola eşleştirilir; ilk elemanın birleştiricisi None'dır.
+    """
+    steps = []
+    current = {"tag": None, "id": None, "classes": [], "attrs": [], "nots": []}
+    combinator = None
+    pos = 0
+    selector = selector.strip()
+
+    def flush():
+        steps.append((combinator, current))
+
+    while pos < len(selector):
+        m = _TOKEN_RE.match(selector, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Desteklenmeyen selector: {selector!r}")
+        pos = m.end()
+
+        if m.group("ws") is not None:
+            flush()
+            combinator = m.group("comb") or " "
+            current = {"tag": None, "id": None, "classes": [], "attrs": [], "nots": []}
+        elif m.group("tag"):
+            current["tag"] = None if m.group("tag") == "*" else m.group("tag").lower()
+        elif m.group("id"):
+            current["id"] = m.group("id")
+        elif m.group("cls"):
+            current["classes"].append(m.group("cls"))
+        elif m.group("attr"):
+            value = m.group("dq")
+            if value is None:
+                value = m.group("sq")
+            if value is None:
+                value = m.group("bare")
+            current["attrs"].append((m.group("attr").lower(), m.group("op"), value, bool(m.group("flag"))))
+        elif m.group("not") is not None:
+            current["nots"].append(compile_selector(m.group("not")))
+
+    flush()
+    return steps
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector):
+    """Selector listesini derler ve önbelleğe alır."""
+    return tuple(_compile_complex(part) for part in _split_top_level(selector))
+
+
+def _match_attr(node, name, op, value, ignore_case):
+    if name not in node.attrs:
+        return False
+    if op is None:
+        return True
+
+    actual = node.attrs[name]
+    if ignore_case:
+        actual, value = actual.lower(), value.lower()
+
+    if op == "=":
+        return actual == value
+    if op == "*=":
+        return bool(value) and value in actual
+    if op == "^=":
+        return bool(value) and actual.startswith(value)
+    if op == "$=":
+        return bool(value) and actual.endswith(value)
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    return False
+
+
+def _match_compound(node, cond):
+    if cond["tag"] and node.tag != cond["tag"]:
+        return False
+    if cond["id"] and node.attrs.get("id") != cond["id"]:
+        return False
+    if cond["classes"]:
+        classes = node.classes
+        if any(c not in classes for c in cond["classes"]):
+            return False
+    for name, op, value, ignore_case in cond["attrs"]:
+        if not _match_attr(node, name, op, value, ignore_case):
+            return False
+    for groups in cond["nots"]:
+        if any(_match_complex(node, g) for g in groups):
+            return False
+    return True
+
+
+def _previous_siblings(node):
+    if node.parent is None:
+        return []
+    siblings = [c for c in node.parent.children if isinstance(c, Node)]
+    return list(reversed(siblings[:siblings.index(node)]))
+
+
+def _match_complex(node, steps, index=None):
+    if index is None:
+        index = len(steps) - 1
+    combinator_after, cond = steps[index]
+    if not _match_compound(node, cond):
+        return False
+    if index == 0:
+        return True
+
+    # steps[index][0], bu adım ile soldaki adım arasındaki birleştiricidir
+    combinator = combinator_after
+    if combinator == ">":
+        parent = node.parent
+        return parent is not None and parent.tag != "#document" and _match_complex(parent, steps, index - 1)
+    if combinator == " ":
+        return any(a.tag != "#document" and _match_complex(a, steps, index - 1) for a in node.ancestors())
+    if combinator == "+":
+        prev = _previous_siblings(node)
+        return bool(prev) and _match_complex(prev[0], steps, index - 1)
+    if combinator == "~":
+        return any(_match_complex(s, steps, index - 1) for s in _previous_siblings(node))
+    return False
@@ -0,0 +1,456 @@
+"""
+📼 HTTP KAYIT / OYNATMA ARŞİVİ (Çevrimdışı, Hızlı, Tekrarlanabilir Koşular)
+Senaryo: "Her koşu canlı seyyahlab.com / hepsiburada.com'a gidiyor: yavaş, her
+          seferinde farklı sonuç, internet yoksa hiç çalışmıyor. Bir kere kayıt
+          modunda koş, tarayıcının aldığı tüm cevapları diske yaz; sonra oynatma
+          modunda aynı cevapları diskten ver, ağa hiç çıkma!"
+
+Nasıl çalışır:
+    Tarayıcıya chromedriver'ın yanında ikinci bir DevTools bağlantısı açılır
+    (debuggerAddress). Tüm sekmelere (yeni sekmeler ve izole bağlamlar dahil,
+    Target.setAutoAttach) Fetch.enable verilir; her istek Fetch.requestPaused
+    olayıyla durdurulur:
+        kayit   İstek ağa gider, cevap aşamasında gövde (Fetch.getResponseBody)
+                arşive yazılır
+        oynat   Cevap arşivden verilir (Fetch.fulfillRequest); arşivde olmayan
+                istek "internet yok" hatasıyla düşürülür
+        karma   Arşivde olan diskten, olmayan ağdan gelir ve arşive eklenir
+
+Arşiv biçimi (klasör):
+    index.jsonl           Her satır bir cevap: yöntem, url, durum, başlıklar, gövde özeti (HAR'a benzer)
+    govde/ab/abcdef...    Gövdeler içerik adresli (sha256) - aynı dosya bir kere saklanır
+    (python http_archive.py <klasör> --har cikti.har  → gerçek HAR 1.2 dışa aktarımı)
+
+Kullanım (tüm script'ler driver_factory.create_driver ile açıldığı için ortam değişkeni yeterli):
+    HTTP_ARSIV=arsiv/seyyahlab HTTP_ARSIV_MODU=kayit python asdasdas.py
+    HTTP_ARSIV=arsiv/seyyahlab HTTP_ARSIV_MODU=oynat python asdasdas.py      # çevrimdışı
+    HTTP_ARSIV=arsiv/testler HTTP_ARSIV_MODU=oynat python parallel_tests.py
+
+    from http_archive import HttpReplay
+    replay = HttpReplay(driver, "arsiv/hepsiburada", mode="kayit").start()
+
+Not: Sadece tarayıcı istekleri arşivlenir; Python tarafındaki requests çağrıları
+(link_checker, static_analyzer, sitemap_crawler) kapsam dışıdır.
+"""
+
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.request import urlopen
+
+import websocket
+
+logger = logging.getLogger(__name__)
+
+MODES = ("kayit", "oynat", "karma")
+
+# Her istekte değişen, cevabı etkilemeyen sorgu parametreleri (önbellek kırıcılar, kampanya izleri)
+IGNORED_QUERY_PARAMS = {"_", "cb", "nocache", "timestamp", "utm_source", "utm_medium", "utm_campaign",
+                        "utm_term", "utm_content", "gclid", "fbclid"}
+
+# Gövde çözülmüş saklanır; bu başlıklar oynatmada yanlış olur
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# Fetch olayları bu tiplerdeki hedeflerde yakalanır (diğerleri sadece devam ettirilir)
+INTERCEPTED_TARGETS = {"page", "iframe"}
+
+
+def archive_key(method, url, post_data=None):
+    """Aynı isteği tanıyan anahtar: yöntem + (gürültü parametreleri atılmış) URL + gövde özeti."""
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in IGNORED_QUERY_PARAMS])
+    key = f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))}"
+    if post_data:
+        key += " " + hashlib.sha256(post_data.encode("utf-8")).hexdigest()[:16]
+    return key
+
+
+class HttpArchive:
+    """Diskteki kayıt arşivi (index.jsonl + içerik adresli gövdeler)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.index_file = os.path.join(path, "index.jsonl")
+        self.body_dir = os.path.join(path, "govde")
+        os.makedirs(self.body_dir, exist_ok=True)
+        self.entries = {}  # anahtar -> kayıt (aynı anahtarda sonuncusu geçerli)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.entries[entry["anahtar"]] = entry
+        except FileNotFoundError:
+            pass
+
+    def _body_path(self, digest):
+        return os.path.join(self.body_dir, digest[:2], digest)
+
+    def lookup(self, method, url, post_data=None):
+        return self.entries.get(archive_key(method, url, post_data))
+
+    def body(self, entry):
+        if not entry["govde"]:
+            return b""
+        with open(self._body_path(entry["govde"]), "rb") as f:
+            return f.read()
+
+    def add(self, method, url, status, headers, body, post_data=None):
+        """Cevabı arşive ekler; gövde daha önce saklandıysa tekrar yazılmaz."""
+        digest = hashlib.sha256(body).hexdigest() if body else None
+        entry = {
+            "anahtar": archive_key(method, url, post_data),
+            "yontem": method.upper(),
+            "url": url,
+            "durum": status,
+            "basliklar": [h for h in headers if h["name"].lower() not in DROPPED_HEADERS],
+            "govde": digest,
+            "boyut": len(body),
+            "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with self._lock:
+            if digest and not os.path.exists(self._body_path(digest)):
+                os.makedirs(os.path.dirname(self._body_path(digest)), exist_ok=True)
+                with open(self._body_path(digest), "wb") as f:
+                    f.write(body)
+            with open(self.index_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.entries[entry["anahtar"]] = entry
+        return entry
+
+    def summary(self):
+        digests = {e["govde"] for e in self.entries.values() if e["govde"]}
+        size = sum(os.path.getsize(self._body_path(d)) for d in digests if os.path.exists(self._body_path(d)))
+        return {"kayit": len(self.entries), "benzersiz_govde": len(digests),
+                "boyut_mb": round(size / 1024 / 1024, 2)}
+
+    def export_har(self, path):
+        """Arşivi HAR 1.2 dosyası olarak yazar (tarayıcı DevTools'unda açılabilir)."""
+        def mime_of(entry):
+            return next((h["value"] for h in entry["basliklar"] if h["name"].lower() == "content-type"), "")
+
+        har_entries = []
+        for entry in self.entries.values():
+            body = self.body(entry)
+            har_entries.append({
+                "startedDateTime": datetime.strptime(entry["tarih"], "%Y-%m-%d %H:%M:%S").isoformat(),
+                "time": 0,
+                "request": {"method": entry["yontem"], "url": entry["url"], "httpVersion": "HTTP/1.1",
+                            "headers": [], "queryString": [], "cookies": [], "headersSize": -1, "bodySize": -1},
+                "response": {"status": entry["durum"], "statusText": "", "httpVersion": "HTTP/1.1",
+                             "headers": entry["basliklar"], "cookies": [], "redirectURL": "",
+                             "headersSize": -1, "bodySize": entry["boyut"],
+                             "content": {"size": entry["boyut"], "mimeType": mime_of(entry),
+                                         "text": base64.b64encode(body).decode("ascii"), "encoding": "base64"}},
+                "cache": {},
+                "timings": {"send": 0, "wait": 0, "receive": 0},
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"log": {"version": "1.2", "creator": {"name": "http_archive", "version": "1.0"},
+                               "entries": har_entries}}, f, ensure_ascii=False)
+
+
+class CdpConnection:
+    """Tarayıcının DevTools websocket'ine ikinci (chromedriver'dan bağımsız) bağlantı."""
+
+    def __init__(self, ws_url, on_event):
+        # Origin başlığı gönderilmez (Chrome 111+ --remote-allow-origins istemesin)
+        self.ws = websocket.create_connection(ws_url, suppress_origin=True, enable_multithread=True)
+        self.on_event = on_event
+        self.closed = False
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._reader = threading.Thread(target=self._read, name="cdp-okuyucu", daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def for_driver(cls, driver, on_event):
+        address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        with urlopen(f"http://{address}/json/version", timeout=5) as response:
+            ws_url = json.load(response)["webSocketDebuggerUrl"]
+        return cls(ws_url, on_event)
+
+    def send(self, method, params=None, session_id=None, timeout=15):
+        message_id = next(self._ids)
+        slot = {"event": threading.Event(), "message": None}
+        self._pending[message_id] = slot
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        self.ws.send(json.dumps(message))
+        if not slot["event"].wait(timeout):
+            self._pending.pop(message_id, None)
+            raise TimeoutError(f"DevTools cevap vermedi: {method}")
+        reply = slot["message"]
+        if reply is None:
+            raise ConnectionError("DevTools bağlantısı kapandı")
+        if "error" in reply:
+            raise RuntimeError(f"{method}: {reply['error'].get('message')}")
+        return reply.get("result", {})
+
+    def _read(self):
+        while True:
+            try:
+                raw = self.ws.recv()
+            except Exception:
+                break
+            if not raw:
+                continue
+            message = json.loads(raw)
+            if "id" in message:
+                slot = self._pending.pop(message["id"], None)
+                if slot:
+                    slot["message"] = message
+                    slot["event"].set()
+            else:
+                self.on_event(message.get("method"), message.get("params", {}), message.get("sessionId"))
+        # Tarayıcı kapandı: bekleyen komutlar hata ile dönsün
+        self.closed = True
+        for slot in list(self._pending.values()):
+            slot["event"].set()
+        self._pending.clear()
+
+    def close(self):
+        self.closed = True
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+class HttpReplay:
+    """Bir sürücünün tüm sekmelerindeki istekleri arşive kaydeder veya arşivden cevaplar."""
+
+    def __init__(self, driver, path, mode="oynat", workers=8):
+        """
+        Args:
+            driver: Chrome WebDriver
+            path: Arşiv klasörü (yoksa oluşturulur)
+            mode: "kayit" | "oynat" | "karma"
+            workers: Aynı anda işlenen durdurulmuş istek sayısı
+        """
+        if mode not in MODES:
+            raise ValueError(f"Bilinmeyen arşiv modu: {mode} (seçenekler: {', '.join(MODES)})")
+        self.driver = driver
+        self.mode = mode
+        self.archive = HttpArchive(path)
+        self.connection = None
+        self.sessions = {}  # targetId -> sessionId
+        self.stats = {"kaydedilen": 0, "sunulan": 0, "eksik": 0, "ag": 0, "bayt": 0, "hata": 0}
+        self.missing = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="arsiv")
+
+    @property
+    def _patterns(self):
+        # Kayıtta istek aşaması sadece continueRequest olurdu; her istek iki kez durmasın
+        patterns = []
+        if self.mode != "kayit":
+            patterns.append({"urlPattern": "*", "requestStage": "Request"})
+        if self.mode != "oynat":
+            patterns.append({"urlPattern": "*", "requestStage": "Response"})
+        return patterns
+
+    def start(self):
+        self.connection = CdpConnection.for_driver(self.driver, self._on_event)
+        # Sonradan açılan sekmeler / bağlamlar Fetch açılana kadar bekletilir
+        self.connection.send("Target.setAutoAttach",
+                             {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True})
+        for target in self.connection.send("Target.getTargets")["targetInfos"]:
+            if target["type"] in INTERCEPTED_TARGETS and target["targetId"] not in self.sessions:
+                self.connection.send("Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        logger.info(f"HTTP arşivi '{self.mode}' modunda: {self.archive.path} ({len(self.archive.entries)} kayıt)")
+        return self
+
+    def stop(self):
+        if self.connection:
+            for session_id in list(self.sessions.values()):
+                try:
+                    self.connection.send("Fetch.disable", session_id=session_id, timeout=2)
+                except Exception:
+                    pass
+            self.connection.close()
+        self._executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # DevTools olayları (okuyucu thread'i bloklanmasın diye havuzda işlenir)
+    # ------------------------------------------------------------------
+    def _on_event(self, method, params, session_id):
+        handler = {"Target.attachedToTarget": self._on_attached,
+                   "Target.detachedFromTarget": self._on_detached,
+                   "Fetch.requestPaused": self._on_paused}.get(method)
+        if handler and not self.connection.closed:
+            self._executor.submit(self._safe, handler, params, session_id)
+
+    def _safe(self, handler, params, session_id):
+        try:
+            handler(params, session_id)
+        except Exception as e:
+            if not self.connection.closed:
+                logger.debug(f"Arşiv olayı işlenemedi: {e}")
+
+    def _on_attached(self, params, _parent_session):
+        session_id, target = params["sessionId"], params["targetInfo"]
+        send = self.connection.send
+        duplicate = False
+        if target["type"] in INTERCEPTED_TARGETS:
+            with self._lock:
+                duplicate = target["targetId"] in self.sessions
+                if not duplicate:
+                    self.sessions[target["targetId"]] = session_id
+            if not duplicate:
+                send("Fetch.enable", {"patterns": self._patterns}, session_id=session_id)
+                # Sayfanın kendi alt hedefleri (başka siteden iframe'ler) için de
+                send("Target.setAutoAttach", {"autoAttach": True, "waitForDebuggerOnStart": True,
+                                              "flatten": True}, session_id=session_id)
+        if params.get("waitingForDebugger"):
+            send("Runtime.runIfWaitingForDebugger", session_id=session_id)
+        if duplicate:
+            send("Target.detachFromTarget", {"sessionId": session_id})
+
+    def _on_detached(self, params, _session_id):
+        with self._lock:
+            for target_id, session_id in list(self.sessions.items()):
+                if session_id == params.get("sessionId"):
+                    del self.sessions[target_id]
+
+    def _on_paused(self, params, session_id):
+        send = self.connection.send
+        request_id, request = params["requestId"], params["request"]
+        method, url, post_data = request["method"], request["url"], request.get("postData")
+
+        # Cevap aşaması: sadece kayıt yapan modlarda gelir
+        if "responseStatusCode" in params or "responseErrorReason" in params:
+            if "responseStatusCode" in params:
+                self._record(params, session_id)
+            send("Fetch.continueRequest", {"requestId": request_id}, session_id=session_id)
+            if self.mode == "kayit":
+                with self._lock:
+                    self.stats["ag"] += 1
+            return
+
+        entry = self.archive.lookup(method, url, post_data) if self.mode != "kayit" else None
+        if entry is not None:
+            body = self.archive.body(entry)
+            send("Fetch.fulfillRequest", {
+                "requestId": request_id, "responseCode": entry["durum"],
+                "responseHeaders": entry["basliklar"], "body": base64.b64encode(body).decode("ascii"),
+            }, session_id=session_id)
+            with self._lock:
+                self.stats["sunulan"] += 1
+                self.stats["bayt"] += len(body)
+        elif self.mode == "oynat":
+            send("Fetch.failRequest", {"requestId": request_id, "errorReason": "InternetDisconnected"},
+                 session_id=session_id)
+            with self._lock:
+                self.stats["eksik"] += 1
+                self.missing.append(f"{method} {url}")
+        else:
+            send("Fetch.continueRequest", {"requestId": request_id}, session_id=session_id)
+            with self._lock:
+                self.stats["ag"] += 1
+
+    def _record(self, params, session_id):
+        status = params["responseStatusCode"]
+        if status == 304:  # Tarayıcı önbelleğine dayanır; boş bağlamda oynatılamaz
+            return
+        body = b""
+        if not (300 <= status < 400 or status == 204 or params["request"]["method"] == "HEAD"):
+            # Yönlendirme / boş cevapların gövdesi yok (Location başlığı yeterli)
+            try:
+                result = self.connection.send("Fetch.getResponseBody", {"requestId": params["requestId"]},
+                                              session_id=session_id)
+                body = (base64.b64decode(result["body"]) if result.get("base64Encoded")
+                        else result["body"].encode("utf-8"))
+            except Exception as e:
+                with self._lock:
+                    self.stats["hata"] += 1
+                logger.debug(f"Gövde alınamadı ({params['request']['url']}): {e}")
+                return
+        request = params["request"]
+        self.archive.add(request["method"], request["url"], status, params.get("responseHeaders", []), body,
+                         request.get("postData"))
+        with self._lock:
+            self.stats["kaydedilen"] += 1
+            self.stats["bayt"] += len(body)
+
+    def report(self):
+        return dict(self.stats, mod=self.mode, arsiv=self.archive.path, **self.archive.summary())
+
+    def print_report(self, limit=5):
+        r = self.report()
+        print(f"📼 HTTP arşivi ({r['mod']}): {r['arsiv']} | {r['kayit']} kayıt, "
+              f"{r['benzersiz_govde']} gövde, {r['boyut_mb']} MB")
+        print(f"   Kaydedilen: {r['kaydedilen']} | Diskten sunulan: {r['sunulan']} | Ağdan: {r['ag']} | "
+              f"Arşivde yok: {r['eksik']} | {round(r['bayt'] / 1024 / 1024, 2)} MB aktarıldı")
+        for line in self.missing[:limit]:
+            print(f"   ⚠️ Arşivde yok: {line[:100]}")
+
+
+_replays = weakref.WeakKeyDictionary()
+
+
+def get_replay(driver):
+    """Sürücüye bağlı HttpReplay (yoksa None)."""
+    return _replays.get(driver)
+
+
+def attach_archive_from_env(driver):
+    """HTTP_ARSIV + HTTP_ARSIV_MODU ortam değişkenleri verilmişse sürücüye arşivi bağlar."""
+    path = os.environ.get("HTTP_ARSIV")
+    if not path:
+        return None
+    replay = HttpReplay(driver, path, mode=os.environ.get("HTTP_ARSIV_MODU", "oynat")).start()
+    _replays[driver] = replay
+    return replay
+
+
+def print_archive_report(driver):
+    replay = get_replay(driver)
+    if replay:
+        replay.print_report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP kayıt arşivinin özeti / HAR dışa aktarımı")
+    parser.add_argument("klasor", help="Arşiv klasörü")
+    parser.add_argument("--har", help="HAR 1.2 olarak yazılacak dosya")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.klasor, "index.jsonl")):
+        print(f"❌ Arşiv bulunamadı: {args.klasor}")
+        sys.exit(1)
+    archive = HttpArchive(args.klasor)
+    summary = archive.summary()
+    print(f"📼 {args.klasor}: {summary['kayit']} kayıt, {summary['benzersiz_govde']} benzersiz gövde, "
+          f"{summary['boyut_mb']} MB")
+    hosts = {}
+    for entry in archive.entries.values():
+        host = urlsplit(entry["url"]).netloc
+        hosts[host] = hosts.get(host, 0) + 1
+    for host, count in sorted(hosts.items(), key=lambda item: -item[1])[:10]:
+        print(f"   {count:>5}  {host}")
+    if args.har:
+        start = time.perf_counter()
+        archive.export_har(args.har)
+        print(f"📁 HAR: {args.har} ({time.perf_counter() - start:.1f} sn)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+⬇️ OLAY TABANLI LAZY-LOAD KAYDIRMA
+Senaryo: "Sabit time.sleep(2) ile kaydırma ya boşa bekler ya da erken biter.
+          Sayfaya MutationObserver + IntersectionObserver enjekte et, DOM büyümesi
+          durulup görünen resimler yüklenince hemen dön!"
+
+Tüm döngü tarayıcının içinde çalışır (tek execute_async_script çağrısı):
+- Her adımda sayfa kaydırılır, yeni düğüm gelmeyen adımlarda adım boyu büyür
+  (2x, en fazla 4 ekran), içerik geldiyse tekrar 1 ekrana döner.
+- Son DOM değişikliğinin üzerinden 'quiet' süre geçtiğinde ve görünür alandaki
+  resimler yüklendiğinde bir sonraki adıma geçilir.
+- Sayfanın dibinde her şey durulduğunda ya da süre bütçesi bitince döner.
+
+Kullanım:
+    from lazy_scroll import scroll_until_settled
+    sonuc = scroll_until_settled(driver, budget=15)
+    print(sonuc["elapsed_ms"], sonuc["added_nodes"])
+"""
+
+SCROLL_SETTLE_JS = """
+var budgetMs = arguments[0], quietMs = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), lastActivity = start;
+var added = 0, addedAtLastStep = 0, steps = 0;
+var viewport = window.innerHeight || 800, step = viewport;
+var pending = new Set();
+
+function track(img) {
+    if (img.complete) return;
+    pending.add(img);
+    var clear = function () { pending.delete(img); lastActivity = performance.now(); };
+    img.addEventListener('load', clear, {once: true});
+    img.addEventListener('error', clear, {once: true});
+}
+
+var io = new IntersectionObserver(function (entries) {
+    entries.forEach(function (e) {
+        if (e.isIntersecting) { track(e.target); io.unobserve(e.target); }
+    });
+}, {rootMargin: '200px'});
+
+function observeImages(root) {
+    if (root.tagName === 'IMG') { io.observe(root); return; }
+    if (!root.getElementsByTagName) return;
+    var imgs = root.getElementsByTagName('img');
+    for (var i = 0; i < imgs.length; i++) io.observe(imgs[i]);
+}
+
+var mo = new MutationObserver(function (mutations) {
+    mutations.forEach(function (m) {
+        m.addedNodes.forEach(function (n) {
+            if (n.nodeType === 1) { added++; observeImages(n); }
+        });
+    });
+    lastActivity = performance.now();
+});
+
+observeImages(document.body);
+mo.observe(document.body, {childList: true, subtree: true});
+
+function atBottom() {
+    return window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;
+}
+
+function finish(timedOut) {
+    mo.disconnect();
+    io.disconnect();
+    done({
+        elapsed_ms: Math.round(performance.now() - start),
+        added_nodes: added,
+        steps: steps,
+        height: document.documentElement.scrollHeight,
+        pending_images: pending.size,
+        timed_out: timedOut
+    });
+}
+
+function tick() {
+    var now = performance.now();
+    if (now - start > budgetMs) return finish(true);
+
+    var settled = now - lastActivity >= quietMs && pending.size === 0;
+    if (!settled) return setTimeout(tick, 50);
+    if (atBottom()) return finish(false);
+
+    // Son adımda yeni içerik gelmediyse daha büyük adım at
+    step = added > addedAtLastStep ? viewport : Math.min(step * 2, viewport * 4);
+    addedAtLastStep = added;
+
+    window.scrollBy(0, step);
+    steps++;
+    lastActivity = performance.now();  // Kaydırmanın tetikleyeceği yüklemelere fırsat ver
+    setTimeout(tick, 50);
+}
+
+tick();
+"""
+
+
+def scroll_until_settled(driver, budget=15, quiet=0.4):
+    """
+    Sayfayı lazy-load içerik durulana kadar kaydırır.
+
+    Args:
+        budget: Saniye cinsinden en fazla süre
+        quiet: DOM'da değişiklik olmadan geçmesi gereken süre (saniye)
+
+    Returns:
+        {"elapsed_ms", "added_nodes", "steps", "height", "pending_images", "timed_out"}
+    """
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(budget + 5)
+    try:
+        return driver.execute_async_script(SCROLL_SETTLE_JS, int(budget * 1000), int(quiet * 1000))
+    finally:
+        driver.set_script_timeout(previous_timeout)
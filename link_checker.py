@@ -0,0 +1,202 @@
+"""
+🩺 EŞZAMANLI LİNK DURUM KONTROLÜ (Kırık Link Avcısı)
+Senaryo: "Sayfadan 300 link topladık ama hiçbirinin çalışıp çalışmadığına bakmadık.
+          Hepsine aynı anda HEAD isteği at (olmazsa GET), aynı sunucuya aynı anda
+          en fazla birkaç istek gitsin, yönlendirme zincirini ve gecikmeyi kaydet,
+          kırıkları raporla!"
+
+Bağlantılar tek bir requests.Session havuzundan gelir (keep-alive). URL'ler
+sunucuya (host) göre gruplanır; her sunucuya en fazla per_host "şerit" açılır ve
+şeritler sunucular arasında sırayla havuza verilir. Böylece aynı sunucunun
+sırasını bekleyen URL bir işçiyi boşa tutmaz, farklı sunucular paralel ilerler.
+Aynı LinkChecker'ı paylaşan çağrılar için sunucu başına semafor ayrıca korunur.
+
+Kullanım:
+    from link_checker import check_links, summarize_links
+
+    results = check_links(["https://www.seyyahlab.com/blog", "https://example.com/yok"])
+    summary = summarize_links(results)
+    print(summary["kirik_link"], summary["link_durum_kodlari"])
+
+    python link_checker.py https://www.seyyahlab.com/robots.txt https://www.seyyahlab.com/sitemap.xml
+"""
+
+import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError
+
+from driver_factory import USER_AGENT
+
+# HEAD'e bu kodlarla cevap veren sunucular GET ile yeniden denenir
+# (HEAD desteklemeyen / bot engelleyen / HEAD'de yanlış 404 dönen siteler)
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 429, 500, 501, 503}
+
+
+class LinkChecker:
+    """Sınırlı bağlantı havuzu + host başına eşzamanlılık limiti ile link durumu kontrolü."""
+
+    def __init__(self, max_workers=16, per_host=4, timeout=(5, 10), max_redirects=10, user_agent=USER_AGENT):
+        """
+        Args:
+            max_workers: Aynı anda uçuştaki toplam istek (= bağlantı havuzu boyutu)
+            per_host: Aynı sunucuya aynı anda en fazla kaç istek
+            timeout: (bağlanma, okuma) zaman aşımı (sn)
+            max_redirects: Bu kadar yönlendirmeden sonra link kırık sayılır
+        """
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.max_redirects = max_redirects
+        self.session.headers["User-Agent"] = user_agent
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.Semaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _request(self, method, url):
+        # GET'te gövde indirilmez (stream), sadece durum kodu ve başlıklar okunur
+        response = self.session.request(method, url, timeout=self.timeout, allow_redirects=True,
+                                        stream=(method == "GET"))
+        response.close()
+        return response
+
+    def check(self, url):
+        """
+        Tek bir URL'i kontrol eder.
+
+        Returns:
+            {"url", "durum", "yontem", "ms", "son_url", "yonlendirmeler": [{"durum", "url"}],
+             "kirik", "hata"}
+        """
+        result = {"url": url, "durum": None, "yontem": "HEAD", "ms": None, "son_url": url,
+                  "yonlendirmeler": [], "kirik": True, "hata": None}
+        with self._host_semaphore(url):
+            start = time.perf_counter()  # Sıra beklemesi gecikmeye dahil değil
+            try:
+                response = self._request("HEAD", url)
+                if response.status_code in HEAD_FALLBACK_STATUSES:
+                    result["yontem"] = "GET"
+                    response = self._request("GET", url)
+            except requests.exceptions.TooManyRedirects:
+                result["hata"] = "Yönlendirme döngüsü"
+                response = None
+            except requests.exceptions.RequestException as e:
+                # HEAD'de bağlantıyı koparan sunuculara son şans; zaman aşımı / DNS hatası
+                # veren ölü sunucuya GET ile ikinci kez beklenmez
+                result["hata"] = type(e).__name__
+                response = None
+                if _is_connection_reset(e):
+                    try:
+                        result["yontem"] = "GET"
+                        response = self._request("GET", url)
+                        result["hata"] = None
+                    except requests.exceptions.RequestException:
+                        pass
+            result["ms"] = round((time.perf_counter() - start) * 1000)
+
+        if response is not None:
+            result["durum"] = response.status_code
+            result["son_url"] = response.url
+            result["yonlendirmeler"] = [{"durum": r.status_code, "url": r.url} for r in response.history]
+            result["kirik"] = response.status_code >= 400
+        return result
+
+    def _lane(self, queue, results):
+        """Bir sunucunun kuyruğundan URL çekip sırayla kontrol eder (kuyruk boşalana kadar)."""
+        while True:
+            try:
+                url = queue.popleft()
+            except IndexError:
+                return
+            results[url] = self.check(url)
+
+    def check_all(self, urls):
+        """URL'leri tekilleştirip eşzamanlı kontrol eder (sıra korunur)."""
+        unique = list(dict.fromkeys(u for u in urls if urlparse(u).scheme in ("http", "https")))
+        if not unique:
+            return []
+
+        by_host = {}
+        for url in unique:
+            by_host.setdefault(urlparse(url).netloc.lower(), deque()).append(url)
+        # Şeritler sunucular arasında sırayla verilir: önce her sunucunun ilk şeridi, sonra ikincisi...
+        lanes = []
+        for n in range(self.per_host):
+            lanes.extend(queue for queue in by_host.values() if len(queue) > n)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="link") as pool:
+            for future in [pool.submit(self._lane, queue, results) for queue in lanes]:
+                future.result()
+        return [results[url] for url in unique]
+
+    def close(self):
+        self.session.close()
+
+
+def _is_connection_reset(error):
+    """Sunucu bağlantıyı cevap vermeden kapattı / sıfırladı mı (urllib3 'Connection aborted')."""
+    return bool(error.args) and isinstance(error.args[0], ProtocolError)
+
+
+def check_links(urls, **kwargs):
+    """Tek seferlik kontrol: LinkChecker açar, URL'leri kontrol eder, kapatır."""
+    checker = LinkChecker(**kwargs)
+    try:
+        return checker.check_all(urls)
+    finally:
+        checker.close()
+
+
+def summarize_links(results):
+    """Kontrol sonuçlarını istatistiğe çevirir (self.stats'a yazılabilecek biçimde)."""
+    timed = [r["ms"] for r in results if r["ms"] is not None]
+    codes = Counter(str(r["durum"]) if r["durum"] is not None else (r["hata"] or "hata") for r in results)
+    return {
+        "kontrol_edilen_link": len(results),
+        "kirik_link": sum(1 for r in results if r["kirik"]),
+        "yonlendirilen_link": sum(1 for r in results if r["yonlendirmeler"]),
+        "link_durum_kodlari": dict(codes.most_common()),
+        "link_ort_ms": round(sum(timed) / len(timed)) if timed else None,
+        "link_en_yavas_ms": max(timed) if timed else None,
+    }
+
+
+def print_link_summary(results, limit=10):
+    summary = summarize_links(results)
+    print(f"🩺 Link kontrolü: {summary['kontrol_edilen_link']} link, {summary['kirik_link']} kırık, "
+          f"{summary['yonlendirilen_link']} yönlendirme, ortalama {summary['link_ort_ms']} ms")
+    print(f"   Durum kodları: {summary['link_durum_kodlari']}")
+    for r in [r for r in results if r["kirik"]][:limit]:
+        print(f"   ❌ {r['durum'] or r['hata']} {r['url']}")
+    return summary
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Kullanım: python link_checker.py <url> [url ...]")
+        sys.exit(1)
+    sonuclar = check_links(sys.argv[1:])
+    for r in sonuclar:
+        zincir = " → ".join(str(h["durum"]) for h in r["yonlendirmeler"])
+        print(f"   [{r['durum'] or r['hata']}] {r['yontem']:<4} {r['ms']:>5} ms  {r['url']}"
+              + (f"  ({zincir} → {r['son_url']})" if zincir else ""))
+    print_link_summary(sonuclar)
@@ -0,0 +1,96 @@
+"""
+🔗 TOPLU LİNK TOPLAMA (Batched Link Harvesting)
+Senaryo: "Sayfada 300 link varsa 600 WebDriver isteği atma!
+          Hepsini tek bir JavaScript çağrısıyla çek, sınıflandırmayı Python'da yap."
+
+Kullanım:
+    from link_harvest import harvest_links, classify_links
+
+    links = harvest_links(driver)                  # 1 round-trip
+    groups = classify_links(links, "https://www.seyyahlab.com")
+    print(len(groups["ic"]), len(groups["dis"]))
+"""
+
+from urllib.parse import urljoin, urlparse
+
+# Her <a> için: ham href, tarayıcının çözdüğü mutlak URL, görünen metin ve rel
+LINK_HARVEST_JS = """
+var anchors = document.getElementsByTagName('a');
+var links = [];
+for (var i = 0; i < anchors.length; i++) {
+    var a = anchors[i];
+    var rel = (a.getAttribute('rel') || '').toLowerCase();
+    links.push({
+        href: a.getAttribute('href'),
+        url: a.href || null,
+        text: (a.innerText || a.textContent || '').trim(),
+        rel: rel,
+        nofollow: rel.split(/\\s+/).indexOf('nofollow') !== -1
+    });
+}
+return links;
+"""
+
+WEB_SCHEMES = ("http", "https")
+
+
+def harvest_links(driver):
+    """
+    Sayfadaki tüm linkleri tek istekte döner.
+
+    Her eleman: {"href", "url", "text", "rel", "nofollow"}
+    (href: HTML'deki ham değer, url: tarayıcının çözdüğü mutlak adres)
+    """
+    return driver.execute_script(LINK_HARVEST_JS)
+
+
+def harvest_links_from_dom(doc, page_url):
+    """
+    harvest_links() ile aynı yapıyı tarayıcısız üretir (html_dom ağacından).
+    Göreli adresler, varsa <base href> dikkate alınarak mutlak URL'e çevrilir.
+    """
+    base = doc.select_one("base[href]")
+    base_url = urljoin(page_url, base.get("href")) if base else page_url
+
+    links = []
+    for a in doc.find_all("a"):
+        href = a.get("href")
+        rel = a.get("rel", "").lower()
+        links.append({
+            "href": href,
+            "url": urljoin(base_url, href.strip()) if href is not None else None,
+            "text": a.text,
+            "rel": rel,
+            "nofollow": "nofollow" in rel.split()
+        })
+    return links
+
+
+def _host(url):
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def is_internal(url, base_url):
+    """URL, base_url ile aynı alan adında (veya alt alan adında) mı?"""
+    base_host = _host(base_url)
+    host = _host(url)
+    return host == base_host or host.endswith("." + base_host)
+
+
+def classify_links(links, base_url):
+    """
+    Linkleri iç / dış / diğer olarak ayırır.
+
+    'diger': href'i olmayan veya http(s) dışı (mailto:, tel:, javascript:) linkler
+    """
+    groups = {"ic": [], "dis": [], "diger": []}
+    for link in links:
+        url = link.get("url")
+        if not url or urlparse(url).scheme not in WEB_SCHEMES:
+            groups["diger"].append(link)
+        elif is_internal(url, base_url):
+            groups["ic"].append(link)
+        else:
+            groups["dis"].append(link)
+    return groups
@@ -3,14 +3,13 @@ import time
 import os
 from datetime import datetime
 from functools import wraps
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
+from page_ready import load_page, element_present, any_ready, print_page_load_report
+from selector_cache import get_selector_cache
 
 
 # --- 1. AYARLAR (CONFIG) ---
@@ -18,6 +17,8 @@ class Config:
     BASE_URL = "https://www.seyyahlab.com"
     TIMEOUT = 20  # Saniye
     HEADLESS = False  # Tarayıcıyı gizli çalıştırmak için True yap
+    PRESET = "fast-headless" if HEADLESS else "visual"  # driver_factory ön ayarı
+    PAGE_LOAD_STRATEGY = "eager"  # "normal": tüm reklam/font yüklemesini bekler (eski davranış)
     SCREENSHOT_DIR = "raporlar/ekran_goruntuleri"
 
 
@@ -97,18 +98,32 @@ class HomePage(BasePage):
 
     def siteye_git(self):
         logger.info(f"Siteye gidiliyor: {Config.BASE_URL}")
-        self.driver.get(Config.BASE_URL)
+        # Arama ikonu/inputu DOM'a gelince hazır (yoksa tam yüklemeye kadar beklenir)
+        load_page(self.driver, Config.BASE_URL, timeout=Config.TIMEOUT, label="ana_sayfa", ready=any_ready(
+            element_present(self.SEARCH_ICON),
+            element_present(self.SEARCH_INPUT),
+            lambda d: d.execute_script("return document.readyState") == "complete",
+        ))
 
     @ekran_goruntusu_al_on_error
     def arama_yap(self, kelime):
         """Arama kutusunu bulur ve arama yapar."""
         # Bazen arama inputu gizlidir, önce bir ikona tıklamak gerekir.
         # Eğer ikon yoksa doğrudan inputa yazmayı dener.
-        try:
+        # Bu sitede geçen sefer hangi yol tuttuysa önce o denenir (ikonun boşuna beklenmesi önlenir).
+        def ikon_ile():
             self.click(self.SEARCH_ICON)
             logger.info("Arama ikonuna tıklandı.")
-        except:
-            logger.info("Arama ikonu bulunamadı, direkt input aranıyor.")
+            return self.find(self.SEARCH_INPUT)
+
+        def direkt_input():
+            return self.find(self.SEARCH_INPUT)
+
+        yollar = {self.SEARCH_ICON[1]: ikon_ile, self.SEARCH_INPUT[1]: direkt_input}
+        secilen, _ = get_selector_cache().first_match(
+            self.driver.current_url, "arama", list(yollar), lambda selector: yollar[selector]())
+        if secilen != self.SEARCH_ICON[1]:
+            logger.info("Arama ikonu kullanılmadı, direkt input kullanılıyor.")
 
         self.type_text(self.SEARCH_INPUT, kelime)
         self.find(self.SEARCH_INPUT).send_keys(Keys.ENTER)
@@ -150,13 +165,7 @@ class TestSeyyahLab:
 
     def setup_method(self):
         """Her testten önce çalışır."""
-        chrome_options = Options()
-        if Config.HEADLESS:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+        self.driver = create_driver(Config.PRESET, page_load_strategy=Config.PAGE_LOAD_STRATEGY)
         logger.info("Test Ortamı Başlatıldı.")
 
     def teardown_method(self):
@@ -189,6 +198,9 @@ class TestSeyyahLab:
         except Exception as e:
             logger.critical(f"TEST PATLADI: {e}")
         finally:
+            get_selector_cache().print_report()
+            get_selector_cache().save()
+            print_page_load_report(self.driver)
             self.teardown_method()
 
 
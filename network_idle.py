@@ -0,0 +1,158 @@
+"""
+🌐 AĞ BOŞTA (Network Idle) BEKLEME
+Senaryo: "time.sleep(5) ya 4 saniye boşa bekler ya da yetmez.
+          Chrome DevTools Network olaylarını dinle, uçuştaki istek sayısı
+          belirli bir süre boyunca sıfırda kalınca hemen devam et!"
+
+Chrome'un performans logu (DevTools Network.* olayları) kullanılır, bu yüzden
+tarayıcı açılırken logun açılması gerekir:
+
+    options = Options()
+    enable_network_events(options)
+    driver = webdriver.Chrome(service=..., options=options)
+
+    driver.get(url)
+    wait_for_network_idle(driver, replaces=5)   # eskiden: time.sleep(5)
+
+Log açılmamışsa sayfa içi Resource Timing sayacına (daha kaba) düşülür.
+"""
+
+import json
+import logging
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Bu kadar uzun süredir bitmeyen istekler (long-polling, canlı sohbet vb.) sayılmaz
+LONG_POLL_AFTER = 10.0
+
+RESOURCE_COUNT_JS = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+
+def enable_network_events(options):
+    """Chrome seçeneklerine DevTools Network olaylarını toplayan performans logunu ekler."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+class NetworkMonitor:
+    """
+    Performans logundaki Network olaylarından uçuştaki istekleri takip eder.
+
+    Log okundukça boşaldığı için sürücü başına tek bir izleyici olmalıdır
+    (get_monitor kullanın). Başka modüller olayları 'subscribe' ile dinleyebilir.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.inflight = {}  # requestId -> başlama zamanı
+        self.available = True
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """callback(method, params) her Network/Page olayı için çağrılır."""
+        self._listeners.append(callback)
+
+    def drain(self):
+        """Biriken log kayıtlarını işler; log yoksa False döner."""
+        if not self.available:
+            return False
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            self.available = False
+            logger.debug("Performans logu kapalı, sayfa içi sayaca geçiliyor")
+            return False
+
+        now = time.monotonic()
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method", "")
+            params = message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                if not params.get("request", {}).get("url", "").startswith("data:"):
+                    self.inflight.setdefault(params["requestId"], now)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                self.inflight.pop(params.get("requestId"), None)
+
+            for callback in self._listeners:
+                callback(method, params)
+        return True
+
+    def active_requests(self):
+        now = time.monotonic()
+        return sum(1 for started in self.inflight.values() if now - started < LONG_POLL_AFTER)
+
+
+_monitors = weakref.WeakKeyDictionary()
+
+
+def get_monitor(driver):
+    """Sürücüye ait (tek) NetworkMonitor'u döner."""
+    monitor = _monitors.get(driver)
+    if monitor is None:
+        monitor = _monitors[driver] = NetworkMonitor(driver)
+    return monitor
+
+
+def _wait_resource_timing(driver, quiet, timeout):
+    """Yedek yöntem: sayfa 'complete' ve yeni kaynak isteği 'quiet' süre gelmiyorsa boştadır."""
+    start = time.monotonic()
+    last_count, last_change = -1, start
+    while time.monotonic() - start < timeout:
+        state, count = driver.execute_script(RESOURCE_COUNT_JS)
+        now = time.monotonic()
+        if count != last_count or state != "complete":
+            last_count, last_change = count, now
+        elif now - last_change >= quiet:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def wait_for_network_idle(driver, quiet=0.5, timeout=15, max_inflight=0, replaces=None):
+    """
+    Uçuştaki istek sayısı 'quiet' saniye boyunca 'max_inflight' veya altında kalana kadar bekler.
+
+    Args:
+        quiet: İstek sayısının düşük kalması gereken süre (saniye)
+        timeout: En fazla bekleme (saniye)
+        max_inflight: Boşta sayılmak için izin verilen istek sayısı (reklam/analitik için 1-2 verilebilir)
+        replaces: Yerine geçtiği sabit bekleme (saniye); kazanç hesabı için loglanır
+
+    Returns:
+        Geçen süre (saniye)
+    """
+    start = time.monotonic()
+    monitor = get_monitor(driver)
+
+    idle = False
+    if monitor.drain():
+        quiet_since = None
+        while time.monotonic() - start < timeout:
+            monitor.drain()
+            now = time.monotonic()
+            if monitor.active_requests() <= max_inflight:
+                quiet_since = quiet_since or now
+                if now - quiet_since >= quiet:
+                    idle = True
+                    break
+            else:
+                quiet_since = None
+            time.sleep(0.05)
+    else:
+        idle = _wait_resource_timing(driver, quiet, timeout)
+
+    elapsed = time.monotonic() - start
+    message = f"⏱ Ağ {'boşta' if idle else 'hâlâ meşgul (zaman aşımı)'}: {elapsed:.2f} sn"
+    if replaces is not None:
+        message += f" (sabit bekleme {replaces} sn → kazanç {replaces - elapsed:+.2f} sn)"
+    if logging.getLogger().handlers:
+        logger.info(message)
+    else:
+        print(message)  # Loglama kurulmamış düz script'lerde de görünsün
+    return elapsed
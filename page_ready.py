@@ -0,0 +1,160 @@
+"""
+🏁 SAYFA HAZIRLIK KOŞULLARI (eager / none yükleme stratejisi için)
+Senaryo: "driver.get() varsayılan 'normal' stratejide her reklam, font ve takip
+          script'i bitene kadar bekliyor. Sürücüyü 'eager' veya 'none' ile aç,
+          sayfaya özel bir 'hazır' koşulu ver (ürün ızgarasında ≥N öğe, sonuç
+          başlıkları var...) ve veri gelir gelmez devam et!"
+
+Kullanım:
+    from page_ready import load_page, min_items, element_present
+
+    load_page(driver, url, ready=min_items("[class*='product-card']", 10), label="arama")
+    ...
+    print_page_load_report(driver)   # hazır oldu (ms) vs load olayı (ms) = kazanç
+
+Karşılaştırma için "mevcut davranış" sayfanın load olayıdır (loadEventEnd): 'normal'
+stratejide driver.get tam olarak o ana kadar bloklanırdı. Load olayı hazır anında
+henüz gelmemiş olabileceğinden değer, bir sonraki navigasyondan hemen önce (veya
+raporda) aynı doküman üzerinden okunur.
+"""
+
+import time
+import weakref
+
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Aynı dokümanda mıyız (timeOrigin) + ne zaman hazır olduk + load olayı bitti mi
+PAGE_CLOCK_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+return {origin: performance.timeOrigin, now: performance.now(),
+        load_end: nav ? nav.loadEventEnd : 0, dom_end: nav ? nav.domContentLoadedEventEnd : 0};
+"""
+
+
+# ============================================================================
+# HAZIRLIK KOŞULLARI (WebDriverWait.until ile kullanılabilen fonksiyonlar)
+# ============================================================================
+def dom_ready(driver):
+    """HTML ayrıştırıldı (DOMContentLoaded) - 'none' stratejisinde varsayılan koşul."""
+    return driver.execute_script("return document.readyState") != "loading"
+
+
+def min_items(selector, count):
+    """Sayfada selector'a uyan en az 'count' eleman var (tarayıcıda tek çağrıyla sayılır)."""
+    def condition(driver):
+        return driver.execute_script("return document.querySelectorAll(arguments[0]).length", selector) >= count
+    return condition
+
+
+def element_present(locator):
+    """(By, değer) locator'ı DOM'da var (görünür olması şart değil)."""
+    return EC.presence_of_element_located(locator)
+
+
+def any_ready(*conditions):
+    """Koşullardan herhangi biri sağlanınca hazır."""
+    return EC.any_of(*conditions)
+
+
+# ============================================================================
+# SAYFA YÜKLEME + GECİKME ÖLÇÜMÜ
+# ============================================================================
+class PageLoadTracker:
+    """Sürücü başına sayfa açılışlarını ve hazır/load sürelerini tutar."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = []
+        self._pending = None  # load olayı henüz okunmamış son sayfa
+
+    def load(self, url, ready=None, timeout=30, label=None):
+        """
+        driver.get + hazır koşulu. Strateji 'none' ise ve koşul verilmemişse
+        dom_ready beklenir. Hazır olma süresini (ms) döner.
+        """
+        self.collect()
+
+        start = time.perf_counter()
+        self.driver.get(url)
+        if ready is None and self.driver.caps.get("pageLoadStrategy") == "none":
+            ready = dom_ready
+        if ready is not None:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(ready)
+        wall_ms = round((time.perf_counter() - start) * 1000)
+
+        clock = self.driver.execute_script(PAGE_CLOCK_JS)
+        self._pending = {
+            "sayfa": label or url,
+            "strateji": self.driver.caps.get("pageLoadStrategy", "normal"),
+            "hazir_ms": wall_ms,
+            "sayfa_ici_hazir_ms": round(clock["now"]),
+            "_origin": clock["origin"],
+        }
+        print(f"🏁 Hazır: {self._pending['sayfa']} → {wall_ms} ms ({self._pending['strateji']})")
+        return wall_ms
+
+    def collect(self):
+        """Bekleyen sayfanın load olayı süresini okur ve kazancı hesaplar."""
+        page, self._pending = self._pending, None
+        if page is None:
+            return
+        try:
+            clock = self.driver.execute_script(PAGE_CLOCK_JS)
+        except Exception:
+            clock = None
+
+        origin = page.pop("_origin")
+        if not clock or clock["origin"] != origin:
+            page["load_ms"] = None  # Sayfa değişmiş (tıklama ile navigasyon), karşılaştırılamaz
+        elif clock["load_end"]:
+            page["load_ms"] = round(clock["load_end"])
+        else:
+            page["load_ms"] = round(clock["now"])  # Load olayı hâlâ gelmedi: en az bu kadar
+            page["load_bitmedi"] = True
+
+        if page["load_ms"] is not None:
+            page["kazanc_ms"] = page["load_ms"] - page["sayfa_ici_hazir_ms"]
+        self.pages.append(page)
+
+    def report(self):
+        self.collect()
+        measured = [p for p in self.pages if p.get("kazanc_ms") is not None]
+        return {
+            "sayfalar": self.pages,
+            "toplam_kazanc_ms": sum(p["kazanc_ms"] for p in measured),
+        }
+
+    def print_report(self):
+        report = self.report()
+        if not report["sayfalar"]:
+            return report
+        print("\n🏁 Sayfa hazırlık süreleri (hazır koşulu vs load olayı):")
+        for page in report["sayfalar"]:
+            if page["load_ms"] is None:
+                print(f"   - {page['sayfa']}: hazır {page['sayfa_ici_hazir_ms']} ms (load ölçülemedi)")
+                continue
+            prefix = "≥" if page.get("load_bitmedi") else ""
+            print(f"   - {page['sayfa']}: hazır {page['sayfa_ici_hazir_ms']} ms | load {prefix}{page['load_ms']} ms"
+                  f" | kazanç {prefix}{page['kazanc_ms']} ms")
+        print(f"   ⚡ Toplam kazanç: {report['toplam_kazanc_ms']} ms")
+        return report
+
+
+_trackers = weakref.WeakKeyDictionary()
+
+
+def get_page_load_tracker(driver):
+    tracker = _trackers.get(driver)
+    if tracker is None:
+        tracker = _trackers[driver] = PageLoadTracker(driver)
+    return tracker
+
+
+def load_page(driver, url, ready=None, timeout=30, label=None):
+    """Sayfayı açar, hazır koşulunu bekler (bkz. PageLoadTracker.load)."""
+    return get_page_load_tracker(driver).load(url, ready, timeout, label)
+
+
+def print_page_load_report(driver):
+    return get_page_load_tracker(driver).print_report()
@@ -0,0 +1,266 @@
+"""
+🧩 PARALEL TEST KOŞUCU (Süre Dengeli Parçalama / Sharding)
+Senaryo: "ax.py ve test_professional.py testleri tek tek, sırayla koşuyor; süit
+          süresi testlerin toplamı kadar. Test metotlarını N işçi sürecine dağıt
+          (her birinin kendi tarayıcısı olsun), geçmiş koşulardaki sürelere bakarak
+          parçaları dengele, sonuçları ve ekran görüntülerini tek raporda birleştir!"
+
+Her işçi ayrı bir Python sürecidir; test modülü (ve modül seviyesindeki tarayıcı
+havuzu) her süreçte ayrı yüklenir, yani her işçinin kendi Chrome'u olur.
+
+Parçalama: Testler geçmiş süreye göre büyükten küçüğe sıralanır ve her biri o an
+toplam süresi en az olan parçaya verilir (LPT). Süresi bilinmeyen test için
+bilinen sürelerin ortancası kullanılır. Süreler her koşudan sonra güncellenir:
+    ~/.cache/selenium-otomasyon/test_durations.json
+
+Kullanım:
+    python parallel_tests.py                          # ax + test_professional, 3 işçi
+    python parallel_tests.py ax --isci 2
+    python parallel_tests.py test_professional --on-ayar visual
+
+Çıktılar (raporlar/paralel_<zaman>/):
+    parca_<n>/          İşçinin ekran görüntüleri (TEST_SCREENSHOT_DIR)
+    parca_<n>.log       İşçinin konsol çıktısı
+    sonuc.json          Birleşik sonuç (test, durum, süre, parça, ekran görüntüsü)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import unittest
+from datetime import datetime
+
+from driver_cache import CACHE_DIR
+
+DURATIONS_FILE = os.path.join(CACHE_DIR, "test_durations.json")
+DEFAULT_MODULES = ["ax", "test_professional"]
+DEFAULT_DURATION = 10.0  # Hiç geçmiş yoksa test başına tahmin (sn)
+
+
+# ============================================================================
+# TEST LİSTESİ + SÜRE GEÇMİŞİ
+# ============================================================================
+def collect_test_ids(modules):
+    """Modüllerdeki test metotlarının kimliklerini döner ('ax.TestSeyyahLab.test_...')."""
+    def walk(suite):
+        for item in suite:
+            if isinstance(item, unittest.TestSuite):
+                yield from walk(item)
+            else:
+                yield item.id()
+
+    loader = unittest.TestLoader()
+    return [test_id for module in modules for test_id in walk(loader.loadTestsFromName(module))]
+
+
+def load_durations(path=DURATIONS_FILE):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations, path=DURATIONS_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def plan_shards(test_ids, workers, durations):
+    """
+    LPT dengeleme: uzun testler önce, her test en hafif parçaya.
+
+    Returns:
+        [{"testler": [...], "tahmini_sn": float}, ...] (boş parçalar atılır)
+    """
+    known = [durations[t] for t in test_ids if t in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    estimates = {t: durations.get(t, fallback) for t in test_ids}
+
+    shards = [{"testler": [], "tahmini_sn": 0.0} for _ in range(max(1, workers))]
+    for test_id in sorted(test_ids, key=lambda t: -estimates[t]):
+        lightest = min(shards, key=lambda s: s["tahmini_sn"])
+        lightest["testler"].append(test_id)
+        lightest["tahmini_sn"] += estimates[test_id]
+    return [s for s in shards if s["testler"]]
+
+
+# ============================================================================
+# İŞÇİ SÜRECİ
+# ============================================================================
+class _RecordingResult(unittest.TextTestResult):
+    """Test başına durum, süre ve (tearDown'da alınan) ekran görüntüsünü kaydeder."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records = {}
+        self._started = {}
+
+    def _set(self, test, status, detail=None):
+        record = self.records.setdefault(test.id(), {"test": test.id()})
+        record["durum"] = status
+        if detail:
+            record["hata"] = detail
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        self._set(test, "gecti")
+        super().startTest(test)
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        record = self.records[test.id()]
+        record["sure_sn"] = round(time.perf_counter() - self._started.pop(test.id()), 2)
+        record["ekran_goruntusu"] = getattr(test, "screenshot", None)
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._set(test, "basarisiz", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        # setUpModule / tearDownModule hataları test değil, _ErrorHolder olarak gelir
+        if isinstance(test, unittest.TestCase):
+            self._set(test, "hata", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._set(test, "atlandi", reason)
+
+
+def run_worker(test_ids, output):
+    """Verilen testleri bu süreçte koşar ve sonucu JSON'a yazar."""
+    suite = unittest.TestLoader().loadTestsFromNames(test_ids)
+    runner = unittest.TextTestRunner(resultclass=_RecordingResult, verbosity=2)
+    result = runner.run(suite)
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"testler": list(result.records.values())}, f, ensure_ascii=False, indent=2)
+    return result.wasSuccessful()
+
+
+# ============================================================================
+# KOORDİNATÖR
+# ============================================================================
+def run_parallel(modules=None, workers=3, preset="fast-headless", output_dir=None):
+    """
+    Testleri parçalara böler, her parçayı ayrı süreçte koşar ve sonuçları birleştirir.
+
+    Args:
+        modules: Test modülleri (varsayılan: ax, test_professional)
+        workers: İşçi süreç (= tarayıcı) sayısı
+        preset: İşçilerin driver_factory ön ayarı (SELENIUM_PRESET olarak verilir)
+        output_dir: Log / ekran görüntüsü / sonuç klasörü
+    """
+    modules = modules or DEFAULT_MODULES
+    output_dir = output_dir or os.path.join("raporlar", f"paralel_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    test_ids = collect_test_ids(modules)
+    durations = load_durations()
+    shards = plan_shards(test_ids, workers, durations)
+    print(f"🧩 {len(test_ids)} test, {len(shards)} parçaya bölündü:")
+    for n, shard in enumerate(shards, 1):
+        print(f"   Parça {n}: {len(shard['testler'])} test, tahmini {shard['tahmini_sn']:.1f} sn")
+
+    start = time.perf_counter()
+    processes = []
+    for n, shard in enumerate(shards, 1):
+        shard_dir = os.path.join(output_dir, f"parca_{n}")
+        shard["sonuc_dosyasi"] = os.path.join(output_dir, f"parca_{n}.json")
+        shard["log_dosyasi"] = os.path.join(output_dir, f"parca_{n}.log")
+        env = dict(os.environ, TEST_SCREENSHOT_DIR=shard_dir, SELENIUM_PRESET=preset, POOL_SIZE="1")
+        log = open(shard["log_dosyasi"], "w", encoding="utf-8")
+        command = [sys.executable, os.path.abspath(__file__), "--isci-modu",
+                   "--sonuc", shard["sonuc_dosyasi"], *shard["testler"]]
+        processes.append((shard, log, time.perf_counter(),
+                          subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)))
+
+    records = []
+    for n, (shard, log, shard_start, process) in enumerate(processes, 1):
+        process.wait()
+        log.close()
+        shard["gercek_sn"] = round(time.perf_counter() - shard_start, 2)
+        try:
+            with open(shard["sonuc_dosyasi"], encoding="utf-8") as f:
+                shard_records = json.load(f)["testler"]
+        except (OSError, ValueError):
+            shard_records = []
+        # İşçi çöktüyse koşulamayan testler hata sayılır
+        finished = {r["test"] for r in shard_records}
+        shard_records += [{"test": t, "durum": "hata", "hata": f"İşçi süreci çöktü (bkz. {shard['log_dosyasi']})",
+                           "sure_sn": 0, "ekran_goruntusu": None}
+                          for t in shard["testler"] if t not in finished]
+        for record in shard_records:
+            record["parca"] = n
+        records += shard_records
+    wall = time.perf_counter() - start
+
+    for record in records:
+        if record["sure_sn"]:
+            durations[record["test"]] = record["sure_sn"]
+    save_durations(durations)
+
+    report = {
+        "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "isci": len(shards),
+        "toplam_sure_sn": round(wall, 2),
+        "sirali_tahmini_sn": round(sum(r["sure_sn"] for r in records), 2),
+        "parcalar": [{"testler": s["testler"], "tahmini_sn": round(s["tahmini_sn"], 2),
+                      "gercek_sn": s["gercek_sn"], "log": s["log_dosyasi"]} for s in shards],
+        "testler": sorted(records, key=lambda r: r["test"]),
+    }
+    with open(os.path.join(output_dir, "sonuc.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    report["klasor"] = output_dir
+    return report
+
+
+def print_report(report):
+    icons = {"gecti": "✅", "basarisiz": "❌", "hata": "💥", "atlandi": "⏭️"}
+    print("\n" + "=" * 70)
+    print("🧩 PARALEL TEST RAPORU")
+    print("=" * 70)
+    for record in report["testler"]:
+        print(f"   {icons.get(record['durum'], '?')} [parça {record['parca']}] {record['test']} "
+              f"({record['sure_sn']} sn)")
+        if record.get("ekran_goruntusu"):
+            print(f"      📸 {record['ekran_goruntusu']}")
+    print("-" * 70)
+    for n, shard in enumerate(report["parcalar"], 1):
+        print(f"   Parça {n}: tahmini {shard['tahmini_sn']} sn, gerçek {shard['gercek_sn']} sn")
+    counts = {status: sum(1 for r in report["testler"] if r["durum"] == status) for status in icons}
+    speedup = report["sirali_tahmini_sn"] / report["toplam_sure_sn"] if report["toplam_sure_sn"] else 0
+    print(f"   {counts['gecti']} geçti, {counts['basarisiz']} başarısız, {counts['hata']} hata, "
+          f"{counts['atlandi']} atlandı")
+    print(f"   ⏱ {report['toplam_sure_sn']} sn (sıralı tahmini {report['sirali_tahmini_sn']} sn, "
+          f"{speedup:.1f}x) | {report['isci']} işçi")
+    print(f"📁 Rapor: {os.path.join(report['klasor'], 'sonuc.json')}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="unittest süitlerini paralel ve süre dengeli koşar")
+    parser.add_argument("hedefler", nargs="*", help="Test modülleri (işçi modunda test kimlikleri)")
+    parser.add_argument("--isci", type=int, default=3, help="Paralel süreç (tarayıcı) sayısı")
+    parser.add_argument("--on-ayar", default="fast-headless", help="İşçilerin driver_factory ön ayarı")
+    parser.add_argument("--cikti", help="Rapor klasörü (varsayılan: raporlar/paralel_<zaman>)")
+    parser.add_argument("--isci-modu", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--sonuc", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.isci_modu:
+        sys.exit(0 if run_worker(args.hedefler, args.sonuc) else 1)
+
+    report = run_parallel(args.hedefler, workers=args.isci, preset=args.on_ayar, output_dir=args.cikti)
+    print_report(report)
+    sys.exit(0 if all(r["durum"] in ("gecti", "atlandi") for r in report["testler"]) else 1)
+
+
+if __name__ == "__main__":
+    main()
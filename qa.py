@@ -1,43 +1,30 @@
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
+from driver_factory import create_driver, USER_AGENT
+from link_harvest import harvest_links
+from network_idle import wait_for_network_idle
 
 # Ayarlar
-options = Options()
-options.add_argument("--window-size=1920,1080")
-# Bot olduğumuzu gizleyelim, belki site içeriği saklıyordur
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument(
-    "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Bot olduğumuzu gizleyelim, belki site içeriği saklıyordur (bayraklar + user-agent ön ayarda)
+driver = create_driver("visual", user_agent=USER_AGENT)
 
 print("\n--- SAYFA TARANIYOR ---")
 driver.get("https://www.seyyahlab.com")
-time.sleep(5)  # Sayfanın iyice yüklenmesini bekle
+wait_for_network_idle(driver, replaces=5)  # Sayfanın iyice yüklenmesini bekle
 
-# Sayfadaki TÜM tıklanabilir (link) öğeleri bul
-linkler = driver.find_elements(By.TAG_NAME, "a")
+# Sayfadaki TÜM tıklanabilir (link) öğeleri tek istekte al
+linkler = harvest_links(driver)
 
 print(f"Toplam {len(linkler)} adet link bulundu.\n")
 
 print("-" * 50)
 for i, link in enumerate(linkler):
-    try:
-        metin = link.text.strip()  # Boşlukları temizle
-        adres = link.get_attribute("href")
-
-        # Sadece içi dolu olanları yazdır ki ekran kirlenmesin
-        if metin and len(metin) > 2:
-            print(f"[{i}] METİN: {metin}  --->  ADRES: {adres}")
-        elif adres and "blog" in adres:
-            print(f"[{i}] (İsimsiz ama Blog Linki): {adres}")
-
-    except:
-        continue  # Hata veren linki geç
+    metin = link["text"]
+    adres = link["url"]
+
+    # Sadece içi dolu olanları yazdır ki ekran kirlenmesin
+    if metin and len(metin) > 2:
+        print(f"[{i}] METİN: {metin}  --->  ADRES: {adres}")
+    elif adres and "blog" in adres:
+        print(f"[{i}] (İsimsiz ama Blog Linki): {adres}")
 
 print("-" * 50)
 print("\n--- TARAMA BİTTİ ---")
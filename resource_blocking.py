@@ -0,0 +1,175 @@
+"""
+🚫 KAYNAK ENGELLEME PROFİLİ (Sadece DOM lazım!)
+Senaryo: "Analiz botları sadece metin ve attribute okuyor ama tarayıcı her resmi,
+          fontu, videoyu, reklamı ve takip script'ini indiriyor. 'extraction'
+          profiliyle bunları DevTools üzerinden engelle, sayfa başına kaç bayt ve
+          kaç milisaniye kazanıldığını raporla!"
+
+Görseller indirilmez ama <img> etiketleri DOM'da kalır; src/alt okumaya devam edilir.
+
+Kullanım:
+    options = Options()
+    configure_options(options, "extraction")        # performans logu + görsel tercihi
+    driver = webdriver.Chrome(service=..., options=options)
+    apply_load_profile(driver, "extraction")        # Network.setBlockedURLs
+
+    meter = PageWeightMeter(driver, "extraction")
+    meter.start()
+    driver.get(url)
+    meter.measure(url)   # {"bayt", "istek", "engellenen", "yukleme_ms", "kazanilan_bayt", ...}
+
+Kazanç, aynı URL'nin "full" profille ölçülmüş son değerine göre hesaplanır
+(~/.cache/selenium-otomasyon/page_weights.json). Ek engellenecek alan adları
+BLOCKED_DOMAINS ortam değişkeniyle virgülle ayrılarak verilebilir.
+"""
+
+import json
+import os
+
+from driver_cache import CACHE_DIR
+from network_idle import enable_network_events, get_monitor
+
+LOAD_PROFILES = ("full", "extraction")
+BASELINE_FILE = os.path.join(CACHE_DIR, "page_weights.json")
+
+BLOCKED_EXTENSIONS = [
+    # Görseller
+    "jpg", "jpeg", "png", "gif", "webp", "avif", "svg", "ico", "bmp",
+    # Video / ses
+    "mp4", "webm", "ogg", "mp3", "wav", "m4a", "mov", "m3u8",
+    # Fontlar
+    "woff", "woff2", "ttf", "otf", "eot",
+]
+
+# Reklam, analitik ve takip servisleri
+THIRD_PARTY_DOMAINS = [
+    "googletagmanager.com", "google-analytics.com", "doubleclick.net", "googlesyndication.com",
+    "googleadservices.com", "adservice.google.com", "connect.facebook.net", "facebook.net",
+    "hotjar.com", "clarity.ms", "criteo.com", "criteo.net", "taboola.com", "outbrain.com",
+    "mc.yandex.ru", "analytics.tiktok.com", "useinsider.com", "segment.io", "newrelic.com",
+    "nr-data.net", "youtube.com", "ytimg.com",
+]
+
+NAVIGATION_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+return nav ? {load_ms: Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd || performance.now()),
+              dom_ms: Math.round(nav.domContentLoadedEventEnd)} : null;
+"""
+
+
+def blocked_url_patterns(extra_domains=None):
+    """Network.setBlockedURLs için joker (*) desenleri."""
+    patterns = []
+    for ext in BLOCKED_EXTENSIONS:
+        patterns += [f"*.{ext}", f"*.{ext}?*"]
+
+    domains = list(THIRD_PARTY_DOMAINS) + list(extra_domains or [])
+    domains += [d.strip() for d in os.environ.get("BLOCKED_DOMAINS", "").split(",") if d.strip()]
+    patterns += [f"*://{d}/*" for d in domains] + [f"*.{d}/*" for d in domains]
+    return patterns
+
+
+def configure_options(options, load_profile="full"):
+    """Tarayıcı açılmadan önceki ayarlar (ölçüm için performans logu her profilde açılır)."""
+    if load_profile not in LOAD_PROFILES:
+        raise ValueError(f"Bilinmeyen yükleme profili: {load_profile} (seçenekler: {', '.join(LOAD_PROFILES)})")
+    enable_network_events(options)
+    if load_profile == "extraction":
+        # Uzantısız CDN görselleri de indirilmesin (DOM'daki <img> etiketleri kalır)
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return options
+
+
+def apply_load_profile(driver, load_profile="full", extra_domains=None):
+    """Tarayıcı açıldıktan sonra engelleme listesini DevTools'a verir; desen listesini döner."""
+    if load_profile != "extraction":
+        return []
+    patterns = blocked_url_patterns(extra_domains)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    return patterns
+
+
+class PageWeightMeter:
+    """
+    DevTools Network olaylarından sayfa başına indirilen bayt / istek / engellenen
+    istek sayısını toplar ve "full" profildeki ölçümle karşılaştırır.
+    """
+
+    def __init__(self, driver, load_profile="full", baseline_file=BASELINE_FILE):
+        self.driver = driver
+        self.load_profile = load_profile
+        self.baseline_file = baseline_file
+        self.monitor = get_monitor(driver)
+        self.monitor.subscribe(self._on_event)
+        self._reset()
+
+    def _reset(self):
+        self.bytes = 0
+        self.requests = 0
+        self.blocked = 0
+
+    def _on_event(self, method, params):
+        if method == "Network.requestWillBeSent":
+            self.requests += 1
+        elif method == "Network.loadingFinished":
+            self.bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            self.blocked += 1
+
+    def start(self):
+        """Önceki sayfanın olaylarını boşaltıp sayaçları sıfırlar (navigasyondan önce çağrılır)."""
+        self.monitor.drain()
+        self._reset()
+
+    def _load_baselines(self):
+        try:
+            with open(self.baseline_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_baselines(self, baselines):
+        os.makedirs(os.path.dirname(self.baseline_file), exist_ok=True)
+        with open(self.baseline_file, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, ensure_ascii=False, indent=2)
+
+    def measure(self, url):
+        """start()'tan bu yana yüklenenleri ölçer, kazancı yazdırır ve sonucu döner."""
+        self.monitor.drain()
+        timing = self.driver.execute_script(NAVIGATION_TIMING_JS) or {}
+        result = {
+            "profil": self.load_profile,
+            "bayt": self.bytes,
+            "istek": self.requests,
+            "engellenen": self.blocked,
+            "yukleme_ms": timing.get("load_ms"),
+        }
+        if not self.monitor.available:
+            result["bayt"] = None  # Performans logu kapalı: bayt ölçülemiyor
+
+        baselines = self._load_baselines()
+        if self.load_profile == "full":
+            if result["bayt"] is not None:
+                baselines[url] = {"bayt": result["bayt"], "istek": result["istek"],
+                                  "yukleme_ms": result["yukleme_ms"]}
+                self._save_baselines(baselines)
+        elif url in baselines and result["bayt"] is not None:
+            baseline = baselines[url]
+            result["kazanilan_bayt"] = baseline["bayt"] - result["bayt"]
+            if baseline.get("yukleme_ms") and result["yukleme_ms"]:
+                result["kazanilan_ms"] = baseline["yukleme_ms"] - result["yukleme_ms"]
+
+        self._print(result, url in baselines)
+        return result
+
+    @staticmethod
+    def _print(result, has_baseline):
+        size = f"{result['bayt'] / 1024:.0f} KB" if result["bayt"] is not None else "? KB"
+        print(f"📉 Sayfa ağırlığı [{result['profil']}]: {size}, {result['istek']} istek, "
+              f"{result['engellenen']} engellendi, yükleme {result['yukleme_ms']} ms")
+        if "kazanilan_bayt" in result:
+            print(f"   ⚡ Kazanç: {result['kazanilan_bayt'] / 1024:.0f} KB, "
+                  f"{result.get('kazanilan_ms', '?')} ms")
+        elif result["profil"] != "full" and not has_baseline:
+            print("   💡 Kazanç için bu sayfayı bir kez load_profile='full' ile çalıştırın")
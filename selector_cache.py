@@ -0,0 +1,205 @@
+"""
+🎯 SELECTOR İSABET ÖNBELLEĞİ (Yedek Zincirleri İçin)
+Senaryo: "Çerez butonu için 4 selector, ürün ızgarası için 6 selector, arama için
+          önce ikon sonra input... Her çalıştırmada aynı ıskalar tekrar deneniyor.
+          Hangi selector'ın bu sitede tuttuğunu diske yaz, bir dahaki sefere önce
+          onu dene; sürekli ıskalayanları sona at!"
+
+Kayıtlar alan adı (domain) + zincir adı bazında tutulur:
+    ~/.cache/selenium-otomasyon/selectors.json
+    {"hepsiburada.com": {"cerez": {"son_kazanan": "...",
+                                   "secimler": {"<selector>": {"isabet": 3, "iska": 0, ...}}}}}
+
+Kullanım:
+    cache = get_selector_cache()
+    selector, buton = cache.first_match(driver.current_url, "cerez", SELECTORLER,
+                                        lambda s: driver.find_element(By.CSS_SELECTOR, s))
+    cache.print_report()   # atlanan başarısız deneme / kazanılan saniye
+    cache.save()           # değişiklik varsa diske yazar (süreç çıkışında da otomatik)
+
+Sadece ıskası gerçekten zaman kaybettiren zincirler (find_element bekleyen
+denemeler) önbelleğe alınmalıdır; tüm selector'ları tek JS çağrısında deneyen
+zincirlerde önbellek hiçbir şey kazandırmaz.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from driver_cache import CACHE_DIR
+
+CACHE_FILE = os.path.join(CACHE_DIR, "selectors.json")
+DEMOTE_AFTER = 3  # Art arda bu kadar ıskalayan selector zincirin sonuna atılır
+
+logger = logging.getLogger(__name__)
+
+
+def domain_of(url):
+    """'https://www.hepsiburada.com/ara?q=x' -> 'hepsiburada.com'"""
+    host = urlparse(url).hostname or url or "?"
+    return host[4:] if host.startswith("www.") else host
+
+
+class SelectorCache:
+    """Zincir başına son kazanan selector'ı ve isabet/ıska sayılarını diskte tutar."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.data = self._load()
+        self.session = {}  # zincir -> {"atlanan_iska", "fazla_iska", "kazanilan_sn", "cagri"}
+        self._dirty = False
+        self._lock = threading.RLock()  # Paralel işçiler aynı önbelleği paylaşır
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """Değişiklik varsa dosyayı yazar (her kayıtta değil; çalıştırma sonunda bir kez)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+
+    def _chain(self, domain, chain):
+        return self.data.setdefault(domain, {}).setdefault(chain, {"son_kazanan": None, "secimler": {}})
+
+    def ordered(self, url_or_domain, chain, selectors):
+        """
+        Selector'ları denenme sırasına dizer: son kazanan en başta, art arda
+        DEMOTE_AFTER kez ıskalayanlar en sonda, geri kalanlar orijinal sırada.
+        """
+        with self._lock:
+            entry = self._chain(domain_of(url_or_domain), chain)
+            stats = entry["secimler"]
+
+            def key(item):
+                index, selector = item
+                streak = stats.get(selector, {}).get("iska_serisi", 0)
+                return selector != entry["son_kazanan"], streak >= DEMOTE_AFTER, index
+
+            return [selector for _, selector in sorted(enumerate(selectors), key=key)]
+
+    def record(self, url_or_domain, chain, selectors, winner, misses=None):
+        """
+        Bir zincir denemesinin sonucunu kaydeder ve kazancı hesaplar.
+
+        Args:
+            selectors: Zincirin ORİJİNAL sırası (kazanç bu sıraya göre hesaplanır)
+            winner: Tutan selector (hiçbiri tutmadıysa None)
+            misses: Bu çağrıda ıskalanan selector'lar -> harcanan süre (sn)
+        """
+        with self._lock:
+            self._record(url_or_domain, chain, selectors, winner, misses)
+
+    def _record(self, url_or_domain, chain, selectors, winner, misses):
+        entry = self._chain(domain_of(url_or_domain), chain)
+        stats = entry["secimler"]
+        misses = misses or {}
+        miss_seconds = sum(misses.values())
+
+        for selector, seconds in misses.items():
+            s = stats.setdefault(selector, {"isabet": 0, "iska": 0, "iska_serisi": 0, "ort_iska_sn": 0.0})
+            s["ort_iska_sn"] = round((s["ort_iska_sn"] * s["iska"] + seconds) / (s["iska"] + 1), 3)
+            s["iska"] += 1
+            s["iska_serisi"] += 1
+
+        session = self.session.setdefault(chain, {"cagri": 0, "atlanan_iska": 0, "fazla_iska": 0,
+                                                  "kazanilan_sn": 0.0})
+        session["cagri"] += 1
+
+        if winner is not None:
+            s = stats.setdefault(winner, {"isabet": 0, "iska": 0, "iska_serisi": 0, "ort_iska_sn": 0.0})
+            s["isabet"] += 1
+            s["iska_serisi"] = 0
+            entry["son_kazanan"] = winner
+
+            # Önbelleksiz (orijinal sırayla) deneseydik kazanandan öncekilerin hepsi ıskalayacaktı
+            skipped_before = selectors[:selectors.index(winner)] if winner in selectors else []
+            baseline_seconds = sum(stats.get(sel, {}).get("ort_iska_sn", 0.0) for sel in skipped_before)
+            # Önbellek sırası kötü çıktıysa (eski kazanan ıskaladı) fark ayrı sayılır
+            saved = len(skipped_before) - len(misses)
+            session["atlanan_iska"] += max(saved, 0)
+            session["fazla_iska"] += max(-saved, 0)
+            session["kazanilan_sn"] += baseline_seconds - miss_seconds
+
+        self._dirty = True
+
+    def first_match(self, url_or_domain, chain, selectors, attempt):
+        """
+        Selector'ları önbellek sırasıyla dener; attempt(selector) ilk kez
+        hata vermeden doğru-değer döndüğünde (selector, sonuç) döner.
+        Hiçbiri tutmazsa (None, None).
+        """
+        misses = {}
+        for selector in self.ordered(url_or_domain, chain, selectors):
+            start = time.perf_counter()
+            try:
+                result = attempt(selector)
+            except Exception:
+                result = None
+            if result:
+                self.record(url_or_domain, chain, selectors, selector, misses)
+                return selector, result
+            misses[selector] = time.perf_counter() - start
+
+        self.record(url_or_domain, chain, selectors, None, misses)
+        return None, None
+
+    def report(self):
+        with self._lock:
+            return self._report()
+
+    def _report(self):
+        total_skipped = sum(s["atlanan_iska"] for s in self.session.values())
+        total_extra = sum(s["fazla_iska"] for s in self.session.values())
+        total_seconds = sum(s["kazanilan_sn"] for s in self.session.values())
+        return {
+            "zincirler": {chain: dict(s, kazanilan_sn=round(s["kazanilan_sn"], 2))
+                          for chain, s in self.session.items()},
+            "atlanan_iska": total_skipped,
+            "fazla_iska": total_extra,
+            "kazanilan_sn": round(total_seconds, 2),
+        }
+
+    def print_report(self):
+        report = self.report()
+        if not report["zincirler"]:
+            return
+        lines = [f"🎯 Selector önbelleği: {report['atlanan_iska']} başarısız deneme atlandı, "
+                 f"{report['kazanilan_sn']:.2f} sn bekleme kazanıldı"]
+        for chain, s in report["zincirler"].items():
+            extra = f" ({s['fazla_iska']} fazladan ıska)" if s["fazla_iska"] else ""
+            lines.append(f"   - {chain}: {s['cagri']} çağrı | {s['atlanan_iska']} ıska atlandı{extra} | "
+                         f"{s['kazanilan_sn']:+.2f} sn")
+        if logging.getLogger().handlers:
+            for line in lines:
+                logger.info(line)
+        else:
+            print("\n".join(lines))  # Loglama kurulmamış düz script'lerde de görünsün
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_selector_cache():
+    """Süreç içinde paylaşılan önbelleği döner."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SelectorCache()
+            atexit.register(_cache.save)
+    return _cache
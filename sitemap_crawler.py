@@ -0,0 +1,406 @@
+"""
+🗺️ SITEMAP TABANLI TAM SİTE TARAYICI
+Senaryo: "cz.py sitemap.xml'in var olduğunu kanıtlıyor ama kimse kullanmıyor;
+          analiz botu sadece ana sayfayı ve ilk 20 kartı görüyor. Sitemap'i
+          (ve sitemap index'lerini, .gz olanlar dahil) akış halinde oku, tekrarsız
+          bir URL listesi çıkar, her makale sayfasını işçi havuzuyla analiz et!"
+
+- Sitemap'ler robots.txt'deki 'Sitemap:' satırlarından (yoksa /sitemap.xml) bulunur.
+- XML dosyası belleğe alınmadan iterparse ile okunur; gzip (.xml.gz veya
+  Content-Encoding) otomatik açılır.
+- Sayfalar Chrome açmadan HTTP + html_dom ile analiz edilir (bkz. static_analyzer.py).
+- Nezaket: aynı sunucuya iki istek arasında en az 'delay' saniye (robots.txt
+  Crawl-delay daha büyükse o) beklenir; robots.txt'nin yasakladığı adreslere gidilmez.
+- Artımlı: ETag / Last-Modified ile koşullu istek atılır; 304 dönen veya içerik özeti
+  değişmeyen sayfa yeniden ayrıştırılmaz, önceki sonucu kullanılır (bkz. crawl_state.py).
+
+Kullanım:
+    python sitemap_crawler.py https://www.seyyahlab.com
+    python sitemap_crawler.py https://www.seyyahlab.com --dahil /blog/ --derinlik 2 --limit 200 --isci 4
+    python sitemap_crawler.py https://www.seyyahlab.com --haric "/etiket/|/kategori/" --gecikme 0.5
+    python sitemap_crawler.py https://www.seyyahlab.com --sifirdan     # durumu yok say, hepsini analiz et
+
+    from sitemap_crawler import crawl_site
+    rapor = crawl_site("https://www.seyyahlab.com", include=[r"/blog/"], max_urls=50)
+"""
+
+import argparse
+import gzip
+import io
+import json
+import logging
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawl_state import CrawlState, conditional_get
+from html_dom import parse_html
+from link_harvest import harvest_links_from_dom, classify_links
+from static_analyzer import USER_AGENT, decode_html
+
+MAX_INDEX_DEPTH = 3  # sitemap index -> sitemap index -> ... en fazla bu kadar iç içe
+CONTENT_ROOT_SELECTORS = ["article", "main", "[class*='post-content']", "[class*='entry-content']", "body"]
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# SITEMAP OKUMA (akış halinde, gzip destekli)
+# ============================================================================
+def _local_name(tag):
+    """'{http://www.sitemaps.org/schemas/sitemap/0.9}loc' -> 'loc'"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def open_stream(session, url, timeout=30):
+    """URL'i akış olarak açar; gzip içeriği (dosya veya aktarım kodlaması) açılmış döner."""
+    response = session.get(url, stream=True, timeout=timeout)
+    response.raise_for_status()
+    response.raw.decode_content = True  # Content-Encoding: gzip
+    response.raw.auto_close = False  # Gövde bitince kapanmasın; BufferedReader EOF'u kendisi görsün
+    stream = io.BufferedReader(response.raw)
+    if stream.peek(2)[:2] == b"\x1f\x8b":  # .xml.gz dosyası
+        stream = gzip.GzipFile(fileobj=stream)
+    return stream, response
+
+
+def iter_sitemap(stream):
+    """
+    Sitemap / sitemap index'i eleman eleman okur.
+    ('url' | 'sitemap', loc, lastmod) üçlüleri üretir; okunan elemanlar bellekten silinir.
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end":
+            continue
+        kind = _local_name(elem.tag)
+        if kind in ("url", "sitemap"):
+            values = {_local_name(child.tag): (child.text or "").strip() for child in elem}
+            if values.get("loc"):
+                yield kind, values["loc"], values.get("lastmod")
+            root.clear()
+
+
+def normalize_url(url):
+    """Tekrar tespiti için: fragment atılır, host küçük harf, sondaki '/' tekilleşir."""
+    parts = urlparse(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, "", parts.query, ""))
+
+
+def url_depth(url):
+    """'/blog/kapadokya-rehberi' -> 2"""
+    return len([p for p in urlparse(url).path.split("/") if p])
+
+
+class UrlFilter:
+    """Alan adı, yol derinliği ve dahil/hariç desenlerine göre URL süzgeci."""
+
+    def __init__(self, site, include=None, exclude=None, max_depth=None):
+        self.host = urlparse(site).netloc.lower()
+        self.include = [re.compile(p) for p in include or []]
+        self.exclude = [re.compile(p) for p in exclude or []]
+        self.max_depth = max_depth
+
+    def reason(self, url):
+        """URL elenecekse sebebini, geçerse None döner."""
+        host = urlparse(url).netloc.lower()
+        if host.removeprefix("www.") != self.host.removeprefix("www."):
+            return "baska_alan_adi"
+        if self.max_depth is not None and url_depth(url) > self.max_depth:
+            return "derinlik"
+        if self.include and not any(p.search(url) for p in self.include):
+            return "dahil_disi"
+        if any(p.search(url) for p in self.exclude):
+            return "haric"
+        return None
+
+
+# ============================================================================
+# SINIR (FRONTIER) OLUŞTURMA
+# ============================================================================
+def load_robots(session, site, timeout=15):
+    """robots.txt'yi okur; (RobotFileParser, sitemap adresleri) döner."""
+    robots = RobotFileParser()
+    robots_url = urljoin(site, "/robots.txt")
+    try:
+        response = session.get(robots_url, timeout=timeout)
+        lines = response.text.splitlines() if response.status_code == 200 else []
+    except requests.RequestException:
+        lines = []
+    robots.parse(lines)
+    sitemaps = robots.site_maps() or [urljoin(site, "/sitemap.xml")]
+    return robots, sitemaps
+
+
+def build_frontier(session, sitemaps, url_filter, robots=None, max_urls=None):
+    """
+    Sitemap'leri (index'ler dahil) gezer ve tekrarsız, süzülmüş URL listesini çıkarır.
+
+    Returns:
+        (frontier, stats) - frontier: [{"url", "lastmod", "sitemap"}]
+    """
+    frontier, seen, visited_maps = [], set(), set()
+    stats = {"sitemap": 0, "okunan": 0, "tekrar": 0, "robots_yasak": 0, "hatali_sitemap": []}
+    pending = [(url, 0) for url in sitemaps]
+
+    while pending and (max_urls is None or len(frontier) < max_urls):
+        sitemap_url, depth = pending.pop(0)
+        if sitemap_url in visited_maps:
+            continue
+        visited_maps.add(sitemap_url)
+
+        try:
+            stream, response = open_stream(session, sitemap_url)
+        except requests.RequestException as e:
+            stats["hatali_sitemap"].append({"sitemap": sitemap_url, "hata": str(e)})
+            continue
+
+        stats["sitemap"] += 1
+        try:
+            for kind, loc, lastmod in iter_sitemap(stream):
+                if kind == "sitemap":
+                    if depth < MAX_INDEX_DEPTH:
+                        pending.append((loc, depth + 1))
+                    continue
+
+                stats["okunan"] += 1
+                key = normalize_url(loc)
+                if key in seen:
+                    stats["tekrar"] += 1
+                    continue
+                seen.add(key)
+
+                reason = url_filter.reason(loc)
+                if reason is None and robots is not None and not robots.can_fetch(USER_AGENT, loc):
+                    reason = "robots_yasak"
+                if reason:
+                    stats[reason] = stats.get(reason, 0) + 1
+                    continue
+
+                frontier.append({"url": loc, "lastmod": lastmod, "sitemap": sitemap_url})
+                if max_urls is not None and len(frontier) >= max_urls:
+                    break
+        except (ET.ParseError, OSError, EOFError) as e:
+            stats["hatali_sitemap"].append({"sitemap": sitemap_url, "hata": str(e)})
+        finally:
+            response.close()
+
+    stats["sinir"] = len(frontier)
+    return frontier, stats
+
+
+# ============================================================================
+# SAYFA ANALİZİ
+# ============================================================================
+class PolitenessGate:
+    """Aynı sunucuya iki istek arasında en az 'delay' saniye bırakır (işçiler arası ortak)."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def analyze_article(doc, page_url):
+    """Makale sayfasından başlık, kelime sayısı, alt başlıklar, görsel ve link bilgisi çıkarır."""
+    title_node = doc.select_one("title")
+    h1 = doc.select_one("h1")
+    desc_node = doc.select_one("meta[name='description']")
+
+    content = None
+    for selector in CONTENT_ROOT_SELECTORS:
+        content = doc.select_one(selector)
+        if content is not None:
+            break
+    words = re.findall(r"\w+", content.text) if content is not None else []
+
+    images = (content or doc).find_all("img")
+    links = harvest_links_from_dom(doc, page_url)
+    groups = classify_links(links, page_url)
+
+    return {
+        "baslik": h1.text if h1 else (title_node.text if title_node else ""),
+        "title": title_node.text if title_node else "",
+        "meta_description": desc_node.get("content", "") if desc_node else None,
+        "kelime_sayisi": len(words),
+        "basliklar": {tag: [h.text for h in doc.find_all(tag)] for tag in ("h1", "h2", "h3")},
+        "gorsel": {"toplam": len(images), "alt_eksik": sum(1 for img in images if not img.get("alt"))},
+        "link": {"toplam": len(links), "ic": len({link["url"] for link in groups["ic"]}),
+                 "dis": len({link["url"] for link in groups["dis"]})},
+    }
+
+
+class SitemapCrawler:
+    """Sitemap'ten çıkan her sayfayı işçi havuzuyla indirip analiz eder."""
+
+    def __init__(self, site, workers=4, delay=1.0, include=None, exclude=None, max_depth=None,
+                 max_urls=None, timeout=15, incremental=True, fresh=False, state_path=None):
+        """
+        incremental=False ise durum dosyası hiç kullanılmaz; fresh=True ise eski durum
+        yok sayılır ama bu koşunun sonuçlarıyla yeniden yazılır.
+        """
+        self.site = site
+        self.workers = workers
+        self.delay = delay
+        self.max_urls = max_urls
+        self.timeout = timeout
+        self.url_filter = UrlFilter(site, include, exclude, max_depth)
+        self.state = None
+        if incremental:
+            self.state = CrawlState(state_path, fresh) if state_path else CrawlState.for_site(site, fresh)
+
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "tr-TR,tr;q=0.9"})
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _fetch_and_analyze(self, entry, gate):
+        record = {"url": entry["url"], "lastmod": entry["lastmod"]}
+        gate.wait(entry["url"])
+        start = time.perf_counter()
+        try:
+            if self.state is None:
+                kind, response, cached = None, self.session.get(entry["url"], timeout=self.timeout), None
+            else:
+                kind, response, cached = conditional_get(self.session, self.state, entry["url"], self.timeout)
+                record["degisim"] = kind
+            record["durum"] = response.status_code
+            record["son_url"] = response.url
+            if cached is not None:
+                record.update(cached)
+            elif response.ok and "html" in response.headers.get("Content-Type", "html"):
+                analysis = analyze_article(parse_html(decode_html(response)), response.url)
+                record.update(analysis)
+                if self.state is not None:
+                    self.state.store(entry["url"], response, analysis, (time.perf_counter() - start) * 1000, kind)
+        except requests.RequestException as e:
+            record["durum"] = None
+            record["hata"] = type(e).__name__
+        record["ms"] = round((time.perf_counter() - start) * 1000)
+        return record
+
+    def crawl(self):
+        """Sitemap'leri okur, sınırı oluşturur, sayfaları analiz eder ve raporu döner."""
+        start = time.perf_counter()
+        robots, sitemaps = load_robots(self.session, self.site, self.timeout)
+        delay = max(self.delay, robots.crawl_delay(USER_AGENT) or 0)
+        print(f"🗺️ Sitemap'ler: {', '.join(sitemaps)} (nezaket beklemesi: {delay} sn)")
+
+        frontier, frontier_stats = build_frontier(self.session, sitemaps, self.url_filter, robots, self.max_urls)
+        print(f"📋 {frontier_stats['okunan']} URL okundu, {frontier_stats['tekrar']} tekrar, "
+              f"{frontier_stats['sinir']} sayfa analiz edilecek ({frontier_stats['sitemap']} sitemap)")
+        frontier_ready = time.perf_counter()
+
+        gate = PolitenessGate(delay)
+        pages = []
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sitemap") as pool:
+            for n, record in enumerate(pool.map(lambda e: self._fetch_and_analyze(e, gate), frontier), 1):
+                pages.append(record)
+                durum = "✅" if record.get("durum") in (200, 304) else "⚠️"
+                atlandi = " ♻️" if record.get("degisim") in ("304", "ayni") else ""
+                print(f"   {durum} [{n}/{len(frontier)}] {record['url']} → "
+                      f"{record.get('kelime_sayisi', '-')} kelime ({record['ms']} ms){atlandi}")
+        wall = time.perf_counter() - start
+        if self.state is not None:
+            self.state.save()
+
+        analyzed = [p for p in pages if "kelime_sayisi" in p]
+        crawl_seconds = time.perf_counter() - frontier_ready
+        return {
+            "site": self.site,
+            "tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "sinir": frontier_stats,
+            "sayfalar": pages,
+            "ozet": {
+                "analiz_edilen": len(analyzed),
+                "hatali": len(pages) - len(analyzed),
+                "toplam_kelime": sum(p["kelime_sayisi"] for p in analyzed),
+                "ortalama_kelime": round(sum(p["kelime_sayisi"] for p in analyzed) / len(analyzed)) if analyzed else 0,
+                "h1_eksik": sum(1 for p in analyzed if not p["basliklar"]["h1"]),
+                "alt_eksik_gorsel": sum(p["gorsel"]["alt_eksik"] for p in analyzed),
+            },
+            "verim": {
+                "isci": self.workers,
+                "gecikme_sn": delay,
+                "toplam_sure_sn": round(wall, 2),
+                "sayfa_dakika": round(len(pages) / crawl_seconds * 60, 2) if crawl_seconds else 0,
+            },
+            "artimli": self.state.report() if self.state is not None else None,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+def crawl_site(site, **kwargs):
+    """Tek seferlik tarama (bkz. SitemapCrawler)."""
+    crawler = SitemapCrawler(site, **kwargs)
+    try:
+        return crawler.crawl()
+    finally:
+        crawler.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sitemap'ten tüm siteyi tarayıp makale sayfalarını analiz eder")
+    parser.add_argument("site", nargs="?", default="https://www.seyyahlab.com", help="Site kök adresi")
+    parser.add_argument("--isci", type=int, default=4, help="Paralel istek sayısı")
+    parser.add_argument("--gecikme", type=float, default=1.0, help="Aynı sunucuya iki istek arası en az (sn)")
+    parser.add_argument("--dahil", action="append", help="URL bu düzenli ifadeye uymalı (tekrarlanabilir)")
+    parser.add_argument("--haric", action="append", help="Bu düzenli ifadeye uyan URL'ler atlanır")
+    parser.add_argument("--derinlik", type=int, help="En fazla yol derinliği (/blog/yazi = 2)")
+    parser.add_argument("--limit", type=int, help="En fazla kaç sayfa analiz edilsin")
+    parser.add_argument("--cikti", default="sitemap_tarama.json", help="JSON çıktı dosyası")
+    parser.add_argument("--sifirdan", action="store_true", help="Önceki tarama durumunu yok say, hepsini analiz et")
+    parser.add_argument("--artimsiz", action="store_true", help="Tarama durumu hiç kullanılmasın / yazılmasın")
+    parser.add_argument("--durum-dosyasi", help="Tarama durumu dosyası (varsayılan: önbellek dizininde site başına)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    report = crawl_site(args.site, workers=args.isci, delay=args.gecikme, include=args.dahil,
+                        exclude=args.haric, max_depth=args.derinlik, max_urls=args.limit,
+                        incremental=not args.artimsiz, fresh=args.sifirdan, state_path=args.durum_dosyasi)
+    with open(args.cikti, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    ozet, verim = report["ozet"], report["verim"]
+    print("=" * 70)
+    print("🗺️ SITEMAP TARAMA ÖZETİ")
+    print("=" * 70)
+    print(f"   Analiz edilen: {ozet['analiz_edilen']} sayfa (hatalı: {ozet['hatali']})")
+    print(f"   Ortalama kelime: {ozet['ortalama_kelime']} | H1 eksik: {ozet['h1_eksik']} | "
+          f"Alt eksik görsel: {ozet['alt_eksik_gorsel']}")
+    print(f"   ⏱ {verim['toplam_sure_sn']} sn, {verim['sayfa_dakika']} sayfa/dk ({verim['isci']} işçi)")
+    artimli = report["artimli"]
+    if artimli:
+        print(f"   ♻️ {artimli['yeniden_islenen']} işlendi ({artimli['yeni']} yeni, {artimli['degisen']} değişen), "
+              f"{artimli['atlanan']} atlandı ({artimli['atlanan_304']} × 304, "
+              f"{artimli['atlanan_ayni_icerik']} × aynı içerik) | kazanılan ~{artimli['kazanilan_sn']} sn")
+    print(f"📁 JSON: {args.cikti}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""
+⚡ STATİK-ÖNCELİKLİ İÇERİK ANALİZ MOTORU
+Senaryo: "Başlık, meta description, JSON-LD, linkler, görsel alt'ları zaten
+          sunucunun gönderdiği HTML'de var. Chrome açmadan indir, ayrıştır, analiz et!
+          Sayfa JavaScript ile çiziliyorsa (boş #root vb.) o zaman Selenium'a geç."
+
+SeyyahLabAnalyzer (asdasdas.py) ve cz.py'deki analizlerin aynısını ham HTML üzerinde
+çalıştırır; selector zincirleri content_rules.py'den ortak gelir.
+
+Kullanım:
+    python static_analyzer.py https://www.seyyahlab.com https://www.seyyahlab.com/blog
+    python static_analyzer.py --dosya urller.txt --cikti toplu_analiz.json
+    python static_analyzer.py --selenium-yok https://...   # Sadece statik
+    python static_analyzer.py --artimli --dosya urller.txt  # Değişmeyen sayfalar yeniden analiz edilmez
+
+    from static_analyzer import StaticAnalyzer
+    engine = StaticAnalyzer()
+    sonuc = engine.analyze("https://www.seyyahlab.com")
+    print(sonuc["mod"], sonuc["istatistikler"])
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+
+import requests
+
+from content_rules import (
+    CARD_SCHEMA, CARD_LIMIT, NAV_SELECTOR, NAV_IGNORED, find_destination, calculate_statistics
+)
+from crawl_state import STATE_DIR, CrawlState, conditional_get
+from extraction_schema import compile_schema
+from html_dom import parse_html
+from link_harvest import harvest_links_from_dom, classify_links
+
+try:
+    import resource  # Sadece Unix; bellek raporu için
+except ImportError:
+    resource = None
+
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# İstemci tarafında çizilen (SPA) sayfaların boş "uygulama kökleri"
+APP_ROOT_SELECTOR = "#root, #app, #__next, #__nuxt, [data-reactroot], app-root"
+MIN_BODY_TEXT = 200  # Bundan kısa gövde metni = içerik JavaScript ile geliyor olabilir
+
+HEADER_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.I)
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)""", re.I)
+
+SEMANTIC_TAGS = ["header", "main", "footer", "nav"]
+OG_TAGS = ["og:title", "og:image", "og:description"]
+
+logger = logging.getLogger(__name__)
+
+
+def decode_html(response):
+    """
+    Gövdeyi doğru karakter kümesiyle metne çevirir.
+
+    requests, Content-Type'ta charset yoksa text/html'i ISO-8859-1 sayar; sadece
+    <meta charset> ile UTF-8 bildiren Türkçe sayfalar bozuk (mojibake) çözülür.
+    Sıra: başlıktaki charset → ilk 4 KB'taki <meta charset> → içerikten tahmin.
+    """
+    match = HEADER_CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    encoding = match.group(1) if match else None
+    if not encoding:
+        meta = META_CHARSET_RE.search(response.content[:4096])
+        encoding = meta.group(1).decode("ascii") if meta else None
+    for candidate in (encoding, response.apparent_encoding, "utf-8"):
+        if not candidate:
+            continue
+        try:
+            return response.content.decode(candidate, errors="replace")
+        except LookupError:  # Bilinmeyen charset adı
+            continue
+
+
+# ============================================================================
+# ANALİZÖRLER (SeyyahLabAnalyzer ve cz.py ile aynı kurallar, DOM ağacı üzerinde)
+# ============================================================================
+def extract_cards(doc, page_url, limit=CARD_LIMIT):
+    """_extract_content_cards ile aynı çıkarım şemasını uygular."""
+    return compile_schema(CARD_SCHEMA).run_on_dom(doc, page_url, limit=limit)["items"]
+
+
+def analyze_navigation(doc):
+    categories = []
+    for item in doc.select(NAV_SELECTOR):
+        text = item.text
+        if text and len(text) > 1 and text not in NAV_IGNORED:
+            categories.append(text)
+    return list(set(categories))
+
+
+def analyze_links(doc, page_url, stats):
+    all_links = harvest_links_from_dom(doc, page_url)
+    groups = classify_links(all_links, page_url)
+
+    stats['toplam_link'] = len(all_links)
+    stats['ic_link'] = len({link['url'] for link in groups['ic']})
+    stats['dis_link'] = len({link['url'] for link in groups['dis']})
+    stats['nofollow_link'] = sum(1 for link in all_links if link['nofollow'])
+    return all_links
+
+
+def analyze_images(doc, stats):
+    images = doc.find_all("img")
+    with_alt = [img for img in images if img.get("alt")]
+
+    stats['toplam_gorsel'] = len(images)
+    stats['alt_tag_var'] = len(with_alt)
+    stats['alt_tag_yok'] = len(images) - len(with_alt)
+
+
+def seo_checks(doc):
+    """cz.py'deki SEO testlerinin aynısı; her test {'gecti': bool, 'detay': ...} döner."""
+    title_node = doc.select_one("title")
+    title = title_node.text if title_node else ""
+
+    desc_node = doc.select_one("meta[name='description']")
+    description = desc_node.get("content", "") if desc_node else None
+
+    missing_semantic = [tag for tag in SEMANTIC_TAGS if not doc.find_all(tag)]
+    schemas = doc.select("script[type='application/ld+json']")
+    missing_og = [og for og in OG_TAGS if doc.select_one(f"meta[property='{og}']") is None]
+
+    images = doc.find_all("img")
+    alt_missing = sum(1 for img in images if not img.get("alt"))
+    lazy_missing = sum(1 for img in images if img.get("loading") != "lazy")
+
+    h1_count = len(doc.find_all("h1"))
+    h2_nodes = doc.find_all("h2")
+
+    return {
+        "title": {"gecti": len(title) > 0, "detay": title},
+        "meta_description": {
+            "gecti": bool(description),
+            "detay": f"{len(description)} karakter" if description is not None else "Etiket bulunamadı"
+        },
+        "semantic_html": {"gecti": not missing_semantic, "detay": missing_semantic},
+        "json_ld": {"gecti": len(schemas) > 0, "detay": len(schemas)},
+        "open_graph": {"gecti": not missing_og, "detay": missing_og},
+        "gorsel_alt": {
+            "gecti": alt_missing == 0,
+            "detay": {"toplam": len(images), "alt_eksik": alt_missing, "lazy_olmayan": lazy_missing}
+        },
+        "h1": {"gecti": h1_count == 1, "detay": h1_count},
+        "h2": {"gecti": True, "detay": {"adet": len(h2_nodes), "ilk_uc": [h.text for h in h2_nodes[:3]]}},
+    }
+
+
+def analyze_document(doc, page_url):
+    """Tek bir ayrıştırılmış sayfa için SeyyahLabAnalyzer + cz.py çıktısını üretir."""
+    stats = {}
+    articles = extract_cards(doc, page_url)
+    destinations = []
+    for article in articles:
+        dest = find_destination(article['baslik'])
+        if dest:
+            destinations.append(dest)
+
+    categories = analyze_navigation(doc)
+    analyze_links(doc, page_url, stats)
+    analyze_images(doc, stats)
+    calculate_statistics(articles, categories, destinations, stats)
+
+    title_node = doc.select_one("title")
+    desc_node = doc.select_one("meta[name='description']")
+
+    tarih = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for idx, article in enumerate(articles, 1):
+        article['sira'] = idx
+        article['tarih'] = tarih
+
+    return {
+        "url": page_url,
+        "baslik": title_node.text if title_node else "",
+        "meta_description": desc_node.get("content", "") if desc_node else "Bulunamadı",
+        "makaleler": articles,
+        "kategoriler": categories,
+        "destinasyonlar": destinations,
+        "istatistikler": stats,
+        "seo": seo_checks(doc),
+    }
+
+
+def detect_client_rendered(doc):
+    """
+    Sayfa içeriği JavaScript ile mi çiziliyor?
+    (True/False, sebep) döner; True ise Selenium'a geçmek gerekir.
+    """
+    app_root = doc.select_one(APP_ROOT_SELECTOR)
+    if app_root is not None and len(app_root.text) < MIN_BODY_TEXT:
+        return True, "boş uygulama kökü (#root/#app/#__next)"
+
+    body = doc.select_one("body")
+    body_text = len(body.text) if body else 0
+    if body_text < MIN_BODY_TEXT:
+        return True, f"gövde metni çok kısa ({body_text} karakter)"
+
+    for noscript in doc.find_all("noscript"):
+        if "javascript" in noscript.raw_text.lower() and body_text < MIN_BODY_TEXT * 5:
+            return True, "noscript uyarısı (JavaScript gerekli)"
+
+    if not doc.find_all("a"):
+        return True, "hiç link yok"
+
+    return False, ""
+
+
+# ============================================================================
+# MOTOR
+# ============================================================================
+class StaticAnalyzer:
+    """HTTP + HTML ayrıştırıcı ile analiz eder; gerekirse tek bir Selenium oturumuna düşer."""
+
+    def __init__(self, fallback=True, timeout=15, state=None):
+        """state: CrawlState verilirse koşullu istek atılır, değişmeyen sayfanın önceki sonucu döner."""
+        self.fallback = fallback
+        self.timeout = timeout
+        self.state = state
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "tr-TR,tr;q=0.9"})
+        self._browser = None  # Sadece ihtiyaç olursa açılır
+        self.timings = []
+
+    def fetch(self, url):
+        """Sayfayı indirir; (html, yönlendirme sonrası URL) döner."""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return decode_html(response), response.url
+
+    def _analyze_with_selenium(self, url):
+        """İstemci tarafında çizilen sayfalar için SeyyahLabAnalyzer'a devreder."""
+        if self._browser is None:
+            from asdasdas import SeyyahLabAnalyzer  # Selenium/pandas sadece gerekirse yüklensin
+            # Statik analizde link durumu kontrol edilmez; Selenium'a geçen sayfa da aynı sonucu versin
+            self._browser = SeyyahLabAnalyzer(preset="extraction", check_links=False)
+
+        bot = self._browser
+        if not bot.analyze_homepage(url):
+            # Zaman aşımı / hata: yarım yüklenmiş sayfa başarılı sonuç gibi dönmesin (ve saklanmasın)
+            raise RuntimeError(f"Selenium analizi tamamlanamadı: {url}")
+        rendered = parse_html(bot.driver.page_source)
+        result = analyze_document(rendered, bot.driver.current_url)
+
+        # Kart/navigasyon/link sonuçlarında canlı DOM analizi esas alınır
+        result["makaleler"] = bot.articles
+        result["kategoriler"] = bot.categories
+        result["istatistikler"] = bot.stats
+        return result
+
+    def analyze(self, url):
+        start = time.perf_counter()
+        if self.state is None:
+            kind, response = None, None
+            html, final_url = self.fetch(url)
+        else:
+            kind, response, cached = conditional_get(self.session, self.state, url, self.timeout)
+            response.raise_for_status()
+            if cached is not None:
+                total = time.perf_counter() - start
+                result = dict(cached, degisim=kind, sure={"indirme_ms": round(total * 1000, 1),
+                                                          "toplam_ms": round(total * 1000, 1)})
+                self.timings.append(("onbellek", total))
+                return result
+            html, final_url = decode_html(response), response.url
+        fetched = time.perf_counter()
+
+        doc = parse_html(html)
+        client_rendered, reason = detect_client_rendered(doc)
+
+        if client_rendered and self.fallback:
+            logger.info(f"{url}: istemci tarafında çiziliyor ({reason}), Selenium'a geçiliyor")
+            result = self._analyze_with_selenium(final_url)
+            result["mod"] = "selenium"
+            result["gecis_sebebi"] = reason
+        else:
+            result = analyze_document(doc, final_url)
+            result["mod"] = "statik"
+            if client_rendered:
+                result["uyari"] = f"Sayfa JavaScript ile çiziliyor olabilir: {reason}"
+
+        total = time.perf_counter() - start
+        if self.state is not None:
+            self.state.store(url, response, dict(result), total * 1000, kind)
+            result["degisim"] = kind
+        result["sure"] = {
+            "indirme_ms": round((fetched - start) * 1000, 1),
+            "toplam_ms": round(total * 1000, 1),
+        }
+        self.timings.append((result["mod"], total))
+        return result
+
+    def analyze_many(self, urls):
+        results = []
+        for url in urls:
+            try:
+                results.append(self.analyze(url))
+            except Exception as e:
+                logger.error(f"{url} analiz edilemedi: {e}")
+                results.append({"url": url, "mod": "hata", "hata": str(e)})
+        return results
+
+    def report(self):
+        by_mode = {}
+        for mode, duration in self.timings:
+            item = by_mode.setdefault(mode, {"sayfa": 0, "toplam_sn": 0.0})
+            item["sayfa"] += 1
+            item["toplam_sn"] += duration
+        for item in by_mode.values():
+            item["ortalama_ms"] = round(item["toplam_sn"] / item["sayfa"] * 1000, 1)
+            item["toplam_sn"] = round(item["toplam_sn"], 3)
+
+        report = {"modlar": by_mode}
+        if resource is not None:
+            # Linux'ta KB, macOS'ta byte cinsinden döner
+            report["tepe_bellek"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return report
+
+    def close(self):
+        self.session.close()
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Statik-öncelikli SeyyahLab içerik/SEO analizi")
+    parser.add_argument("urls", nargs="*", help="Analiz edilecek adresler")
+    parser.add_argument("--dosya", help="Her satırında bir URL olan dosya")
+    parser.add_argument("--cikti", default="statik_analiz.json", help="JSON çıktı dosyası")
+    parser.add_argument("--selenium-yok", action="store_true", help="Selenium'a asla geçme")
+    parser.add_argument("--artimli", action="store_true", help="Koşullu istek at, değişmeyen sayfayı yeniden analiz etme")
+    parser.add_argument("--durum-dosyasi", default=os.path.join(STATE_DIR, "statik_analiz.json"),
+                        help="Artımlı mod için tarama durumu dosyası")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.dosya:
+        with open(args.dosya, encoding="utf-8") as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not urls:
+        urls = ["https://www.seyyahlab.com"]
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    state = CrawlState(args.durum_dosyasi) if args.artimli else None
+    engine = StaticAnalyzer(fallback=not args.selenium_yok, state=state)
+    try:
+        results = engine.analyze_many(urls)
+    finally:
+        engine.close()
+        if state is not None:
+            state.save()
+
+    with open(args.cikti, "w", encoding="utf-8") as f:
+        json.dump({"tarih": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "sayfalar": results},
+                  f, ensure_ascii=False, indent=2)
+
+    print("=" * 70)
+    print("⚡ STATİK ANALİZ ÖZETİ")
+    print("=" * 70)
+    for r in results:
+        stats = r.get("istatistikler", {})
+        print(f"   [{r['mod']:<8}] {r['url'][:50]:<50} | makale: {stats.get('toplam_makale', '-')}"
+              f" | link: {stats.get('toplam_link', '-')}")
+    for mode, item in engine.report()["modlar"].items():
+        print(f"   {mode:<8}: {item['sayfa']} sayfa, ortalama {item['ortalama_ms']} ms")
+    if state is not None:
+        state.print_report()
+    print(f"📁 JSON: {args.cikti}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+"""
+🗂️ SEKME HAVUZU (Tek Tarayıcıda Paralel Sayfa Yükleme)
+Senaryo: "Ürün detay sayfalarını / makaleleri okumak için her işe ayrı Chrome
+          açıyoruz, her biri ~300 MB. Sadece okuma yapıyoruz; tek tarayıcıda K
+          sekme aç, hepsine aynı anda adres ver, hangi sekme önce yüklenirse onu
+          işle ve boşalan sekmeye sıradaki adresi ver!"
+
+Nasıl çalışır:
+    - WebDriver komutları tek sıradan gider ama sayfa yüklemeleri tarayıcıda
+      paralel ilerler. Navigasyon sekmede JavaScript ile başlatılır (komut
+      yüklemeyi beklemeden döner), sonra sekmeler sırayla yoklanır.
+    - Yeni dokümana geçildiği performance.timeOrigin'in değişmesinden anlaşılır
+      (eski sayfanın 'complete' durumu yanlışlıkla hazır sayılmaz).
+    - Sekmeler chromedriver'dan bağımsız ikinci bir DevTools bağlantısıyla
+      (http_archive.CdpConnection) yoklanır; 'eager' / 'normal' stratejide sürücü
+      yüklenmekte olan sekmeye gelen komutu DOMContentLoaded / load'a kadar bekletir,
+      yoklama sürücüden geçseydi yavaş bir sekme diğerlerini de bekletirdi. Sürücüye
+      sadece hazır olan sekmede dönülür. DevTools adresi yoksa (uzak sürücü vb.)
+      yoklama sürücüyle yapılır; o durumda en iyi sonuç 'none' stratejisiyle alınır.
+    - Arka plan sekmelerinin yavaşlatılmaması için driver_factory'nin
+      THROUGHPUT_ARGUMENTS bayrakları (background throttling kapalı) gereklidir.
+
+Bellek: Tarayıcı süreç ağacının toplam PSS'i (/proc, sadece Linux) her sayfa
+bittiğinde örneklenir; raporda "sayfa başına MB" = tepe bellek / sekme sayısı.
+
+Kullanım:
+    from tab_pool import TabExecutor, load_in_tabs
+
+    with TabExecutor(driver, tabs=4) as tabs:                  # mevcut tarayıcıda
+        for sonuc in tabs.imap(urls, lambda d, url: d.title):  # bitiş sırasıyla
+            print(sonuc["url"], sonuc["sonuc"])
+
+    sonuclar, verim = load_in_tabs(urls, lambda d, url: d.title, tabs=6)  # kendi tarayıcısıyla
+
+    python tab_pool.py https://www.seyyahlab.com https://www.seyyahlab.com/blog --sekme 4
+"""
+
+import argparse
+import os
+import time
+from collections import deque
+
+from driver_factory import create_driver, preset_settings
+from http_archive import CdpConnection
+from resource_blocking import apply_load_profile
+
+# Eski dokümanın saatini döner ve navigasyonu komut döndükten sonra başlatır
+NAVIGATE_JS = """
+var url = arguments[0];
+setTimeout(function () { window.location.href = url; }, 0);
+return performance.timeOrigin;
+"""
+
+TAB_STATE_EXPRESSION = "({origin: performance.timeOrigin, state: document.readyState, url: location.href})"
+TAB_STATE_JS = f"return {TAB_STATE_EXPRESSION};"
+
+# Sekme işlenince bellekte eski sayfa kalmasın
+BLANK_JS = "window.stop(); window.location.href = 'about:blank';"
+
+# Sayfa başına örnek işlem: başlık + kelime sayısı (CLI'da kullanılır)
+PAGE_SUMMARY_JS = """
+var text = document.body ? document.body.innerText : '';
+return {baslik: document.title, kelime: (text.match(/\\S+/g) || []).length,
+        link: document.links.length};
+"""
+
+
+def _process_tree(root_pid):
+    """root_pid ve tüm alt süreçlerinin pid listesi (/proc üzerinden)."""
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", encoding="utf-8") as f:
+                # "pid (komut) durum ppid ..." - komut adı boşluk içerebilir
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+
+    pids, stack = [], [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def _process_memory_kb(pid):
+    """Sürecin PSS'i (paylaşılan sayfalar süreçlere bölünür), yoksa RSS (kB)."""
+    for path, key in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1])
+        except OSError:
+            continue
+    return 0
+
+
+def browser_memory_mb(driver):
+    """Chromedriver'ın başlattığı tarayıcı süreçlerinin toplam belleği (MB); ölçülemezse None."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None or not os.path.isdir("/proc"):
+        return None
+    total = sum(_process_memory_kb(pid) for pid in _process_tree(process.pid))
+    return round(total / 1024, 1) if total else None
+
+
+class TabExecutor:
+    """Tek tarayıcıda K sekmeyle eşzamanlı sayfa yükleme ve bitiş sırasıyla işleme."""
+
+    def __init__(self, driver, tabs=4, timeout=30, ready=None, wait_for="interactive", poll=0.05,
+                 load_profile="full"):
+        """
+        Args:
+            driver: Kullanılacak tarayıcı (havuz kendi sekmelerini açar, mevcut sekme bekler)
+            tabs: Aynı anda yüklenen sayfa (= açık sekme) sayısı
+            timeout: Sayfa başına en fazla bekleme (sn); aşılırsa sayfa hata olarak döner
+            ready: Ek hazır koşulu (page_ready koşulları gibi driver alan fonksiyon)
+            wait_for: "interactive" (DOM ayrıştırıldı) veya "complete" (load olayı)
+            poll: Hiçbir sekme hazır değilken yoklamalar arası bekleme (sn)
+            load_profile: "extraction" ise engelleme listesi açılan sekmelere de verilir
+                          (DevTools ayarları sekme başınadır)
+        """
+        if wait_for not in ("interactive", "complete"):
+            raise ValueError(f"Bilinmeyen bekleme durumu: {wait_for} (seçenekler: interactive, complete)")
+        self.driver = driver
+        self.tabs = max(1, tabs)
+        self.timeout = timeout
+        self.ready = ready
+        self.wait_for = wait_for
+        self.poll = poll
+        self.load_profile = load_profile
+
+        self.handles = []
+        self._cdp = None
+        self._sessions = {}  # handle -> DevTools oturumu (yoklama sürücüyü beklemesin)
+        self._home = None
+        self._current = None
+        self.stats = {"sayfa": 0, "hata": 0, "sekme_gecisi": 0, "en_fazla_ucusta": 0,
+                      "yukleme_sn": 0.0, "isleme_sn": 0.0, "sure_sn": 0.0, "bellek_mb": None}
+
+    # ------------------------------------------------------------------
+    # Sekme yönetimi
+    # ------------------------------------------------------------------
+    def open(self):
+        """Eksik sekmeleri açar; tarayıcının mevcut sekmesine (ve sayfasına) dokunulmaz."""
+        if self._home is None:
+            self._home = self._current = self.driver.current_window_handle
+        while len(self.handles) < self.tabs:
+            self.driver.switch_to.new_window("tab")
+            self._current = self.driver.current_window_handle
+            self.handles.append(self._current)
+            apply_load_profile(self.driver, self.load_profile)
+        self._attach()
+        return self
+
+    def _attach(self):
+        """Sekmelere ayrı DevTools bağlantısından bağlanır; olmazsa yoklama sürücüyle yapılır."""
+        try:
+            if self._cdp is None:
+                self._cdp = CdpConnection.for_driver(self.driver, lambda *event: None)
+            for handle in self.handles:
+                if handle not in self._sessions:
+                    # Pencere kimliği hedefin targetId'sidir (eski sürücülerde 'CDwindow-' önekli)
+                    target_id = handle.split("CDwindow-")[-1]
+                    self._sessions[handle] = self._cdp.send(
+                        "Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+        except Exception:
+            self._detach()
+
+    def _detach(self):
+        if self._cdp is not None:
+            self._cdp.close()
+        self._cdp = None
+        self._sessions = {}
+
+    def close(self):
+        """Havuzun açtığı sekmeleri kapatır ve tarayıcının ilk sekmesine döner."""
+        for handle in self.handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        if self._home:
+            self.driver.switch_to.window(self._home)
+        self._detach()
+        self.handles = []
+        self._current = self._home
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _switch(self, handle):
+        if handle != self._current:
+            self.driver.switch_to.window(handle)
+            self._current = handle
+            self.stats["sekme_gecisi"] += 1
+
+    # ------------------------------------------------------------------
+    # Yükleme döngüsü
+    # ------------------------------------------------------------------
+    def _start(self, handle, index, url):
+        self._switch(handle)
+        origin = self.driver.execute_script(NAVIGATE_JS, url)
+        return {"sira": index, "url": url, "sekme": self.handles.index(handle) + 1,
+                "origin": origin, "start": time.perf_counter()}
+
+    def _page_state(self, handle):
+        session_id = self._sessions.get(handle)
+        if session_id is None:
+            self._switch(handle)
+            return self.driver.execute_script(TAB_STATE_JS)
+        reply = self._cdp.send("Runtime.evaluate", {"expression": TAB_STATE_EXPRESSION, "returnByValue": True},
+                               session_id=session_id)
+        return reply["result"]["value"]
+
+    def _stop(self, handle):
+        """Sekmedeki yüklemeyi durdurur (DevTools'ta sürücünün yükleme beklemesine takılmadan)."""
+        session_id = self._sessions.get(handle)
+        if session_id is None:
+            self._switch(handle)
+            self.driver.execute_script("window.stop();")
+        else:
+            self._cdp.send("Page.stopLoading", session_id=session_id)
+
+    def _loaded(self, handle, job):
+        """Sekme yeni dokümana geçti ve istenen duruma geldi mi?"""
+        try:
+            page = self._page_state(handle)
+        except TimeoutError:  # Sayfa ana iş parçacığını meşgul ediyor; sonraki turda tekrar
+            return False
+        if page["origin"] == job["origin"] or page["state"] == "loading":
+            return False
+        # Önceki sayfadan kalan about:blank geçişi henüz yeni adres değildir
+        if page["url"] == "about:blank" and job["url"] != "about:blank":
+            return False
+        if self.wait_for == "complete" and page["state"] != "complete":
+            return False
+        if page["url"].startswith("chrome-error://"):
+            job["hata"] = "Sayfa açılamadı"
+            return True
+        if self.ready:
+            self._switch(handle)
+            try:
+                return bool(self.ready(self.driver))
+            except Exception:
+                return False
+        return True
+
+    def _finish(self, job, process):
+        load_time = time.perf_counter() - job["start"]
+        result = {"sira": job["sira"], "url": job["url"], "sekme": job["sekme"], "sonuc": None,
+                  "hata": job.get("hata"), "yukleme_sn": round(load_time, 2), "isleme_sn": 0.0}
+        if result["hata"] is None and process is not None:
+            process_start = time.perf_counter()
+            try:
+                result["sonuc"] = process(self.driver, job["url"])
+            except Exception as e:
+                result["hata"] = f"{type(e).__name__}: {e}"
+            result["isleme_sn"] = round(time.perf_counter() - process_start, 2)
+
+        self.stats["sayfa"] += 1
+        self.stats["hata"] += result["hata"] is not None
+        self.stats["yukleme_sn"] += load_time
+        self.stats["isleme_sn"] += result["isleme_sn"]
+        memory = browser_memory_mb(self.driver)
+        if memory is not None:
+            self.stats["bellek_mb"] = max(self.stats["bellek_mb"] or 0, memory)
+        return result
+
+    def imap(self, urls, process=None):
+        """
+        URL'leri sekmelere dağıtır; her sayfayı yüklenir yüklenmez işler ve sonucu
+        bitiş sırasıyla üretir. process(driver, url) çağrılırken sürücü o sayfanın
+        sekmesindedir.
+
+        Yields:
+            {"sira", "url", "sekme", "sonuc", "hata", "yukleme_sn", "isleme_sn"}
+        """
+        self.open()
+        pending = deque(enumerate(urls))
+        free = list(reversed(self.handles))
+        inflight = {}
+        start = time.perf_counter()
+
+        try:
+            while pending or inflight:
+                while free and pending:
+                    handle = free.pop()
+                    inflight[handle] = self._start(handle, *pending.popleft())
+                self.stats["en_fazla_ucusta"] = max(self.stats["en_fazla_ucusta"], len(inflight))
+
+                finished = []
+                for handle, job in list(inflight.items()):
+                    timed_out = time.perf_counter() - job["start"] > self.timeout
+                    try:
+                        loaded = self._loaded(handle, job)
+                    except Exception as e:  # Sekme çöktü / sürücünün kendi zaman aşımı
+                        loaded, job["hata"] = True, f"{type(e).__name__}: {e}"
+                    if not loaded:
+                        if not timed_out:
+                            continue
+                        job["hata"] = f"Zaman aşımı ({self.timeout} sn)"
+                        self._stop(handle)
+                    self._switch(handle)
+                    result = self._finish(job, process)
+                    del inflight[handle]
+                    finished.append(result)
+                    # Boşalan sekme diğerleri yoklanmadan yeni işe başlar
+                    if pending:
+                        inflight[handle] = self._start(handle, *pending.popleft())
+                    else:
+                        self.driver.execute_script(BLANK_JS)
+                        free.append(handle)
+
+                yield from finished
+                if not finished:
+                    time.sleep(self.poll)
+        finally:
+            self.stats["sure_sn"] += time.perf_counter() - start
+            for handle in inflight:
+                try:
+                    self._stop(handle)
+                except Exception:
+                    pass
+
+    def run(self, urls, process=None):
+        """imap'in tamamını bekler; sonuçlar giriş sırasıyla döner."""
+        return sorted(self.imap(urls, process), key=lambda r: r["sira"])
+
+    def report(self):
+        """Verim özeti: sayfa/dk, sıralı yüklemeye göre kazanç, sayfa başına bellek."""
+        s = self.stats
+        wall = s["sure_sn"]
+        return {
+            "sekme": self.tabs,
+            "sayfa": s["sayfa"],
+            "hata": s["hata"],
+            "toplam_sure_sn": round(wall, 2),
+            "sirali_tahmini_sn": round(s["yukleme_sn"] + s["isleme_sn"], 2),
+            "sayfa_dakika": round(s["sayfa"] / wall * 60, 2) if wall else 0,
+            "en_fazla_ucusta": s["en_fazla_ucusta"],
+            "sekme_gecisi": s["sekme_gecisi"],
+            "bellek_mb": s["bellek_mb"],
+            "sayfa_basi_mb": round(s["bellek_mb"] / self.tabs, 1) if s["bellek_mb"] else None,
+        }
+
+
+def load_in_tabs(urls, process=None, tabs=4, preset="extraction", **executor_kwargs):
+    """
+    Tek seferlik kullanım: 'none' stratejili tarayıcı açar, URL'leri sekmelerde işler, kapatır.
+
+    Returns:
+        (sonuçlar (giriş sırasıyla), verim raporu)
+    """
+    driver = create_driver(preset, page_load_strategy="none")
+    try:
+        executor_kwargs.setdefault("load_profile", preset_settings(preset)["load_profile"])
+        executor = TabExecutor(driver, tabs=tabs, **executor_kwargs)
+        with executor:
+            results = executor.run(urls, process)
+        return results, executor.report()
+    finally:
+        driver.quit()
+
+
+def print_tab_report(report):
+    print(f"🗂️ {report['sayfa']} sayfa, {report['sekme']} sekme: {report['toplam_sure_sn']} sn "
+          f"(sıralı tahmini {report['sirali_tahmini_sn']} sn) → {report['sayfa_dakika']} sayfa/dk")
+    print(f"   Aynı anda en fazla {report['en_fazla_ucusta']} sayfa yüklendi, "
+          f"{report['sekme_gecisi']} sekme geçişi, {report['hata']} hata")
+    if report["bellek_mb"]:
+        print(f"   🧠 Tarayıcı belleği (tepe): {report['bellek_mb']} MB → sayfa başına {report['sayfa_basi_mb']} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tek tarayıcıda çok sekmeli paralel sayfa yükleme")
+    parser.add_argument("urls", nargs="*", help="Açılacak adresler")
+    parser.add_argument("--dosya", help="Her satırında bir URL olan dosya")
+    parser.add_argument("--sekme", type=int, default=4, help="Aynı anda açık sekme sayısı")
+    parser.add_argument("--on-ayar", default="extraction", help="driver_factory ön ayarı")
+    parser.add_argument("--zaman-asimi", type=int, default=30, help="Sayfa başına zaman aşımı (sn)")
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.dosya:
+        with open(args.dosya, encoding="utf-8") as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not urls:
+        parser.error("En az bir URL verin")
+
+    results, report = load_in_tabs(urls, lambda d, url: d.execute_script(PAGE_SUMMARY_JS),
+                                   tabs=args.sekme, preset=args.on_ayar, timeout=args.zaman_asimi)
+    for r in results:
+        if r["hata"]:
+            print(f"   ❌ [sekme {r['sekme']}] {r['url']} → {r['hata']}")
+        else:
+            print(f"   ✅ [sekme {r['sekme']}] {r['url']} → {r['sonuc']['baslik'][:50]} "
+                  f"({r['sonuc']['kelime']} kelime, {r['yukleme_sn']} sn)")
+    print_tab_report(report)
+
+
+if __name__ == "__main__":
+    main()
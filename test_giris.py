@@ -2,13 +2,13 @@ import time
 import json
 import logging
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
+from lazy_scroll import scroll_until_settled
+from network_idle import wait_for_network_idle
+from link_harvest import harvest_links, classify_links
 
 # --- LOGLAMA AYARLARI ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,19 +26,10 @@ class SeyyahLabBot:
             "gorseller": []
         }
 
-        # Tarayıcı Ayarları
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-        # Anti-tespit için User-Agent
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
+        # Tarayıcı Ayarları (driver_factory ön ayarı; ağ olayları ve user-agent dahil)
         try:
             logging.info("Sürücü yükleniyor ve tarayıcı başlatılıyor...")
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+            self.driver = create_driver("fast-headless" if headless else "visual")
             self.wait = WebDriverWait(self.driver, 15)
         except Exception as e:
             logging.error(f"Sürücü başlatılamadı: {e}")
@@ -49,22 +40,16 @@ class SeyyahLabBot:
         self.driver.get(self.base_url)
         try:
             self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(2)
+            wait_for_network_idle(self.driver, replaces=2)
         except Exception as e:
             logging.error(f"Sayfa yüklenirken zaman aşımı: {e}")
 
     def asagi_kaydir(self):
         logging.info("Sayfa aşağı kaydırılıyor (Lazy loading tetikleniyor)...")
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        while True:
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
+        sonuc = scroll_until_settled(self.driver, budget=30)
+        logging.info(f"Kaydırma bitti: {sonuc['elapsed_ms']} ms, {sonuc['steps']} adım, "
+                     f"{sonuc['added_nodes']} yeni düğüm" + (" (süre doldu)" if sonuc['timed_out'] else ""))
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
 
     def seo_analizi_yap(self):
         logging.info("SEO Analizi yapılıyor...")
@@ -102,19 +87,10 @@ class SeyyahLabBot:
         """
         logging.info("Link ve Görsel analizi yapılıyor (JavaScript Destekli)...")
 
-        # --- LİNKLER ---
-        elements = self.driver.find_elements(By.TAG_NAME, "a")
-        self.data["linkler"]["ic_linkler"] = []
-        self.data["linkler"]["dis_linkler"] = []
-
-        for elem in elements:
-            href = elem.get_attribute("href")
-            text = elem.text.strip()
-            if href:
-                if self.base_url in href:
-                    self.data["linkler"]["ic_linkler"].append({"text": text, "url": href})
-                else:
-                    self.data["linkler"]["dis_linkler"].append({"text": text, "url": href})
+        # --- LİNKLER (tek JavaScript çağrısı) ---
+        groups = classify_links(harvest_links(self.driver), self.base_url)
+        self.data["linkler"]["ic_linkler"] = [{"text": l["text"], "url": l["url"]} for l in groups["ic"]]
+        self.data["linkler"]["dis_linkler"] = [{"text": l["text"], "url": l["url"]} for l in groups["dis"]]
 
         self.data["linkler"]["toplam"] = len(self.data["linkler"]["ic_linkler"]) + len(
             self.data["linkler"]["dis_linkler"])
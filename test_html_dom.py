@@ -0,0 +1,184 @@
+"""
+🌳 html_dom birim testleri (tarayıcı gerektirmez)
+
+Çalıştırma:
+    python -m unittest test_html_dom -v
+"""
+import unittest
+
+from html_dom import parse_html
+
+PAGE = """
+<html><head><title>Başlık</title><script>var x = "gizli";</script></head>
+<body>
+  <nav id="menu"><ul>
+    <li class="item active"><a href="/blog" rel="nofollow">Blog</a>
+    <li class="item"><a href="/hakkinda" data-x="a,b">Hakkında</a>
+    <li class="item disabled"><a href="https://example.com/dis" lang="tr-TR">Dış</a>
+  </ul></nav>
+  <article class="post-card">
+    <h2>Birinci</h2>
+    <p>İlk paragraf
+    <p>İkinci   paragraf
+    <div class="meta">Etiket</div>
+  </article>
+  <table><tr><td>a<td>b<tr><td>c</table>
+</body></html>
+"""
+
+
+def tags(nodes):
+    return [n.tag for n in nodes]
+
+
+def texts(nodes):
+    return [n.text for n in nodes]
+
+
+class TestCombinators(unittest.TestCase):
+    def setUp(self):
+        self.doc = parse_html(PAGE)
+
+    def test_descendant(self):
+        self.assertEqual(texts(self.doc.select("nav a")), ["Blog", "Hakkında", "Dış"])
+
+    def test_child(self):
+        self.assertEqual(len(self.doc.select("ul > li")), 3)
+        self.assertEqual(self.doc.select("nav > li"), [])
+        self.assertEqual(tags(self.doc.select("article > *")), ["h2", "p", "p", "div"])
+
+    def test_adjacent_sibling(self):
+        self.assertEqual(texts(self.doc.select("h2 + p")), ["İlk paragraf"])
+        self.assertEqual(texts(self.doc.select("li.active + li")), ["Hakkında"])
+        self.assertIsNone(self.doc.select_one("h2 + div"))
+
+    def test_general_sibling(self):
+        self.assertEqual(texts(self.doc.select("h2 ~ p")), ["İlk paragraf", "İkinci paragraf"])
+        self.assertEqual(texts(self.doc.select("li.active ~ li")), ["Hakkında", "Dış"])
+        self.assertEqual(self.doc.select("div ~ h2"), [])
+
+    def test_top_level_element_has_no_document_parent_match(self):
+        self.assertEqual(self.doc.select("* > html"), [])
+
+
+class TestAttributes(unittest.TestCase):
+    def setUp(self):
+        self.doc = parse_html(PAGE)
+
+    def test_operators(self):
+        self.assertEqual(texts(self.doc.select("a[rel]")), ["Blog"])
+        self.assertEqual(texts(self.doc.select("a[href='/blog']")), ["Blog"])
+        self.assertEqual(texts(self.doc.select("a[href^=http]")), ["Dış"])
+        self.assertEqual(texts(self.doc.select("a[href$='kinda']")), ["Hakkında"])
+        self.assertEqual(texts(self.doc.select('a[href*="example"]')), ["Dış"])
+        self.assertEqual(len(self.doc.select("li[class~=item]")), 3)
+        self.assertEqual(self.doc.select("li[class~=ite]"), [])
+        self.assertEqual(texts(self.doc.select("a[lang|=tr]")), ["Dış"])
+
+    def test_empty_value_never_matches_substring_operators(self):
+        for op in ("*=", "^=", "$="):
+            self.assertEqual(self.doc.select(f"a[href{op}'']"), [], op)
+
+    def test_case_insensitive_flag(self):
+        self.assertEqual(self.doc.select("a[href='/BLOG']"), [])
+        self.assertEqual(texts(self.doc.select("a[href='/BLOG' i]")), ["Blog"])
+
+    def test_quoted_comma_does_not_split_list(self):
+        self.assertEqual(texts(self.doc.select("a[data-x='a,b']")), ["Hakkında"])
+        self.assertEqual(texts(self.doc.select('a[data-x="a,b"], h2')), ["Hakkında", "Birinci"])
+
+
+class TestSelectorLists(unittest.TestCase):
+    def setUp(self):
+        self.doc = parse_html(PAGE)
+
+    def test_results_in_document_order_without_duplicates(self):
+        self.assertEqual(tags(self.doc.select("div, h2, article")), ["article", "h2", "div"])
+        self.assertEqual(len(self.doc.select("li, li.item")), 3)
+
+    def test_select_one_returns_first_in_document_order(self):
+        self.assertEqual(self.doc.select_one("div.meta, h2").tag, "h2")
+        self.assertIsNone(self.doc.select_one("section"))
+
+    def test_scoped_to_node(self):
+        article = self.doc.select_one("article")
+        self.assertEqual(article.select("a"), [])
+        self.assertEqual(texts(article.select("p")), ["İlk paragraf", "İkinci paragraf"])
+
+
+class TestNot(unittest.TestCase):
+    def setUp(self):
+        self.doc = parse_html(PAGE)
+
+    def test_not(self):
+        self.assertEqual(texts(self.doc.select("li:not(.active)")), ["Hakkında", "Dış"])
+        self.assertEqual(texts(self.doc.select("li:not(.active, .disabled)")), ["Hakkında"])
+        self.assertEqual(texts(self.doc.select("a:not([href^='/'])")), ["Dış"])
+
+
+class TestImplicitClose(unittest.TestCase):
+    def setUp(self):
+        self.doc = parse_html(PAGE)
+
+    def test_li_closed_by_next_li(self):
+        items = self.doc.select("ul > li")
+        self.assertEqual([len(li.select("a")) for li in items], [1, 1, 1])
+
+    def test_p_closed_by_next_p_and_block(self):
+        paragraphs = self.doc.select("article > p")
+        self.assertEqual(len(paragraphs), 2)
+        self.assertEqual(paragraphs[1].select("div"), [])
+        self.assertEqual(self.doc.select_one("div.meta").parent.tag, "article")
+
+    def test_tr_and_td(self):
+        rows = self.doc.select("tr")
+        self.assertEqual([texts(r.select("td")) for r in rows], [["a", "b"], ["c"]])
+
+    def test_self_closing_slash_ignored_on_non_void_tags(self):
+        doc = parse_html("<div><span/><p>iç</p></span><br/><img src='x'/><em>y</em></div>")
+        self.assertEqual(texts(doc.select("span p")), ["iç"])
+        self.assertEqual(tags(doc.select("div > *")), ["span", "br", "img", "em"])
+        self.assertEqual(doc.select_one("img").children, [])
+
+    def test_self_closing_tags_still_close_implicitly(self):
+        doc = parse_html("<p>bir<div/>iki</div><ul><li/>a<li/>b</ul>")
+        self.assertEqual(doc.select_one("div").parent.tag, "#document")
+        self.assertEqual(texts(doc.select("li")), ["a", "b"])
+
+    def test_unmatched_end_tag_ignored(self):
+        doc = parse_html("<div><span>x</b></span><em>y</em></div>")
+        self.assertEqual(tags(doc.select("div > *")), ["span", "em"])
+
+
+class TestText(unittest.TestCase):
+    def test_whitespace_collapsed(self):
+        doc = parse_html("<div>  Merhaba\n\t  dünya  </div>")
+        self.assertEqual(doc.select_one("div").text, "Merhaba dünya")
+
+    def test_block_children_separated(self):
+        doc = parse_html("<div><p>bir</p><p>iki</p><span>üç</span><b>dört</b></div>")
+        self.assertEqual(doc.select_one("div").text, "bir iki üçdört")
+
+    def test_script_and_style_excluded(self):
+        doc = parse_html(PAGE)
+        self.assertNotIn("gizli", doc.text)
+        self.assertIn("gizli", doc.select_one("script").raw_text)
+        doc = parse_html("<p>a<style>.x{}</style>b</p>")
+        self.assertEqual(doc.select_one("p").text, "ab")
+
+    def test_entities_decoded(self):
+        self.assertEqual(parse_html("<p>a &amp; b&nbsp;c</p>").select_one("p").text, "a & b c")
+
+
+class TestUnsupported(unittest.TestCase):
+    def test_pseudo_classes_raise(self):
+        doc = parse_html(PAGE)
+        for selector in ("a:hover", "li:first-child", "p::before", "li:nth-child(2)"):
+            with self.assertRaises(ValueError, msg=selector):
+                doc.select(selector)
+        with self.assertRaises(ValueError):
+            doc.select_one("a:visited")
+
+
+if __name__ == "__main__":
+    unittest.main()
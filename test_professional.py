@@ -1,16 +1,15 @@
 import unittest
 import logging
 import datetime
-import time
+import functools
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver, preset_settings
+from browser_pool import BrowserPool
+from network_idle import wait_for_network_idle
 
 
 # =============================================================================
@@ -19,7 +18,12 @@ from webdriver_manager.chrome import ChromeDriverManager
 class Config:
     BASE_URL = "https://www.seyyahlab.com"
     BROWSER_HEADLESS = False
+    BROWSER_PRESET = "fast-headless" if BROWSER_HEADLESS else "visual"  # driver_factory ön ayarı
     TIMEOUT = 15
+    POOL_SIZE = int(os.environ.get("POOL_SIZE", 1))
+    POOL_MAX_USES = int(os.environ.get("POOL_MAX_USES", 10))  # 1 = her test yeni tarayıcı (eski davranış)
+    POOL_ISOLATION = os.environ.get("POOL_ISOLATION", "context")  # "reset": çerez/depolama temizliği
+    SCREENSHOT_DIR = os.environ.get("TEST_SCREENSHOT_DIR", ".")  # Paralel koşucu her parçaya ayrı klasör verir
 
 
 logging.basicConfig(
@@ -61,14 +65,20 @@ class BasePage:
     def get_title(self):
         return self.driver.title
 
+    def wait_for_network_idle(self, quiet=0.5, replaces=None):
+        """Sabit sleep yerine: uçuştaki ağ istekleri bitene kadar bekler."""
+        return wait_for_network_idle(self.driver, quiet=quiet, timeout=Config.TIMEOUT, replaces=replaces)
+
     def get_current_url(self):
         return self.driver.current_url
 
     def take_screenshot(self, test_name):
         timestamp = datetime.datetime.now().strftime("%H%M%S")
-        filename = f"FAIL_{test_name}_{timestamp}.png"
+        os.makedirs(Config.SCREENSHOT_DIR, exist_ok=True)
+        filename = os.path.join(Config.SCREENSHOT_DIR, f"FAIL_{test_name}_{timestamp}.png")
         self.driver.save_screenshot(filename)
         logger.error(f"HATA! Ekran görüntüsü: {filename}")
+        return filename
 
 
 # =============================================================================
@@ -88,32 +98,64 @@ class HomePage(BasePage):
 
 
 # =============================================================================
-# 4. TEST SENARYOLARI
+# 4. TARAYICI HAVUZU
+# =============================================================================
+def tarayici_olustur():
+    return create_driver(Config.BROWSER_PRESET)
+
+
+POOL = BrowserPool(tarayici_olustur, size=Config.POOL_SIZE, max_uses=Config.POOL_MAX_USES,
+                   isolation=Config.POOL_ISOLATION,
+                   load_profile=preset_settings(Config.BROWSER_PRESET)["load_profile"])
+
+
+def tearDownModule():
+    POOL.close()
+    POOL.print_report()
+
+
+# =============================================================================
+# 5. TEST SENARYOLARI
 # =============================================================================
 class TestSeyyahLab(unittest.TestCase):
 
+    def run(self, result=None):
+        # Test gövdesi hata verirse ekran görüntüsü, tarayıcı havuza dönmeden (tearDown'dan önce)
+        # alınır; paralel koşucu rapora bu teste bağlı yazar. unittest'in iç sonuç nesnesine bakılmaz.
+        name = self._testMethodName
+        own = name in self.__dict__  # pytest test metodunu örneğe kendisi yazıp sonra siler
+        method = getattr(self, name)
+
+        @functools.wraps(method)
+        def capture_failure():
+            try:
+                return method()
+            except unittest.SkipTest:
+                raise
+            except BaseException:
+                try:
+                    self.screenshot = self.home_page.take_screenshot(name)
+                except Exception as e:
+                    logger.warning(f"Ekran görüntüsü alınamadı: {e}")
+                raise
+
+        setattr(self, name, capture_failure)
+        try:
+            return super().run(result)
+        finally:
+            if own:
+                setattr(self, name, method)
+            else:
+                delattr(self, name)
+
     def setUp(self):
         logger.info(f"--- TEST: {self._testMethodName} ---")
-        options = Options()
-        if Config.BROWSER_HEADLESS:
-            options.add_argument("--headless")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-
-        # HATA VEREN SATIR BURASIYDI, DÜZELTİLDİ:
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
+        self.driver = POOL.acquire()
+        self.addCleanup(self._release_driver)  # Hata ne olursa olsun tarayıcı havuza döner
         self.home_page = HomePage(self.driver)
 
-    def tearDown(self):
-        try:
-            if hasattr(self, '_outcome'):
-                result = self._outcome.result
-                if result.errors or result.failures:
-                    self.home_page.take_screenshot(self._testMethodName)
-        except:
-            pass
-        self.driver.quit()
+    def _release_driver(self):
+        POOL.release(self.driver)
         logger.info("--- BİTTİ ---\n")
 
     def test_01_homepage_title(self):
@@ -125,13 +167,13 @@ class TestSeyyahLab(unittest.TestCase):
 
     def test_02_blog_navigation(self):
         self.home_page.open_url(Config.BASE_URL)
-        time.sleep(2)  # Sayfa tam otursun
+        self.home_page.wait_for_network_idle(replaces=2)  # Sayfa tam otursun
 
         try:
             self.home_page.go_to_blog()
 
             # Yönlendirme için bekle
-            time.sleep(3)
+            self.home_page.wait_for_network_idle(replaces=3)
 
             current_url = self.home_page.get_current_url()
             logger.info(f"Şu anki URL: {current_url}")
@@ -1,18 +1,11 @@
 # Dosya Adı: test_mobil.py
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_factory import create_driver
 
 
 def mobil_test():
-    mobile_emulation = {"deviceName": "iPhone 12 Pro"}
-
-    chrome_options = Options()
-    chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    # "mobile" ön ayarı iPhone 12 Pro emülasyonu; ekranı görmek için headless kapalı
+    driver = create_driver("mobile", headless=False)
 
     print("📱 iPhone 12 Pro modunda site açılıyor...")
     driver.get("https://www.seyyahlab.com")